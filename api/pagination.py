@@ -0,0 +1,248 @@
+"""
+API Pagination
+
+Page numbers stay the default. A request with ?pagination=cursor (or a
+cursor) is paginated by keyset instead: each page is read with a WHERE on
+the ordering columns of the last row seen, so deep pages cost the same as
+the first one and no COUNT(*) runs.
+"""
+import base64
+import binascii
+import datetime
+import decimal
+import json
+import uuid
+from collections import OrderedDict
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured, ValidationError
+from django.db import connections
+from django.db.models import Model, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _encode_value(value):
+    # Full precision: DjangoJSONEncoder truncates datetimes to milliseconds
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f'Cannot use {type(value).__name__} values in a cursor')
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination on the ordering of the queryset.
+
+    The ordering (from OrderingFilter, the queryset or Meta.ordering) gets the
+    primary key as tie-breaker, in the direction of its last column, so that a
+    composite index on the same columns serves every page.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    invalid_cursor_message = 'Curseur invalide.'
+
+    def get_page_size(self, request):
+        page_size = api_settings.PAGE_SIZE
+        try:
+            requested = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return page_size
+        return min(requested, self.max_page_size) if requested > 0 else page_size
+
+    def get_ordering(self, queryset):
+        """
+        Return the ordering as [(field, descending)], ending with the primary key.
+        """
+        ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+        pk_names = {'pk', queryset.model._meta.pk.name, queryset.model._meta.pk.attname}
+        terms = []
+        for item in ordering:
+            if not isinstance(item, str) or item == '?':
+                raise ImproperlyConfigured(
+                    f'Keyset pagination needs an ordering on field names, got {item!r}'
+                )
+            field = item.lstrip('-')
+            terms.append((field, item.startswith('-')))
+            if field in pk_names:
+                return terms
+        terms.append(('pk', terms[-1][1] if terms else False))
+        return terms
+
+    @staticmethod
+    def get_position(obj, ordering):
+        values = []
+        for field, _ in ordering:
+            value = obj
+            for part in field.split('__'):
+                value = getattr(value, part, None)
+                if value is None:
+                    break
+            if isinstance(value, Model):
+                raise ImproperlyConfigured(
+                    f'Keyset pagination cannot order on the relation {field!r}'
+                )
+            values.append(value)
+        return values
+
+    @staticmethod
+    def clean_position(model, ordering, position):
+        """
+        Convert the values of a decoded cursor with their model fields.
+
+        Raises:
+            ValidationError, ValueError, TypeError: a value does not fit its field
+        """
+        values = []
+        for (field, _), value in zip(ordering, position):
+            model_field = None
+            opts = model._meta
+            try:
+                for part in field.split('__'):
+                    model_field = opts.pk if part == 'pk' else opts.get_field(part)
+                    if model_field.is_relation:
+                        opts = model_field.related_model._meta
+            except FieldDoesNotExist:
+                # Annotation: compared as is
+                model_field = None
+            if value is not None and model_field is not None:
+                if model_field.is_relation:
+                    model_field = model_field.target_field
+                value = model_field.to_python(value)
+            values.append(value)
+        return values
+
+    @staticmethod
+    def keyset_filter(ordering, position, reverse, nulls_largest):
+        """
+        Build the WHERE selecting the rows after position, in the page direction.
+
+        Equivalent to a row comparison (a, b, pk) > (va, vb, vpk) with
+        per-column directions, NULLs placed where the database sorts them.
+        """
+        after = Q(pk__in=[])
+        equal = Q()
+        for (field, descending), value in zip(ordering, position):
+            descending = descending != reverse
+            # Ascending scans meet the NULLs last when the database sorts them largest
+            nulls_after = nulls_largest != descending
+            if value is None:
+                # Past the NULLs come the values, unless the NULLs come last
+                strictly_after = None if nulls_after else Q(**{f'{field}__isnull': False})
+                same = Q(**{f'{field}__isnull': True})
+            else:
+                strictly_after = Q(**{f'{field}__{"lt" if descending else "gt"}': value})
+                if nulls_after:
+                    strictly_after |= Q(**{f'{field}__isnull': True})
+                same = Q(**{field: value})
+            if strictly_after is not None:
+                after |= equal & strictly_after
+            equal &= same
+        return after
+
+    def encode_cursor(self, position, reverse):
+        payload = json.dumps({'v': position, 'r': reverse}, default=_encode_value)
+        token = base64.urlsafe_b64encode(payload.encode()).decode()
+        url = replace_query_param(self.base_url, self.cursor_query_param, token)
+        return remove_query_param(url, 'page')
+
+    def decode_cursor(self, request, ordering):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(token.encode()).decode())
+            position, reverse = cursor['v'], bool(cursor['r'])
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+        ordering = self.get_ordering(queryset)
+        cursor = self.decode_cursor(request, ordering)
+        reverse = cursor[1] if cursor else False
+
+        if cursor:
+            nulls_largest = connections[queryset.db].features.nulls_order_largest
+            try:
+                position = self.clean_position(queryset.model, ordering, cursor[0])
+                queryset = queryset.filter(self.keyset_filter(ordering, position, reverse, nulls_largest))
+            except (ValidationError, ValueError, TypeError):
+                # Tampered cursor
+                raise NotFound(self.invalid_cursor_message)
+        order_by = [('-' if descending != reverse else '') + field for field, descending in ordering]
+        rows = list(queryset.order_by(*order_by)[:page_size + 1])
+
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+
+        self.next_url = self.previous_url = None
+        if rows and self.has_next:
+            self.next_url = self.encode_cursor(self.get_position(rows[-1], ordering), False)
+        if rows and self.has_previous:
+            self.previous_url = self.encode_cursor(self.get_position(rows[0], ordering), True)
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.next_url),
+            ('previous', self.previous_url),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+class SwitchablePagination(PageNumberPagination):
+    """
+    Page number pagination, switched to KeysetPagination per request.
+
+    Usage:
+        GET /api/recommendations/?pagination=cursor
+        then follow the 'next' links (they carry ?cursor=...)
+    """
+
+    mode_query_param = 'pagination'
+    keyset_class = KeysetPagination
+
+    def wants_keyset(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == 'cursor'
+            or self.keyset_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.wants_keyset(request):
+            self.keyset = self.keyset_class()
+            self.display_page_controls = False
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -9,17 +9,15 @@ class CompanyProfileSerializer(serializers.ModelSerializer):
     """
     Serializer for CompanyProfile (partner companies).
     """
-    company_name = serializers.CharField(source='user.company_name', read_only=True)
     email = serializers.EmailField(source='user.email', read_only=True)
-    city = serializers.CharField(source='user.city', read_only=True)
     is_verified = serializers.BooleanField(source='user.is_verified', read_only=True)
     
     class Meta:
         model = CompanyProfile
         fields = [
             'id', 'company_name', 'email', 'city', 'sector',
-            'partnership_type', 'is_partner', 'partner_since',
-            'total_interns_hosted', 'active_internships',
+            'is_partner', 'partner_since',
+            'total_interns_hosted',
             'average_rating', 'is_verified'
         ]
         read_only_fields = ['id']
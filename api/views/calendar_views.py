@@ -14,6 +14,7 @@ from api.serializers.calendar_serializers import (
     InternshipCalendarSerializer,
     CalendarListSerializer
 )
+from api.pagination import SwitchablePagination
 from api.permissions import IsSchool
 from core.services.calendar_service import InternshipCalendarService
 
@@ -66,6 +67,7 @@ class PublicCalendarsView(generics.ListAPIView):
     """
     serializer_class = CalendarListSerializer
     permission_classes = [AllowAny]
+    pagination_class = SwitchablePagination
     filter_backends = [DjangoFilterBackend, OrderingFilter, SearchFilter]
     filterset_fields = ['program_level', 'school']
     ordering_fields = ['start_date', 'published_at', 'number_of_students']
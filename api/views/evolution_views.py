@@ -66,7 +66,7 @@ class TrackedStudentsView(generics.ListAPIView):
         """Get students tracked by the authenticated company."""
         return StudentEvolutionTracking.objects.filter(
             company=self.request.user
-        ).select_related('student')
+        ).select_related('student').prefetch_related('events')
 
 
 class UpdateEvolutionView(APIView):
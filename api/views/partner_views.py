@@ -1,6 +1,9 @@
 """
 Partner Page API Views
 """
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 from rest_framework import generics
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
@@ -13,21 +16,38 @@ from api.serializers.partner_serializers import (
     CompanyProfileSerializer,
     PartnerStatsSerializer
 )
+from api.pagination import SwitchablePagination
+from core.response_cache import PARTNERS_TAG, CachedResponseMixin
 from core.services.partner_service import PartnerPageService
 
 
-class PartnerCompaniesView(generics.ListAPIView):
+# Conditional GET on the directory snapshot: clients and CDNs may store the
+# response but must revalidate it, which costs a cache read and a 304
+directory_conditional = [
+    cache_control(public=True, max_age=0, must_revalidate=True),
+    condition(
+        etag_func=PartnerPageService.get_directory_etag,
+        last_modified_func=PartnerPageService.get_directory_last_modified,
+    ),
+]
+
+
+class PartnerCompaniesView(CachedResponseMixin, generics.ListAPIView):
     """
     List all partner companies.
     Supports filtering by sector, city, and search.
+    Anonymous responses are cached (content negotiated on Accept).
     """
+    response_cache_tags = (PARTNERS_TAG,)
+    response_cache_vary = ('Accept',)
     serializer_class = CompanyProfileSerializer
     permission_classes = [AllowAny]
+    pagination_class = SwitchablePagination
     filter_backends = [DjangoFilterBackend, OrderingFilter, SearchFilter]
-    filterset_fields = ['sector', 'partnership_type']
+    filterset_fields = ['sector', 'city']
     ordering_fields = ['partner_since', 'total_interns_hosted', 'average_rating']
     ordering = ['-partner_since']
-    search_fields = ['user__company_name', 'user__city', 'sector']
+    search_fields = ['company_name', 'city', 'sector']
     
     def get_queryset(self):
         """Get all partner companies."""
@@ -49,19 +69,22 @@ class PartnerCompaniesView(generics.ListAPIView):
         return service.get_partner_companies(filters=filters if filters else None)
 
 
+@method_decorator(directory_conditional, name='get')
 class PartnerSectorsView(APIView):
     """
-    List all available sectors.
+    List all available sectors and cities.
     """
     permission_classes = [AllowAny]
     
     def get(self, request):
-        """Get list of sectors."""
+        """Get list of sectors and cities."""
         service = PartnerPageService()
         sectors = service.get_sectors_list()
-        return Response({'sectors': sectors})
+        cities = service.get_cities_list()
+        return Response({'sectors': sectors, 'cities': cities})
 
 
+@method_decorator(directory_conditional, name='get')
 class PartnerStatsView(APIView):
     """
     Get partner page statistics.
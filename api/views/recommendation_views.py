@@ -12,6 +12,7 @@ from api.serializers.recommendation_serializers import (
     RecommendationSerializer,
     StudentRecommendationListSerializer
 )
+from api.pagination import SwitchablePagination
 from api.permissions import IsCompany
 from core.services.recommendation_service import RecommendationService
 
@@ -55,6 +56,7 @@ class RecommendedStudentsView(generics.ListAPIView):
     """
     serializer_class = RecommendationSerializer
     permission_classes = [AllowAny]
+    pagination_class = SwitchablePagination
     filter_backends = [DjangoFilterBackend, OrderingFilter, SearchFilter]
     filterset_fields = ['rating', 'is_featured']
     ordering_fields = ['rating', 'created_at']
@@ -14,6 +14,7 @@ from api.serializers.verification_serializers import (
     SubmitVerificationSerializer,
     VerifyDocumentSerializer
 )
+from api.pagination import SwitchablePagination
 from core.services.verification_service import VerificationService
 
 
@@ -84,6 +85,7 @@ class PendingVerificationsView(generics.ListAPIView):
     """
     serializer_class = VerificationDocumentSerializer
     permission_classes = [IsAdminUser]
+    pagination_class = SwitchablePagination
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ['document_type', 'user__user_type']
     ordering_fields = ['submitted_at']
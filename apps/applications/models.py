@@ -40,6 +40,10 @@ class Application(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Candidature'
         verbose_name_plural = 'Candidatures'
+        indexes = [
+            # Applications of a company's internships by status, newest first
+            models.Index(fields=['internship', 'status', '-created_at'], name='application_status_idx'),
+        ]
 
     def __str__(self):
         return f"{self.student.username} - {self.internship.title}"
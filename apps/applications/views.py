@@ -1,3 +1,6 @@
+import time
+
+from django.db import transaction
 from django.views.generic.edit import CreateView
 from django.views import View
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -36,7 +39,7 @@ class ApplicationCreateView(LoginRequiredMixin, CreateView):
         
         # Create notification for company
         from apps.notifications.models import Notification
-        from apps.notifications.utils import send_application_received_email
+        from core.tasks.email_tasks import send_application_received_email
         
         Notification.create_notification(
             recipient=internship.company,
@@ -46,8 +49,11 @@ class ApplicationCreateView(LoginRequiredMixin, CreateView):
             link=f"/dashboard/"
         )
         
-        # Send email notification
-        send_application_received_email(self.object)
+        # Send email notification once the application row is committed
+        application_id = self.object.pk
+        transaction.on_commit(
+            lambda: send_application_received_email.delay(application_id, enqueued_at=time.time())
+        )
         
         messages.success(self.request, "Votre candidature a été envoyée avec succès!")
         return response
@@ -97,7 +103,7 @@ class ApplicationUpdateStatusView(LoginRequiredMixin, View):
         
         # Create notification for student
         from apps.notifications.models import Notification
-        from apps.notifications.utils import send_application_response_email
+        from core.tasks.email_tasks import send_application_response_email
         
         Notification.create_notification(
             recipient=application.student,
@@ -107,8 +113,11 @@ class ApplicationUpdateStatusView(LoginRequiredMixin, View):
             link=f"/dashboard/"
         )
         
-        # Send email notification
-        send_application_response_email(application, accepted=(action == 'accept'))
+        # Send email notification once the status change is committed
+        accepted = action == 'accept'
+        transaction.on_commit(
+            lambda: send_application_response_email.delay(application.pk, accepted, enqueued_at=time.time())
+        )
         
         return JsonResponse({
             'success': True,
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CalendarsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.calendars'
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import apps.calendars.signals
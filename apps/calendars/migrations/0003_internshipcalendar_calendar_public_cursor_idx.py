@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendars', '0002_internshipcalendar_calendar_published_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='internshipcalendar',
+            index=models.Index(fields=['is_published', 'is_visible_to_companies', 'start_date', 'id'], name='calendar_public_cursor_idx'),
+        ),
+    ]
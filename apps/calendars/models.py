@@ -92,6 +92,11 @@ class InternshipCalendar(models.Model):
             models.Index(fields=['is_visible_to_companies'], name='calendar_visible_idx'),
             models.Index(fields=['start_date'], name='calendar_start_idx'),
             models.Index(fields=['program_level'], name='calendar_level_idx'),
+            # Keyset pagination of PublicCalendarsView
+            models.Index(
+                fields=['is_published', 'is_visible_to_companies', 'start_date', 'id'],
+                name='calendar_public_cursor_idx',
+            ),
         ]
     
     def __str__(self):
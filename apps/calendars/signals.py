@@ -0,0 +1,12 @@
+"""
+Django Signals invalidating the cached calendar lists
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from apps.calendars.models import InternshipCalendar
+from core.services.calendar_service import InternshipCalendarService
+
+
+@receiver([post_save, post_delete], sender=InternshipCalendar)
+def invalidate_calendar_cache(sender, **kwargs):
+    InternshipCalendarService.invalidate_cache()
@@ -1,3 +1,9 @@
 from django.contrib import admin
+from .models import StatusCount
 
-# Register your models here.
+
+@admin.register(StatusCount)
+class StatusCountAdmin(admin.ModelAdmin):
+    list_display = ['entity', 'status', 'user_type', 'count', 'updated_at']
+    list_filter = ['entity', 'user_type']
+    readonly_fields = ['updated_at']
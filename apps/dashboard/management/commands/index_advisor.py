@@ -0,0 +1,53 @@
+"""
+Explain the hot queries of the services and views, and suggest the indexes they lack.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from core.services.index_advisor import IndexAdvisorService, get_query_corpus
+
+
+class Command(BaseCommand):
+    help = "Analyse les requêtes fréquentes avec EXPLAIN et suggère les index manquants"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'queries',
+            nargs='*',
+            help="Noms des requêtes à analyser (défaut: toutes)"
+        )
+        parser.add_argument(
+            '--show-plans',
+            action='store_true',
+            help="Affiche le plan des requêtes signalées"
+        )
+        parser.add_argument(
+            '--fail-on-scan',
+            action='store_true',
+            help="Termine en erreur si une requête lit une table en entier (intégration continue)"
+        )
+
+    def handle(self, *args, **options):
+        corpus = get_query_corpus()
+        if options['queries']:
+            unknown = set(options['queries']) - {name for name, _ in corpus}
+            if unknown:
+                raise CommandError(f"Requête(s) inconnue(s) : {', '.join(sorted(unknown))}")
+            corpus = [(name, queryset) for name, queryset in corpus if name in options['queries']]
+
+        findings = IndexAdvisorService.analyze(corpus)
+        flagged = {finding.name for finding in findings}
+        for name, _ in corpus:
+            if name not in flagged:
+                self.stdout.write(f"{name}: OK")
+        for finding in findings:
+            self.stdout.write(self.style.WARNING(f"{finding.name}: parcours complet de {finding.table}"))
+            if finding.suggestion:
+                self.stdout.write(
+                    f"    suggestion : models.Index(fields={finding.suggestion!r}) sur {finding.table}"
+                )
+            if options['show_plans']:
+                self.stdout.write(f"    {finding.plan}")
+
+        summary = f"{len(corpus)} requête(s) analysée(s), {len(flagged)} sans index adapté"
+        if findings and options['fail_on_scan']:
+            raise CommandError(summary)
+        self.stdout.write(self.style.SUCCESS(summary) if not findings else summary)
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.11 on 2026-10-17 21:30
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_status_counts(apps, schema_editor):
+    CustomUser = apps.get_model('users', 'CustomUser')
+    UserDocument = apps.get_model('users', 'UserDocument')
+    StatusCount = apps.get_model('dashboard', 'StatusCount')
+
+    rows = [
+        StatusCount(entity='document', status=row['status'], user_type=row['user__user_type'], count=row['total'])
+        for row in UserDocument.objects.values('status', 'user__user_type').annotate(total=Count('pk')).order_by()
+    ]
+    rows += [
+        StatusCount(entity='user', status=row['verification_status'], user_type=row['user_type'], count=row['total'])
+        for row in CustomUser.objects.values('verification_status', 'user_type').annotate(total=Count('pk')).order_by()
+    ]
+    StatusCount.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('users', '0010_alter_userdocument_document_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatusCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity', models.CharField(choices=[('document', 'Document'), ('user', 'Utilisateur')], max_length=20)),
+                ('status', models.CharField(max_length=20)),
+                ('user_type', models.CharField(max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Compteur de statut',
+                'verbose_name_plural': 'Compteurs de statut',
+                'constraints': [models.UniqueConstraint(fields=('entity', 'status', 'user_type'), name='unique_status_count')],
+            },
+        ),
+        migrations.RunPython(backfill_status_counts, migrations.RunPython.noop),
+    ]
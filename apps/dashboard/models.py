@@ -1,3 +1,136 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, Sum
 
-# Create your models here.
+
+class StatusCount(models.Model):
+    """
+    Materialized number of rows per (entity, status, user_type).
+
+    Feeds the count badges of the admin review screens. Signals in
+    apps/dashboard/signals.py apply +1/-1 deltas as rows are created,
+    change status or are deleted; the reconcile_status_counts task
+    rebuilds the table periodically to absorb bulk updates.
+    """
+    DOCUMENT = 'document'
+    USER = 'user'
+
+    ENTITY_CHOICES = [
+        (DOCUMENT, 'Document'),
+        (USER, 'Utilisateur'),
+    ]
+
+    entity = models.CharField(max_length=20, choices=ENTITY_CHOICES)
+    status = models.CharField(max_length=20)
+    user_type = models.CharField(max_length=20)
+    count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Compteur de statut'
+        verbose_name_plural = 'Compteurs de statut'
+        constraints = [
+            models.UniqueConstraint(fields=['entity', 'status', 'user_type'], name='unique_status_count'),
+        ]
+
+    def __str__(self):
+        return f"{self.entity}/{self.status}/{self.user_type}: {self.count}"
+
+    @classmethod
+    def adjust(cls, entity, status, user_type, delta):
+        """
+        Add delta to one (entity, status, user_type) bucket.
+        """
+        if not delta or status is None or user_type is None:
+            return
+        bucket = cls.objects.filter(entity=entity, status=status, user_type=user_type)
+        if not bucket.update(count=F('count') + delta):
+            cls.objects.get_or_create(entity=entity, status=status, user_type=user_type)
+            bucket.update(count=F('count') + delta)
+
+    @classmethod
+    def move(cls, entity, old, new):
+        """
+        Move one row between buckets.
+
+        Args:
+            entity: DOCUMENT or USER
+            old: (status, user_type) before the change, or None on creation
+            new: (status, user_type) after the change, or None on deletion
+        """
+        if old == new:
+            return
+        if old:
+            cls.adjust(entity, *old, delta=-1)
+        if new:
+            cls.adjust(entity, *new, delta=1)
+
+    @classmethod
+    def counts(cls, entity, exclude_user_types=(), user_type=None):
+        """
+        Counts per status, summed over user types, in one query.
+
+        Args:
+            entity: DOCUMENT or USER
+            exclude_user_types: User types left out of the sums
+            user_type: Only count this user type
+
+        Returns:
+            dict {status: count}
+        """
+        rows = cls.objects.filter(entity=entity)
+        if user_type is not None:
+            rows = rows.filter(user_type=user_type)
+        rows = (
+            rows
+            .exclude(user_type__in=exclude_user_types)
+            .values('status')
+            .annotate(total=Sum('count'))
+        )
+        return {row['status']: row['total'] for row in rows}
+
+    @classmethod
+    def compute(cls):
+        """
+        Count documents and users per (status, user_type) from the source tables.
+
+        Returns:
+            dict {(entity, status, user_type): count}
+        """
+        from django.contrib.auth import get_user_model
+        from apps.users.models_documents import UserDocument
+
+        computed = {}
+        documents = UserDocument.objects.values('status', 'user__user_type').annotate(total=Count('pk')).order_by()
+        for row in documents:
+            computed[(cls.DOCUMENT, row['status'], row['user__user_type'])] = row['total']
+        users = get_user_model().objects.values('verification_status', 'user_type').annotate(total=Count('pk')).order_by()
+        for row in users:
+            computed[(cls.USER, row['verification_status'], row['user_type'])] = row['total']
+        return computed
+
+    @classmethod
+    def reconcile(cls):
+        """
+        Rebuild the table from the source tables.
+
+        Returns:
+            int, number of buckets whose count was wrong or missing
+        """
+        computed = cls.compute()
+        with transaction.atomic():
+            stored = {
+                (row.entity, row.status, row.user_type): row
+                for row in cls.objects.select_for_update()
+            }
+            drifted = [
+                key for key, total in computed.items()
+                if key not in stored or stored[key].count != total
+            ]
+            stale = [row.pk for key, row in stored.items() if key not in computed and row.count]
+            for key in drifted:
+                cls.objects.update_or_create(
+                    entity=key[0], status=key[1], user_type=key[2],
+                    defaults={'count': computed[key]}
+                )
+            cls.objects.filter(pk__in=stale).update(count=0)
+        return len(drifted) + len(stale)
@@ -0,0 +1,112 @@
+"""
+Django Signals invalidating the cached dashboard counters and keeping the
+materialized status counts current
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from apps.applications.models import Application
+from apps.dashboard.models import StatusCount
+from apps.internships.models import Internship
+from apps.services.models import CarpoolingOffer, HousingOffer
+from apps.users.models_documents import UserDocument
+from core.services.dashboard_metrics import DashboardMetricsService
+
+
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+@receiver([post_save, post_delete], sender=UserDocument)
+def invalidate_admin_counters(sender, **kwargs):
+    """
+    Users and documents only feed the admin counters.
+    """
+    DashboardMetricsService.invalidate('admin')
+
+
+@receiver([post_save, post_delete], sender=Internship)
+def invalidate_internship_counters(sender, instance, **kwargs):
+    DashboardMetricsService.invalidate('admin')
+    DashboardMetricsService.invalidate('company', [instance.company_id])
+
+
+@receiver([post_save, post_delete], sender=Application)
+def invalidate_application_counters(sender, instance, **kwargs):
+    DashboardMetricsService.invalidate('admin')
+    DashboardMetricsService.invalidate('student', [instance.student_id])
+    DashboardMetricsService.invalidate('company', [instance.internship.company_id])
+
+
+@receiver([post_save, post_delete], sender=HousingOffer)
+def invalidate_housing_counters(sender, instance, **kwargs):
+    DashboardMetricsService.invalidate('landlord', [instance.owner_id])
+
+
+@receiver([post_save, post_delete], sender=CarpoolingOffer)
+def invalidate_carpooling_counters(sender, instance, **kwargs):
+    DashboardMetricsService.invalidate('driver', [instance.driver_id])
+
+
+# ── Materialized status counts ──────────────────────────
+# Previous statuses come from the loaded values of FieldTrackingMixin; paths
+# writing with update()/bulk_update() move the counts themselves and call
+# snapshot_tracked_fields() on their instances.
+
+def _document_bucket(document):
+    try:
+        return document.status, document.user.user_type
+    except get_user_model().DoesNotExist:
+        return None
+
+
+def _saved_value(instance, field, update_fields):
+    """Value a save wrote for a tracked field: unchanged when the field was not written."""
+    if update_fields is not None and field not in update_fields:
+        return instance.get_loaded_value(field)
+    return getattr(instance, field)
+
+
+@receiver(post_save, sender=UserDocument)
+def count_document_status(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        StatusCount.move(StatusCount.DOCUMENT, None, _document_bucket(instance))
+        return
+    if not instance.is_loaded('status'):
+        return
+    previous = instance.get_loaded_value('status')
+    status = _saved_value(instance, 'status', update_fields)
+    if previous != status:
+        user_type = instance.user.user_type
+        StatusCount.move(StatusCount.DOCUMENT, (previous, user_type), (status, user_type))
+
+
+@receiver(post_delete, sender=UserDocument)
+def uncount_document_status(sender, instance, **kwargs):
+    bucket = _document_bucket(instance)
+    if bucket is not None and instance.is_loaded('status'):
+        bucket = (instance.get_loaded_value('status'), bucket[1])
+    StatusCount.move(StatusCount.DOCUMENT, bucket, None)
+
+
+def _loaded_user_bucket(user):
+    if not (user.is_loaded('verification_status') and user.is_loaded('user_type')):
+        return None
+    return user.get_loaded_value('verification_status'), user.get_loaded_value('user_type')
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def count_user_status(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        StatusCount.move(StatusCount.USER, None, (instance.verification_status, instance.user_type))
+        return
+    previous = _loaded_user_bucket(instance)
+    if previous is not None:
+        current = (
+            _saved_value(instance, 'verification_status', update_fields),
+            _saved_value(instance, 'user_type', update_fields),
+        )
+        StatusCount.move(StatusCount.USER, previous, current)
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def uncount_user_status(sender, instance, **kwargs):
+    StatusCount.move(StatusCount.USER, _loaded_user_bucket(instance), None)
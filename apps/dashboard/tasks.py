@@ -0,0 +1,17 @@
+"""
+Dashboard-related Celery tasks.
+"""
+from celery import shared_task
+
+
+@shared_task
+def reconcile_status_counts():
+    """
+    Rebuild the materialized status counts from the source tables.
+    Catches drift from queryset.update() calls, which send no signals.
+    """
+    from apps.dashboard.models import StatusCount
+    
+    fixed = StatusCount.reconcile()
+    
+    return f"Reconciled {fixed} status counts"
@@ -34,7 +34,7 @@ from .views_documents import (
 )
 from .views_admin import (
     AdminDocumentListView, AdminDocumentDetailView,
-    AdminDocumentApproveView, AdminDocumentRejectView,
+    AdminDocumentApproveView, AdminDocumentRejectView, AdminDocumentBulkReviewView,
     AdminUserVerificationListView, AdminUserVerificationDetailView,
     AdminVerifyUserView,
 )
@@ -110,6 +110,7 @@ urlpatterns = [
     
     # Admin - Vérification des documents
     path('admin/documents/', AdminDocumentListView.as_view(), name='admin_document_list'),
+    path('admin/documents/bulk-review/', AdminDocumentBulkReviewView.as_view(), name='admin_document_bulk_review'),
     path('admin/documents/<int:pk>/', AdminDocumentDetailView.as_view(), name='admin_document_detail'),
     path('admin/documents/<int:pk>/approve/', AdminDocumentApproveView.as_view(), name='admin_document_approve'),
     path('admin/documents/<int:pk>/reject/', AdminDocumentRejectView.as_view(), name='admin_document_reject'),
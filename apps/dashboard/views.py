@@ -4,6 +4,7 @@ from apps.applications.models import Application
 from apps.internships.models import Internship
 from apps.services.models import HousingOffer, CarpoolingOffer
 from apps.notifications.models import Notification
+from core.services.dashboard_metrics import DashboardMetricsService
 
 
 class DashboardView(LoginRequiredMixin, TemplateView):
@@ -64,16 +65,8 @@ class DashboardView(LoginRequiredMixin, TemplateView):
         from django.contrib.auth import get_user_model
         from apps.users.models_documents import UserDocument
         User = get_user_model()
-        context['total_users'] = User.objects.count()
-        context['total_students'] = User.objects.filter(user_type='student').count()
-        context['total_companies'] = User.objects.filter(user_type='company').count()
-        context['total_internships'] = Internship.objects.count()
-        context['total_applications'] = Application.objects.count()
-        context['pending_verifications'] = (
-            User.objects.exclude(user_type__in=['student', 'admin'])
-            .exclude(verification_status='verified')
-            .count()
-        )
+        # total_*, pending_verifications and *_documents_count
+        context.update(DashboardMetricsService.get_counters('admin', user))
         context['recent_users'] = User.objects.order_by('-date_joined')[:10]
         # Documents en attente de validation
         context['pending_documents'] = (
@@ -81,21 +74,15 @@ class DashboardView(LoginRequiredMixin, TemplateView):
             .select_related('user')
             .order_by('-uploaded_at')[:20]
         )
-        context['pending_documents_count'] = UserDocument.objects.filter(status='pending').count()
-        context['approved_documents_count'] = UserDocument.objects.filter(status='approved').count()
-        context['rejected_documents_count'] = UserDocument.objects.filter(status='rejected').count()
 
     def _context_student(self, context, user):
         context['applications'] = Application.objects.filter(student=user).order_by('-created_at')[:10]
-        context['applications_count'] = Application.objects.filter(student=user).count()
-        context['pending_count'] = Application.objects.filter(student=user, status='pending').count()
+        context.update(DashboardMetricsService.get_counters('student', user))
 
     def _context_company(self, context, user):
         context['internships'] = Internship.objects.filter(company=user).order_by('-created_at')[:10]
-        context['internships_count'] = Internship.objects.filter(company=user).count()
         context['received_applications'] = Application.objects.filter(internship__company=user).order_by('-created_at')[:10]
-        context['applications_count'] = Application.objects.filter(internship__company=user).count()
-        context['pending_count'] = Application.objects.filter(internship__company=user, status='pending').count()
+        context.update(DashboardMetricsService.get_counters('company', user))
 
     def _context_school(self, context, user):
         from apps.calendars.models import InternshipCalendar
@@ -122,18 +109,15 @@ class DashboardView(LoginRequiredMixin, TemplateView):
 
     def _context_recruiter(self, context, user):
         context['internships'] = Internship.objects.filter(company=user).order_by('-created_at')[:10]
-        context['internships_count'] = Internship.objects.filter(company=user).count()
-        context['applications_count'] = Application.objects.filter(internship__company=user).count()
+        context.update(DashboardMetricsService.get_counters('recruiter', user))
 
     def _context_landlord(self, context, user):
         context['housing_offers'] = HousingOffer.objects.filter(owner=user).order_by('-created_at')[:10]
-        context['housing_count'] = HousingOffer.objects.filter(owner=user).count()
-        context['active_count'] = HousingOffer.objects.filter(owner=user, is_available=True).count()
+        context.update(DashboardMetricsService.get_counters('landlord', user))
 
     def _context_driver(self, context, user):
         context['carpooling_offers'] = CarpoolingOffer.objects.filter(driver=user).order_by('-created_at')[:10]
-        context['rides_count'] = CarpoolingOffer.objects.filter(driver=user).count()
-        context['active_count'] = CarpoolingOffer.objects.filter(driver=user, is_active=True).count()
+        context.update(DashboardMetricsService.get_counters('driver', user))
 
     def _context_partner(self, context, user):
         from apps.events.models import Event
@@ -7,7 +7,10 @@ from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.shortcuts import get_object_or_404, redirect
 from django.contrib import messages
 from django.utils import timezone
+from django.utils.functional import cached_property
 from apps.users.models_documents import UserDocument
+from apps.dashboard.models import StatusCount
+from core.pagination import CheapCountMixin
 from django.contrib.auth import get_user_model
 from core.services.notification_dispatcher import (
     REJECTION_TEMPLATES,
@@ -15,6 +18,8 @@ from core.services.notification_dispatcher import (
     on_document_rejected,
     on_profile_status_changed,
 )
+from core.services.document_checklist_service import DocumentChecklistService
+from core.services.document_review_service import DocumentReviewService
 from core.services.verification_automator import VerificationAutomator
 
 User = get_user_model()
@@ -27,7 +32,7 @@ class AdminRequiredMixin(UserPassesTestMixin):
         return u.is_superuser or u.is_staff or u.user_type == 'admin'
 
 
-class AdminDocumentListView(LoginRequiredMixin, AdminRequiredMixin, ListView):
+class AdminDocumentListView(LoginRequiredMixin, AdminRequiredMixin, CheapCountMixin, ListView):
     model = UserDocument
     template_name = 'dashboard/admin/document_review_list.html'
     context_object_name = 'documents'
@@ -43,14 +48,32 @@ class AdminDocumentListView(LoginRequiredMixin, AdminRequiredMixin, ListView):
             qs = qs.filter(user__user_type=user_type)
         return qs
 
+    @cached_property
+    def status_counts(self):
+        # Badges read the materialized counts: one small query whatever the backlog size
+        return StatusCount.counts(StatusCount.DOCUMENT)
+
+    def get_pagination_count(self):
+        # The list total comes from the same counts: no COUNT(*) over the documents
+        status = self.request.GET.get('status', 'pending')
+        user_type = self.request.GET.get('user_type')
+        if user_type:
+            counts = StatusCount.counts(StatusCount.DOCUMENT, user_type=user_type)
+        else:
+            counts = self.status_counts
+        if status and status != 'all':
+            return counts.get(status, 0)
+        return sum(counts.values())
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['current_status'] = self.request.GET.get('status', 'pending')
         context['current_user_type'] = self.request.GET.get('user_type', '')
-        context['pending_count'] = UserDocument.objects.filter(status='pending').count()
-        context['approved_count'] = UserDocument.objects.filter(status='approved').count()
-        context['rejected_count'] = UserDocument.objects.filter(status='rejected').count()
-        context['total_count'] = UserDocument.objects.count()
+        counts = self.status_counts
+        context['pending_count'] = counts.get('pending', 0)
+        context['approved_count'] = counts.get('approved', 0)
+        context['rejected_count'] = counts.get('rejected', 0)
+        context['total_count'] = sum(counts.values())
         return context
 
 
@@ -132,6 +155,38 @@ class AdminDocumentRejectView(LoginRequiredMixin, AdminRequiredMixin, View):
         return redirect('admin_document_list')
 
 
+class AdminDocumentBulkReviewView(LoginRequiredMixin, AdminRequiredMixin, View):
+    """Approuver ou rejeter en une fois les documents cochés dans la liste."""
+    def post(self, request):
+        next_url = request.POST.get('next', '') or 'admin_document_list'
+        action = request.POST.get('action', '')
+        document_ids = [pk for pk in request.POST.getlist('document_ids') if pk.isdigit()]
+        
+        if action not in DocumentReviewService.STATUSES:
+            messages.error(request, 'Action inconnue.')
+            return redirect(next_url)
+        if not document_ids:
+            messages.error(request, 'Aucun document sélectionné.')
+            return redirect(next_url)
+        
+        result = DocumentReviewService.review(
+            document_ids,
+            admin=request.user,
+            action=action,
+            reason=request.POST.get('reason', '').strip(),
+        )
+        
+        count = len(result['documents'])
+        if action == DocumentReviewService.APPROVE:
+            messages.success(request, f'{count} document(s) approuvé(s).')
+        else:
+            messages.warning(request, f'{count} document(s) rejeté(s).')
+        if result['verified']:
+            messages.success(request, f'{len(result["verified"])} profil(s) vérifié(s) automatiquement.')
+        
+        return redirect(next_url)
+
+
 class AdminUserVerificationListView(LoginRequiredMixin, AdminRequiredMixin, ListView):
     model = User
     template_name = 'dashboard/admin/user_verification_list.html'
@@ -166,13 +221,14 @@ class AdminUserVerificationListView(LoginRequiredMixin, AdminRequiredMixin, List
         context = super().get_context_data(**kwargs)
         context['current_status'] = self.request.GET.get('status', 'pending')
         context['current_user_type'] = self.request.GET.get('user_type', '')
-        base_qs = User.objects.exclude(user_type__in=['student', 'admin'])
-        context['pending_count'] = base_qs.filter(verification_status='pending').count()
-        context['incomplete_count'] = base_qs.filter(verification_status='incomplete').count()
-        context['under_review_count'] = base_qs.filter(verification_status='under_review').count()
-        context['verified_count'] = base_qs.filter(verification_status='verified').count()
-        context['rejected_count'] = base_qs.filter(verification_status='rejected').count()
-        context['suspended_count'] = base_qs.filter(verification_status='suspended').count()
+        counts = StatusCount.counts(StatusCount.USER, exclude_user_types=['student', 'admin'])
+        for status in ('pending', 'incomplete', 'under_review', 'verified', 'rejected', 'suspended'):
+            context[f'{status}_count'] = counts.get(status, 0)
+        # Document completion of the whole page in one query
+        page_users = context['users_list']
+        percentages = DocumentChecklistService.get_completion_percentages(page_users)
+        for page_user in page_users:
+            page_user.completion_percentage = percentages[page_user.pk]
         return context
 
 
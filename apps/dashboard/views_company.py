@@ -5,8 +5,10 @@ from django.views.generic import ListView, CreateView, UpdateView, DeleteView, D
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.urls import reverse_lazy
 from django.db.models import Q, Count
+from django.utils.functional import cached_property
 from apps.internships.models import Internship
 from apps.applications.models import Application
+from core.pagination import CheapCountMixin
 
 
 class CompanyRequiredMixin(UserPassesTestMixin):
@@ -17,7 +19,7 @@ class CompanyRequiredMixin(UserPassesTestMixin):
 
 # ============ GESTION DES OFFRES DE STAGE ============
 
-class InternshipManageListView(LoginRequiredMixin, CompanyRequiredMixin, ListView):
+class InternshipManageListView(LoginRequiredMixin, CompanyRequiredMixin, CheapCountMixin, ListView):
     model = Internship
     template_name = 'dashboard/company/internship_list.html'
     context_object_name = 'internships'
@@ -48,11 +50,27 @@ class InternshipManageListView(LoginRequiredMixin, CompanyRequiredMixin, ListVie
         
         return queryset
     
+    @cached_property
+    def status_counts(self):
+        # Compteurs des badges, en une requête
+        return Internship.objects.filter(company=self.request.user).aggregate(
+            total=Count('pk'),
+            active=Count('pk', filter=Q(is_active=True)),
+            inactive=Count('pk', filter=Q(is_active=False)),
+        )
+    
+    def get_pagination_count(self):
+        # Sans recherche, le total de la liste est l'un des compteurs
+        if self.request.GET.get('search'):
+            return None
+        status = self.request.GET.get('status')
+        return self.status_counts[status if status in ('active', 'inactive') else 'total']
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['total_count'] = Internship.objects.filter(company=self.request.user).count()
-        context['active_count'] = Internship.objects.filter(company=self.request.user, is_active=True).count()
-        context['inactive_count'] = Internship.objects.filter(company=self.request.user, is_active=False).count()
+        context['total_count'] = self.status_counts['total']
+        context['active_count'] = self.status_counts['active']
+        context['inactive_count'] = self.status_counts['inactive']
         return context
 
 
@@ -117,7 +135,7 @@ class InternshipManageDetailView(LoginRequiredMixin, CompanyRequiredMixin, Detai
 
 # ============ GESTION DES CANDIDATURES ============
 
-class ApplicationManageListView(LoginRequiredMixin, CompanyRequiredMixin, ListView):
+class ApplicationManageListView(LoginRequiredMixin, CompanyRequiredMixin, CheapCountMixin, ListView):
     model = Application
     template_name = 'dashboard/company/application_list.html'
     context_object_name = 'applications'
@@ -139,15 +157,36 @@ class ApplicationManageListView(LoginRequiredMixin, CompanyRequiredMixin, ListVi
         
         return queryset
     
+    @cached_property
+    def status_counts(self):
+        # Compteurs des badges, en une requête
+        return Application.objects.filter(internship__company=self.request.user).aggregate(
+            total=Count('pk'),
+            pending=Count('pk', filter=Q(status='pending')),
+            accepted=Count('pk', filter=Q(status='accepted')),
+            rejected=Count('pk', filter=Q(status='rejected')),
+        )
+    
+    def get_pagination_count(self):
+        # Sans filtre par offre, le total de la liste est l'un des compteurs
+        if self.request.GET.get('internship'):
+            return None
+        status = self.request.GET.get('status')
+        if not status:
+            return self.status_counts['total']
+        if status in ('pending', 'accepted', 'rejected'):
+            return self.status_counts[status]
+        return None
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['internships'] = Internship.objects.filter(
             company=self.request.user,
             is_active=True
         )
-        context['total_count'] = Application.objects.filter(internship__company=self.request.user).count()
-        context['pending_count'] = Application.objects.filter(internship__company=self.request.user, status='pending').count()
-        context['accepted_count'] = Application.objects.filter(internship__company=self.request.user, status='accepted').count()
-        context['rejected_count'] = Application.objects.filter(internship__company=self.request.user, status='rejected').count()
+        context['total_count'] = self.status_counts['total']
+        context['pending_count'] = self.status_counts['pending']
+        context['accepted_count'] = self.status_counts['accepted']
+        context['rejected_count'] = self.status_counts['rejected']
         return context
 
@@ -5,3 +5,7 @@ class HubConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.hub'
     verbose_name = 'Hub Ressources'
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import apps.hub.signals
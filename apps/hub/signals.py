@@ -0,0 +1,25 @@
+"""
+Django Signals purging the cached resource and training pages
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from apps.hub.models import Resource, ResourceCategory, Training
+from core.cache import invalidate_tags
+from core.response_cache import RESOURCES_TAG, TRAININGS_TAG
+
+
+# Counters bumped on every view or download: left to the cache timeout
+RESOURCE_COUNTER_FIELDS = {'views_count', 'downloads_count'}
+
+
+@receiver([post_save, post_delete], sender=Resource)
+@receiver([post_save, post_delete], sender=ResourceCategory)
+def purge_resource_pages(sender, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= RESOURCE_COUNTER_FIELDS:
+        return
+    invalidate_tags(RESOURCES_TAG)
+
+
+@receiver([post_save, post_delete], sender=Training)
+def purge_training_pages(sender, **kwargs):
+    invalidate_tags(TRAININGS_TAG)
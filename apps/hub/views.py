@@ -1,6 +1,7 @@
 from django.views.generic import ListView, DetailView
 from django.shortcuts import get_object_or_404
 from django.http import FileResponse, Http404
+from core.response_cache import RESOURCES_TAG, TRAININGS_TAG, CachedResponseMixin
 from .models import ResourceCategory, Resource, Training
 
 class HubIndexView(ListView):
@@ -19,11 +20,12 @@ class HubIndexView(ListView):
         return context
 
 
-class ResourceListView(ListView):
+class ResourceListView(CachedResponseMixin, ListView):
     model = Resource
     template_name = 'hub/resource_list.html'
     context_object_name = 'resources'
     paginate_by = 12
+    response_cache_tags = (RESOURCES_TAG,)
     
     def get_queryset(self):
         queryset = Resource.objects.filter(is_active=True)
@@ -76,11 +78,12 @@ class ResourceDetailView(DetailView):
         return obj
 
 
-class TrainingListView(ListView):
+class TrainingListView(CachedResponseMixin, ListView):
     model = Training
     template_name = 'services/hub/training.html'
     context_object_name = 'trainings'
     paginate_by = 9
+    response_cache_tags = (TRAININGS_TAG,)
     
     def get_queryset(self):
         queryset = Training.objects.filter(is_active=True)
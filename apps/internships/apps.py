@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class InternshipsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.internships'
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import apps.internships.signals
@@ -0,0 +1,47 @@
+"""
+Backfill duration_months_min/max and salary_amount for existing internships.
+"""
+from django.core.management.base import BaseCommand
+from apps.internships.models import Internship
+
+
+STRUCTURED_FIELDS = ['duration_months_min', 'duration_months_max', 'salary_amount']
+
+
+class Command(BaseCommand):
+    help = "Renseigne la durée (en mois) et le montant de gratification des offres existantes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help="Nombre d'offres traitées par lot (défaut: 500)"
+        )
+        parser.add_argument(
+            '--only-missing',
+            action='store_true',
+            help="Ne traiter que les offres dont la durée n'a pas encore été analysée"
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        queryset = Internship.objects.only('pk', 'duration', 'salary', *STRUCTURED_FIELDS).order_by('pk')
+        if options['only_missing']:
+            queryset = queryset.filter(duration_months_max__isnull=True)
+
+        total = 0
+        last_pk = 0
+        while True:
+            batch = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            for internship in batch:
+                internship.parse_structured_fields()
+            # bulk_update skips save() and signals, so the search index is untouched
+            Internship.objects.bulk_update(batch, STRUCTURED_FIELDS)
+            total += len(batch)
+            last_pk = batch[-1].pk
+            self.stdout.write(f"  {total} offre(s) traitée(s)...")
+
+        self.stdout.write(self.style.SUCCESS(f"{total} offre(s) mises à jour"))
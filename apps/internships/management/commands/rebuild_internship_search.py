@@ -0,0 +1,21 @@
+"""
+Rebuild the internship full-text search index.
+"""
+from django.core.management.base import BaseCommand
+from core.services.search_service import InternshipSearchService
+
+
+class Command(BaseCommand):
+    help = "Reconstruit l'index de recherche des offres de stage"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help="Nombre d'offres indexées par lot (défaut: 500)"
+        )
+
+    def handle(self, *args, **options):
+        total = InternshipSearchService.rebuild(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"{total} offre(s) indexée(s)"))
@@ -0,0 +1,117 @@
+# Generated by Django 5.2.11 on 2026-10-17 17:12
+
+import re
+
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+FTS_TABLE = 'internships_search_fts'
+DOCUMENT_TABLE = 'internships_internshipsearchdocument'
+
+
+def create_search_backend(apps, schema_editor):
+    """Create the vendor-specific index structures."""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(
+            f'CREATE INDEX internship_search_gin ON {DOCUMENT_TABLE} USING gin (search_vector)'
+        )
+    elif vendor == 'sqlite':
+        schema_editor.execute(
+            f'CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5('
+            'title, description, company_name, location, duration_bucket, '
+            "tokenize = 'unicode61 remove_diacritics 2')"
+        )
+
+
+def drop_search_backend(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS internship_search_gin')
+    elif vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+def _duration_bucket(duration):
+    numbers = [int(n) for n in re.findall(r'(\d+)', duration or '')]
+    if not numbers:
+        return ''
+    months = max(numbers)
+    for upper, label in [(2, '1-2 mois'), (4, '3-4 mois'), (6, '5-6 mois')]:
+        if months <= upper:
+            return label
+    return '6+ mois'
+
+
+def backfill_search_documents(apps, schema_editor):
+    """Index the internships that exist before the search subsystem."""
+    Internship = apps.get_model('internships', 'Internship')
+    InternshipSearchDocument = apps.get_model('internships', 'InternshipSearchDocument')
+
+    documents = []
+    for internship in Internship.objects.select_related('company').iterator(chunk_size=500):
+        company = internship.company
+        display_name = (
+            company.company_name
+            or f'{company.first_name} {company.last_name}'.strip()
+            or company.username
+        )
+        documents.append(InternshipSearchDocument(
+            internship=internship,
+            title=internship.title,
+            description=internship.description or '',
+            company_name=f'{display_name} {company.username}'.strip(),
+            location=internship.location or '',
+            duration_bucket=_duration_bucket(internship.duration),
+        ))
+    InternshipSearchDocument.objects.bulk_create(documents, batch_size=500)
+
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(
+            f'UPDATE {DOCUMENT_TABLE} SET search_vector = '
+            "setweight(to_tsvector('french', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('french', coalesce(company_name, '')), 'B') || "
+            "setweight(to_tsvector('french', coalesce(location, '')), 'B') || "
+            "setweight(to_tsvector('french', coalesce(duration_bucket, '')), 'C') || "
+            "setweight(to_tsvector('french', coalesce(description, '')), 'D')"
+        )
+    elif vendor == 'sqlite':
+        schema_editor.execute(
+            f'INSERT INTO {FTS_TABLE}'
+            '(rowid, title, description, company_name, location, duration_bucket) '
+            'SELECT internship_id, title, description, company_name, location, duration_bucket '
+            f'FROM {DOCUMENT_TABLE}'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('internships', '0001_initial'),
+        ('users', '0010_alter_userdocument_document_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InternshipSearchDocument',
+            fields=[
+                ('internship', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='internships.internship')),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField(blank=True)),
+                ('company_name', models.CharField(blank=True, max_length=200)),
+                ('location', models.CharField(blank=True, max_length=100)),
+                ('duration_bucket', models.CharField(blank=True, max_length=20)),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Document de recherche',
+                'verbose_name_plural': 'Documents de recherche',
+            },
+        ),
+        migrations.RunPython(create_search_backend, drop_search_backend),
+        migrations.RunPython(backfill_search_documents, migrations.RunPython.noop),
+    ]
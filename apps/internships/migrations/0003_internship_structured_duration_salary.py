@@ -0,0 +1,36 @@
+# Generated by Django 5.2.11 on 2026-10-17 18:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('internships', '0002_internshipsearchdocument'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='internship',
+            name='duration_months_min',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='internship',
+            name='duration_months_max',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='internship',
+            name='salary_amount',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=10, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='internship',
+            index=models.Index(fields=['is_active', 'duration_months_max'], name='internship_duration_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='internship',
+            index=models.Index(fields=['is_active', 'salary_amount'], name='internship_salary_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('internships', '0003_internship_structured_duration_salary'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='internship',
+            index=models.Index(fields=['is_active', '-created_at'], name='internship_active_recent_idx'),
+        ),
+    ]
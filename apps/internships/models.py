@@ -1,6 +1,8 @@
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.utils.text import slugify
+from .utils import parse_duration_months, parse_salary_amount
 
 class Internship(models.Model):
     title = models.CharField(max_length=200)
@@ -10,14 +12,68 @@ class Internship(models.Model):
     location = models.CharField(max_length=100)
     salary = models.CharField(max_length=100, blank=True, null=True)
     duration = models.CharField(max_length=100, help_text="Ex: 6 months")
+    # Structured values parsed from duration/salary at save time (used by list filters)
+    duration_months_min = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+    duration_months_max = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+    salary_amount = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['is_active', 'duration_months_max'], name='internship_duration_idx'),
+            models.Index(fields=['is_active', 'salary_amount'], name='internship_salary_idx'),
+            models.Index(fields=['is_active', '-created_at'], name='internship_active_recent_idx'),
+        ]
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
+        self.parse_structured_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if 'duration' in update_fields:
+                update_fields |= {'duration_months_min', 'duration_months_max'}
+            if 'salary' in update_fields:
+                update_fields.add('salary_amount')
+            kwargs['update_fields'] = update_fields
         super().save(*args, **kwargs)
 
+    def parse_structured_fields(self):
+        """Refresh duration_months_min/max and salary_amount from the free-text fields."""
+        self.duration_months_min, self.duration_months_max = parse_duration_months(self.duration)
+        self.salary_amount = parse_salary_amount(self.salary)
+
     def __str__(self):
         return self.title
+
+
+class InternshipSearchDocument(models.Model):
+    """
+    Denormalized search document for an Internship.
+    Kept in sync by the internships signals; the backend-specific index
+    (tsvector + GIN on PostgreSQL, FTS5 table on SQLite) is maintained
+    by InternshipSearchService.
+    """
+    internship = models.OneToOneField(
+        Internship,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='search_document'
+    )
+    title = models.CharField(max_length=200)
+    description = models.TextField(blank=True)
+    company_name = models.CharField(max_length=200, blank=True)
+    location = models.CharField(max_length=100, blank=True)
+    duration_bucket = models.CharField(max_length=20, blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Document de recherche"
+        verbose_name_plural = "Documents de recherche"
+
+    def __str__(self):
+        return f"Search document for {self.internship_id}"
@@ -0,0 +1,47 @@
+"""
+Django Signals for Internship-related Models
+"""
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from apps.internships.models import Internship
+from core.cache import invalidate_tags
+from core.response_cache import INTERNSHIPS_TAG
+from core.services.search_service import InternshipSearchService
+
+
+# CustomUser fields that appear in the internship search document
+COMPANY_SEARCH_FIELDS = {'company_name', 'username', 'first_name', 'last_name'}
+
+
+@receiver(post_save, sender=Internship)
+def index_internship_on_save(sender, instance, **kwargs):
+    """
+    Refresh the search document whenever an internship is saved.
+    """
+    InternshipSearchService.index_internship(instance)
+
+
+@receiver(post_delete, sender=Internship)
+def remove_internship_from_index(sender, instance, **kwargs):
+    """
+    Remove a deleted internship from the search index.
+    """
+    InternshipSearchService.remove_internship(instance.pk)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def reindex_company_internships(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Keep the company name of indexed internships in sync with the company account.
+    """
+    if created or instance.user_type != 'company':
+        return
+    if update_fields is not None and not COMPANY_SEARCH_FIELDS.intersection(update_fields):
+        return
+    InternshipSearchService.index_company(instance)
+
+
+@receiver([post_save, post_delete], sender=Internship)
+def purge_internship_pages(sender, **kwargs):
+    invalidate_tags(INTERNSHIPS_TAG)
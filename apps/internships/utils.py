@@ -0,0 +1,147 @@
+"""
+Parsers turning the free-text duration and salary of an Internship into
+structured values that can be filtered with indexed range predicates.
+"""
+import math
+import re
+from decimal import Decimal, InvalidOperation
+
+
+# Units a duration can be written in, longest first ('semestre' is not 'sem')
+UNIT_PATTERN = r'semestres?|trimestres?|semaines?|sem|weeks?|mois|months?|ann[ée]es?|ans?|years?'
+NUMBER_PATTERN = r'\d+(?:[.,]\d+)?'
+DURATION_RE = re.compile(
+    rf'(?<![\d.,])(?P<low>{NUMBER_PATTERN})\s*(?:(?P<low_unit>{UNIT_PATTERN})\b\.?)?'
+    rf'(?:\s*(?:-|à|au|a|to)\s*(?P<high>{NUMBER_PATTERN})\s*(?:(?P<high_unit>{UNIT_PATTERN})\b\.?)?)?'
+)
+DATE_RE = re.compile(r'\d\s*/\s*\d')
+# Thousands separated by spaces ("1 200") but never two numbers ("3 600")
+AMOUNT_RE = re.compile(r'(?<![\d.,])(?:\d{1,3}(?:[ \u00a0\u202f]\d{3})+|\d+)(?:[.,]\d{1,2})?(?!\d)')
+CURRENCY_RE = re.compile(r'\s*(?:€|euros?\b|eur\b)')
+SALARY_UNIT_RE = re.compile(
+    r"\s*(?:brut|net)?\s*(?:/|par|per|de l'|à l'|a l')\s*"
+    r'(?P<unit>heures?|h|semaines?|sem|weeks?|jours?|j|days?|mois|months?|ann[ée]es?|ans?|years?)\b'
+)
+# Hours, percentages and durations ("35h", "15 %", "3 mois")
+NOT_AN_AMOUNT_RE = re.compile(rf'\s*(?:%|h\b|heures?\b|jours?\b|(?:{UNIT_PATTERN})\b)')
+UNPAID_RE = re.compile(r'non[\s-]*r[ée]mun[ée]r|b[ée]n[ée]vol|sans (?:r[ée]mun[ée]ration|gratification)|unpaid')
+
+# Amount per unit -> monthly amount: the legal 151.67 hours (35h a week) and
+# 52 weeks a year / 12. Daily rates depend on the schedule and are not converted.
+SALARY_MONTHLY_FACTORS = (
+    (('h', 'heure'), Decimal('151.67')),
+    (('sem', 'week'), Decimal(52) / Decimal(12)),
+    (('an', 'year'), Decimal(1) / Decimal(12)),
+    (('mois', 'month'), Decimal(1)),
+)
+
+
+def _unit_in_months(unit):
+    if unit.startswith('semestre'):
+        return 6
+    if unit.startswith('trimestre'):
+        return 3
+    if unit.startswith(('sem', 'week')):
+        return 0.25
+    if unit.startswith(('an', 'year')):
+        return 12
+    return 1
+
+
+def _to_months(number, unit):
+    return max(1, math.ceil(float(number.replace(',', '.')) * _unit_in_months(unit or 'mois')))
+
+
+def parse_duration_months(duration):
+    """
+    Parse a free-text duration into a (min, max) number of months.
+
+    Each number takes the unit written right after it (or after the end of
+    its range); a bare number counts in months. Dates and durations stating
+    several different lengths are ambiguous and give (None, None).
+
+    Examples:
+        "6 mois" -> (6, 6)
+        "3-4" -> (3, 4)
+        "3 à 4 mois" -> (3, 4)
+        "8 semaines" -> (2, 2)
+        "1 semestre" -> (6, 6)
+        "1 an" -> (12, 12)
+        "6 mois renouvelable 1 an" -> (None, None)
+        "du 01/03 au 30/06" -> (None, None)
+
+    Returns:
+        tuple (min_months, max_months), (None, None) when nothing parses
+    """
+    text = (duration or '').lower()
+    if DATE_RE.search(text):
+        return None, None
+
+    candidates = set()
+    for match in DURATION_RE.finditer(text):
+        low, high = match.group('low'), match.group('high') or match.group('low')
+        low_unit = match.group('low_unit') or match.group('high_unit')
+        high_unit = match.group('high_unit') or match.group('low_unit')
+        if low_unit is None and text[match.end():].lstrip()[:1].isalpha():
+            # A count of something else ("2 postes", "35h")
+            continue
+        candidates.add(tuple(sorted((_to_months(low, low_unit), _to_months(high, high_unit)))))
+
+    if len(candidates) != 1:
+        return None, None
+    return candidates.pop()
+
+
+def _monthly_amount(amount, unit):
+    if unit is None:
+        return amount
+    for prefixes, factor in SALARY_MONTHLY_FACTORS:
+        if unit.startswith(prefixes):
+            return (amount * factor).quantize(Decimal('0.01'))
+    return None
+
+
+def parse_salary_amount(salary):
+    """
+    Parse a free-text salary into a monthly amount.
+
+    The amount is the number next to a currency or a rate ("/mois", "de
+    l'heure"); numbers of hours, percentages and durations ("35h", "15 %",
+    "3 mois") are skipped. Hourly, weekly and yearly amounts are converted
+    to a month. Daily rates, texts without any amount ("Gratification
+    légale") and ambiguous texts give None, unpaid internships
+    ("Non rémunéré") give 0.
+
+    Examples:
+        "500€/mois" -> 500
+        "1 200 €" -> 1200
+        "4,35 €/h" -> 659.76
+        "3 mois, 600€/mois" -> 600
+
+    Returns:
+        Decimal monthly amount, or None when the text holds no monthly amount
+    """
+    text = (salary or '').lower()
+    marked, bare = set(), []
+    for match in AMOUNT_RE.finditer(text):
+        try:
+            amount = Decimal(re.sub(r'\s', '', match.group()).replace(',', '.'))
+        except InvalidOperation:
+            continue
+        end = match.end()
+        currency = CURRENCY_RE.match(text, end)
+        if currency:
+            end = currency.end()
+        unit = SALARY_UNIT_RE.match(text, end)
+        if currency or unit:
+            marked.add(_monthly_amount(amount, unit.group('unit') if unit else None))
+        elif not NOT_AN_AMOUNT_RE.match(text, end):
+            bare.append(amount)
+
+    if UNPAID_RE.search(text):
+        # "Non rémunéré mais 600€ de frais": unpaid, or not?
+        return None if marked or bare else Decimal('0')
+    if marked:
+        # "500 à 600 €", "400 € ou 600 €/mois": no single amount
+        return marked.pop() if len(marked) == 1 and not bare else None
+    return bare[0] if len(bare) == 1 else None
@@ -2,64 +2,57 @@ from django.views.generic import ListView, DetailView, CreateView
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.urls import reverse_lazy
 from django.db.models import Q
+from core.response_cache import INTERNSHIPS_TAG, CachedResponseMixin
+from core.services.search_service import InternshipSearchService
 from .models import Internship
 
-class InternshipListView(ListView):
+# Duration filter value -> (min, max) months of Internship.duration_months_max
+DURATION_FILTER_RANGES = {
+    '1': (1, 2),
+    '3': (3, 4),
+    '5': (5, 6),
+}
+
+
+class InternshipListView(CachedResponseMixin, ListView):
     model = Internship
     template_name = 'internships/internship_list.html'
     context_object_name = 'internships'
     paginate_by = 12
+    response_cache_tags = (INTERNSHIPS_TAG,)
 
     def get_queryset(self):
         queryset = Internship.objects.filter(is_active=True)
         
-        # Search query
+        # Search query (ranked full-text search)
         q = self.request.GET.get('q')
         if q:
-            queryset = queryset.filter(
-                Q(title__icontains=q) |
-                Q(description__icontains=q) |
-                Q(company__username__icontains=q) |
-                Q(location__icontains=q)
-            )
+            queryset = InternshipSearchService.search(queryset, q)
         
         # Location filter
         location = self.request.GET.get('location')
         if location:
             queryset = queryset.filter(location__icontains=location)
         
-        # Duration filter
+        # Duration filter (buckets on the parsed maximum duration, in months)
         duration = self.request.GET.get('duration')
-        if duration:
-            if duration == '1':
-                queryset = queryset.filter(
-                    Q(duration__icontains='1 mois') |
-                    Q(duration__icontains='2 mois') |
-                    Q(duration__icontains='1-2')
-                )
-            elif duration == '3':
-                queryset = queryset.filter(
-                    Q(duration__icontains='3 mois') |
-                    Q(duration__icontains='4 mois') |
-                    Q(duration__icontains='3-4')
-                )
-            elif duration == '5':
-                queryset = queryset.filter(
-                    Q(duration__icontains='5 mois') |
-                    Q(duration__icontains='6 mois') |
-                    Q(duration__icontains='5-6')
-                )
+        if duration in DURATION_FILTER_RANGES:
+            queryset = queryset.filter(
+                duration_months_max__range=DURATION_FILTER_RANGES[duration]
+            )
         
-        # Paid filter
+        # Paid filter: a monthly amount, or a salary text without one ("Gratification légale", daily rate)
         paid = self.request.GET.get('paid')
         if paid:
-            queryset = queryset.exclude(salary__isnull=True).exclude(salary='')
+            queryset = queryset.filter(
+                Q(salary_amount__gt=0) | Q(salary_amount__isnull=True, salary__gt='')
+            )
         
-        # Sorting
-        sort = self.request.GET.get('sort', '-created_at')
+        # Sorting (search results keep their relevance order unless a sort is requested)
+        sort = self.request.GET.get('sort')
         if sort in ['created_at', '-created_at', 'title', '-title']:
             queryset = queryset.order_by(sort)
-        else:
+        elif not q:
             queryset = queryset.order_by('-created_at')
         
         return queryset
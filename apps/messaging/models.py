@@ -1,7 +1,53 @@
 from django.db import models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Substr
 from django.conf import settings
 
 
+# Length of the last-message preview loaded for the inbox
+SNIPPET_LENGTH = 100
+
+
+class ConversationQuerySet(models.QuerySet):
+    """QuerySet helpers for conversation lists."""
+
+    def with_summary(self, user):
+        """
+        Annotate each conversation with what the inbox needs for `user`:
+        other_participant_id, last_message_snippet/_at/_sender_id and unread.
+
+        Everything is computed with correlated subqueries, so the list
+        costs a single query whatever the number of conversations or messages.
+        """
+        through = Conversation.participants.through
+        other_participant = through.objects.filter(
+            conversation=OuterRef('pk')
+        ).exclude(customuser=user).values('customuser')[:1]
+
+        last_message = Message.objects.filter(
+            conversation=OuterRef('pk')
+        ).order_by('-created_at', '-pk')
+
+        unread = Message.objects.filter(
+            conversation=OuterRef('pk'),
+            is_read=False
+        ).exclude(sender=user).order_by().values('conversation').annotate(
+            total=Count('pk')
+        ).values('total')
+
+        return self.annotate(
+            other_participant_id=Subquery(other_participant),
+            last_message_snippet=Subquery(
+                last_message.annotate(
+                    snippet=Substr('content', 1, SNIPPET_LENGTH)
+                ).values('snippet')[:1]
+            ),
+            last_message_at=Subquery(last_message.values('created_at')[:1]),
+            last_message_sender_id=Subquery(last_message.values('sender')[:1]),
+            unread=Coalesce(Subquery(unread, output_field=IntegerField()), 0),
+        )
+
+
 class Conversation(models.Model):
     """
     Conversation between two users (e.g., student and company).
@@ -22,6 +68,8 @@ class Conversation(models.Model):
         related_name='conversations'
     )
     
+    objects = ConversationQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-updated_at']
         verbose_name = 'Conversation'
@@ -73,11 +121,23 @@ class Message(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Message'
         verbose_name_plural = 'Messages'
+        indexes = [
+            # Unread messages of a conversation not sent by the reader
+            models.Index(fields=['conversation', 'is_read', 'sender'], name='message_unread_idx'),
+        ]
     
     def __str__(self):
         return f"{self.sender.username}: {self.content[:50]}"
     
+    def get_recipient_ids(self):
+        """Ids of the conversation participants other than the sender."""
+        return list(
+            self.conversation.participants.exclude(pk=self.sender_id).values_list('pk', flat=True)
+        )
+    
     def mark_as_read(self):
         if not self.is_read:
             self.is_read = True
             self.save()
+            from apps.notifications.models import UnreadCounter
+            UnreadCounter.adjust(self.get_recipient_ids(), messages=-1)
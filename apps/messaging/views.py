@@ -4,6 +4,7 @@ from django.shortcuts import get_object_or_404, redirect
 from django.http import JsonResponse
 from django.db.models import Q
 from .models import Conversation, Message
+from apps.notifications.models import UnreadCounter
 from apps.users.models import CustomUser
 
 
@@ -18,19 +19,19 @@ class InboxView(LoginRequiredMixin, ListView):
     def get_queryset(self):
         return Conversation.objects.filter(
             participants=self.request.user
-        ).prefetch_related('participants', 'messages')
+        ).with_summary(self.request.user).select_related('internship')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        user = self.request.user
-        enriched = []
-        for conv in context['conversations']:
-            conv.other_participant = conv.get_other_participant(user)
-            conv.last_message = conv.get_last_message()
-            conv.unread = conv.unread_count(user)
+        conversations = list(context['conversations'])
+        # One query for all the other participants
+        others = CustomUser.objects.in_bulk(
+            {conv.other_participant_id for conv in conversations if conv.other_participant_id}
+        )
+        for conv in conversations:
+            conv.other_participant = others.get(conv.other_participant_id)
             conv.has_unread = conv.unread > 0
-            enriched.append(conv)
-        context['conversations'] = enriched
+        context['conversations'] = conversations
         return context
 
 
@@ -48,10 +49,13 @@ class ConversationView(LoginRequiredMixin, DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         # Mark messages as read
-        self.object.messages.filter(is_read=False).exclude(
+        marked = self.object.messages.filter(is_read=False).exclude(
             sender=self.request.user
         ).update(is_read=True)
+        if marked:
+            UnreadCounter.adjust([self.request.user.pk], messages=-marked)
         context['messages'] = self.object.messages.order_by('created_at')
+        context['other_participant'] = self.object.get_other_participant(self.request.user)
         return context
 
 
@@ -119,8 +123,5 @@ class UnreadCountView(LoginRequiredMixin, View):
     Get total unread message count for navbar badge.
     """
     def get(self, request):
-        count = Message.objects.filter(
-            conversation__participants=request.user,
-            is_read=False
-        ).exclude(sender=request.user).count()
+        count = UnreadCounter.get_counts(request.user)['messages']
         return JsonResponse({'count': count})
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Notification
+from .models import Notification, OutboxEmail, TaskCheckpoint, UnreadCounter
 
 
 @admin.register(Notification)
@@ -9,3 +9,27 @@ class NotificationAdmin(admin.ModelAdmin):
     search_fields = ['recipient__username', 'title', 'message']
     readonly_fields = ['created_at']
     ordering = ['-created_at']
+
+
+@admin.register(UnreadCounter)
+class UnreadCounterAdmin(admin.ModelAdmin):
+    list_display = ['user', 'notifications', 'messages', 'updated_at']
+    search_fields = ['user__username', 'user__email']
+    readonly_fields = ['updated_at']
+
+
+@admin.register(TaskCheckpoint)
+class TaskCheckpointAdmin(admin.ModelAdmin):
+    list_display = ['key', 'position', 'completed', 'updated_at']
+    list_filter = ['completed']
+    search_fields = ['key']
+    readonly_fields = ['updated_at']
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ['to_email', 'subject', 'status', 'attempts', 'next_attempt_at', 'sent_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['to_email', 'subject']
+    readonly_fields = ['created_at', 'sent_at', 'last_error']
+    ordering = ['-created_at']
@@ -0,0 +1,80 @@
+"""
+Email rendering helpers
+
+Every email is a pair of templates: ``emails/<name>.html`` and a hand-written
+plain-text alternative ``emails/<name>.txt``. Both extend a shared layout
+(``emails/base_email.html`` / ``emails/base_email.txt``).
+
+Templates are resolved through the template engine, whose cached loader
+keeps each compiled template (layouts included) after the first use.
+render_emails() resolves a template pair once and renders it for many
+contexts, so bulk sends never look templates up per message.
+"""
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.template.loader import get_template
+
+
+def base_context():
+    """Context shared by every email template."""
+    return {
+        'site_name': 'Pratik',
+        'site_url': getattr(settings, 'SITE_URL', 'http://localhost:8000'),
+    }
+
+
+def get_email_templates(name):
+    """
+    Resolve the compiled HTML and text templates of an email.
+
+    Args:
+        name: Template name without folder or extension (e.g. 'notification')
+
+    Returns:
+        tuple (html_template, text_template)
+    """
+    return get_template(f'emails/{name}.html'), get_template(f'emails/{name}.txt')
+
+
+def render_emails(name, contexts):
+    """
+    Render the same email for many contexts.
+
+    Args:
+        name: Template name without folder or extension
+        contexts: Iterable of context dicts
+
+    Yields:
+        tuple (text_body, html_body) per context
+    """
+    html_template, text_template = get_email_templates(name)
+    shared = base_context()
+    for context in contexts:
+        context = {**shared, **context}
+        yield text_template.render(context).strip() + '\n', html_template.render(context)
+
+
+def render_email(name, context):
+    """
+    Render a single email.
+
+    Returns:
+        tuple (text_body, html_body)
+    """
+    return next(render_emails(name, [context]))
+
+
+def build_email(name, subject, context, to, from_email=None, connection=None):
+    """
+    Render an email and wrap it in an EmailMultiAlternatives (text + HTML).
+    """
+    text_body, html_body = render_email(name, context)
+    email = EmailMultiAlternatives(
+        subject=subject,
+        body=text_body,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        to=to,
+        connection=connection,
+    )
+    email.attach_alternative(html_body, "text/html")
+    return email
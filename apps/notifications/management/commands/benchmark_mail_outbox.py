@@ -0,0 +1,88 @@
+"""
+Measure mail outbox throughput offline, against the locmem or file email backend.
+"""
+import tempfile
+import time
+import uuid
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+from apps.notifications.models import OutboxEmail
+from core.services.mail_outbox import MailOutboxService
+
+
+BACKENDS = {
+    'locmem': 'django.core.mail.backends.locmem.EmailBackend',
+    'file': 'django.core.mail.backends.filebased.EmailBackend',
+}
+
+
+class Command(BaseCommand):
+    help = "Mesure le débit de la file d'envoi d'emails avec un backend local"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=1000,
+            help="Nombre d'emails de test à envoyer (défaut: 1000)"
+        )
+        parser.add_argument(
+            '--backend',
+            choices=sorted(BACKENDS),
+            default='locmem',
+            help="Backend email local à utiliser (défaut: locmem)"
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help="Emails traités par lot (défaut: MAIL_OUTBOX_BATCH_SIZE)"
+        )
+        parser.add_argument(
+            '--file-path',
+            default=None,
+            help="Dossier de sortie du backend file (défaut: dossier temporaire)"
+        )
+
+    def handle(self, *args, **options):
+        count = options['count']
+        backend_options = {}
+        if options['backend'] == 'file':
+            backend_options['file_path'] = options['file_path'] or tempfile.mkdtemp(prefix='outbox-benchmark-')
+        connection = get_connection(BACKENDS[options['backend']], **backend_options)
+
+        # Rows are inserted directly (not enqueued) so no real flush picks them up
+        prefix = f'benchmark:{uuid.uuid4().hex}'
+        OutboxEmail.objects.bulk_create([
+            OutboxEmail(
+                to_email=f'benchmark{i}@example.invalid',
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                subject=f'Benchmark {i}',
+                body='Message de test du benchmark de la file d\'envoi.',
+                html_body='<p>Message de test du benchmark de la file d\'envoi.</p>',
+                dedup_key=f'{prefix}:{i}'
+            )
+            for i in range(count)
+        ], batch_size=1000)
+        benchmark_rows = OutboxEmail.objects.filter(dedup_key__startswith=f'{prefix}:')
+
+        try:
+            started = time.perf_counter()
+            result = MailOutboxService.flush(
+                batch_size=options['batch_size'],
+                connection=connection,
+                queryset=benchmark_rows
+            )
+            elapsed = time.perf_counter() - started
+        finally:
+            benchmark_rows.delete()
+
+        rate = result['sent'] / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"{result['sent']} email(s) envoyé(s), {result['failed']} échec(s) "
+            f"en {elapsed:.2f}s ({rate:.0f} emails/s, backend {options['backend']})"
+        ))
+        if 'file_path' in backend_options:
+            self.stdout.write(f"Emails écrits dans {backend_options['file_path']}")
@@ -0,0 +1,37 @@
+"""
+Recompute the per-user unread counters from the Notification and Message tables.
+"""
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from apps.notifications.models import UnreadCounter
+
+
+class Command(BaseCommand):
+    help = "Recalcule les compteurs de notifications et messages non lus"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help="Nombre d'utilisateurs traités par lot (défaut: 1000)"
+        )
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        batch_size = options['batch_size']
+        checked = drifted = 0
+        last_pk = 0
+        while True:
+            ids = list(
+                User.objects.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            drifted += UnreadCounter.reconcile(User.objects.filter(pk__in=ids))
+            checked += len(ids)
+            last_pk = ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{checked} utilisateur(s) vérifié(s), {drifted} compteur(s) corrigé(s)"
+        ))
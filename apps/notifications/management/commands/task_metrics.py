@@ -0,0 +1,32 @@
+"""
+Show queue lag and retry counts of the Celery tasks queued from request handlers.
+"""
+from django.core.management.base import BaseCommand
+from core.tasks.metrics import MONITORED_TASKS, get_task_metrics, reset_task_metrics
+
+
+class Command(BaseCommand):
+    help = "Affiche le délai d'attente en file et les relances des tâches Celery"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'tasks',
+            nargs='*',
+            help="Noms complets des tâches (défaut: tâches d'emails de candidature)"
+        )
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help="Remet les compteurs à zéro après affichage"
+        )
+
+    def handle(self, *args, **options):
+        for task_name in options['tasks'] or MONITORED_TASKS:
+            metrics = get_task_metrics(task_name)
+            self.stdout.write(
+                f"{task_name}: {metrics['runs']} exécution(s), {metrics['retries']} relance(s), "
+                f"attente moy. {metrics['lag_avg']:.3f}s, max {metrics['lag_max']:.3f}s, "
+                f"dernière {metrics['lag_last']:.3f}s"
+            )
+            if options['reset']:
+                reset_task_metrics(task_name)
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_unreadcounter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='dedup_key',
+            field=models.CharField(blank=True, editable=False, max_length=150, null=True, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='notification_type',
+            field=models.CharField(choices=[('application_received', 'Candidature reçue'), ('application_accepted', 'Candidature acceptée'), ('application_rejected', 'Candidature refusée'), ('new_internship', 'Nouvelle offre de stage'), ('message_received', 'Nouveau message'), ('document_submitted', 'Document soumis'), ('document_approved', 'Document approuvé'), ('document_rejected', 'Document rejeté'), ('profile_verified', 'Profil vérifié'), ('profile_rejected', 'Profil rejeté'), ('profile_suspended', 'Profil suspendu'), ('profile_incomplete', 'Dossier incomplet'), ('calendar_reminder', 'Rappel de calendrier de stage'), ('system', 'Notification système')], default='system', max_length=50),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.11 on 2026-10-17 20:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_notification_dedup_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=150, unique=True)),
+                ('position', models.BigIntegerField(default=0)),
+                ('completed', models.BooleanField(default=False)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Point de reprise',
+                'verbose_name_plural': 'Points de reprise',
+            },
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='notification_type',
+            field=models.CharField(choices=[('application_received', 'Candidature reçue'), ('application_accepted', 'Candidature acceptée'), ('application_rejected', 'Candidature refusée'), ('new_internship', 'Nouvelle offre de stage'), ('message_received', 'Nouveau message'), ('document_submitted', 'Document soumis'), ('document_approved', 'Document approuvé'), ('document_rejected', 'Document rejeté'), ('document_expiring', 'Document bientôt expiré'), ('profile_verified', 'Profil vérifié'), ('profile_rejected', 'Profil rejeté'), ('profile_suspended', 'Profil suspendu'), ('profile_incomplete', 'Dossier incomplet'), ('calendar_reminder', 'Rappel de calendrier de stage'), ('system', 'Notification système')], default='system', max_length=50),
+        ),
+    ]
@@ -1,5 +1,16 @@
-from django.db import models
+from collections import Counter
+from itertools import islice
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Greatest
 from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+
+
+# Number of notification rows inserted per bulk_create round trip
+FAN_OUT_BATCH_SIZE = 500
 
 
 class Notification(models.Model):
@@ -15,10 +26,12 @@ class Notification(models.Model):
     DOCUMENT_SUBMITTED = 'document_submitted'
     DOCUMENT_APPROVED = 'document_approved'
     DOCUMENT_REJECTED = 'document_rejected'
+    DOCUMENT_EXPIRING = 'document_expiring'
     PROFILE_VERIFIED = 'profile_verified'
     PROFILE_REJECTED = 'profile_rejected'
     PROFILE_SUSPENDED = 'profile_suspended'
     PROFILE_INCOMPLETE = 'profile_incomplete'
+    CALENDAR_REMINDER = 'calendar_reminder'
     SYSTEM = 'system'
     
     NOTIFICATION_TYPES = [
@@ -30,10 +43,12 @@ class Notification(models.Model):
         (DOCUMENT_SUBMITTED, 'Document soumis'),
         (DOCUMENT_APPROVED, 'Document approuvé'),
         (DOCUMENT_REJECTED, 'Document rejeté'),
+        (DOCUMENT_EXPIRING, 'Document bientôt expiré'),
         (PROFILE_VERIFIED, 'Profil vérifié'),
         (PROFILE_REJECTED, 'Profil rejeté'),
         (PROFILE_SUSPENDED, 'Profil suspendu'),
         (PROFILE_INCOMPLETE, 'Dossier incomplet'),
+        (CALENDAR_REMINDER, 'Rappel de calendrier de stage'),
         (SYSTEM, 'Notification système'),
     ]
     
@@ -52,11 +67,17 @@ class Notification(models.Model):
     link = models.CharField(max_length=500, blank=True, null=True)
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Set by idempotent fan-outs (periodic jobs) so retries never duplicate a notification
+    dedup_key = models.CharField(max_length=150, unique=True, null=True, blank=True, editable=False)
     
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Notification'
         verbose_name_plural = 'Notifications'
+        indexes = [
+            # Notification list and unread filters of a recipient, newest first
+            models.Index(fields=['recipient', 'is_read', '-created_at'], name='notif_recipient_read_idx'),
+        ]
     
     def __str__(self):
         return f"{self.recipient.username}: {self.title}"
@@ -65,6 +86,7 @@ class Notification(models.Model):
         if not self.is_read:
             self.is_read = True
             self.save()
+            UnreadCounter.adjust([self.recipient_id], notifications=-1)
     
     @classmethod
     def create_notification(cls, recipient, notification_type, title, message, link=None):
@@ -79,9 +101,358 @@ class Notification(models.Model):
             link=link
         )
     
+    @classmethod
+    def fan_out(cls, recipients, notification_type, title, message, link=None,
+                batch_size=FAN_OUT_BATCH_SIZE, dedup_key=None):
+        """
+        Create the same notification for many recipients with chunked bulk_create.
+        
+        Args:
+            recipients: QuerySet of users, or iterable of users / user ids
+            batch_size: int, rows inserted per round trip
+            dedup_key: str, optional prefix making the fan-out idempotent:
+                each row gets "<dedup_key>:<recipient_id>" and recipients
+                that already have that key are skipped
+        
+        Returns:
+            int, number of notifications created
+        """
+        if isinstance(recipients, models.QuerySet):
+            recipient_ids = recipients.order_by().values_list('pk', flat=True).iterator(chunk_size=batch_size)
+        else:
+            # dict.fromkeys keeps the order while dropping duplicates
+            recipient_ids = iter(dict.fromkeys(
+                getattr(recipient, 'pk', recipient) for recipient in recipients
+            ))
+        
+        created = 0
+        while True:
+            chunk = list(islice(recipient_ids, batch_size))
+            if not chunk:
+                break
+            created += cls.bulk_notify([
+                cls(
+                    recipient_id=recipient_id,
+                    notification_type=notification_type,
+                    title=title,
+                    message=message,
+                    link=link,
+                    dedup_key=f'{dedup_key}:{recipient_id}' if dedup_key else None
+                )
+                for recipient_id in chunk
+            ])
+        return created
+    
+    @classmethod
+    def bulk_notify(cls, notifications):
+        """
+        Insert prepared (unsaved) notifications in one bulk_create.
+        
+        Notifications whose dedup_key already exists are skipped, and the
+        unread counters of the recipients are bumped (bulk_create does
+        not send post_save).
+        
+        Returns:
+            int, number of notifications inserted
+        """
+        return len(cls.bulk_notify_new(notifications))
+    
+    @classmethod
+    def bulk_notify_new(cls, notifications):
+        """
+        Same as bulk_notify, returning the notifications that were inserted.
+        
+        Returns:
+            list of Notification (those whose dedup_key did not exist yet),
+            exact even when a concurrent run inserts the same keys
+        """
+        keys = [notification.dedup_key for notification in notifications if notification.dedup_key]
+        if keys:
+            existing = cls.existing_dedup_keys(keys)
+            notifications = [
+                notification for notification in notifications
+                if notification.dedup_key not in existing
+            ]
+        if not notifications:
+            return []
+        
+        if not keys:
+            cls.objects.bulk_create(notifications)
+        else:
+            try:
+                with transaction.atomic():
+                    cls.objects.bulk_create(notifications)
+            except IntegrityError:
+                # A concurrent run inserted some of the keys since the check:
+                # insert row by row to know which ones are really new
+                notifications = [
+                    notification for notification in notifications
+                    if cls._insert_unless_duplicate(notification)
+                ]
+        
+        # Group recipients by how many notifications they got: one UPDATE per group
+        per_recipient = Counter(notification.recipient_id for notification in notifications)
+        by_count = {}
+        for recipient_id, count in per_recipient.items():
+            by_count.setdefault(count, []).append(recipient_id)
+        for count, recipient_ids in by_count.items():
+            UnreadCounter.adjust(recipient_ids, notifications=count)
+        return notifications
+    
+    @classmethod
+    def existing_dedup_keys(cls, keys):
+        """Return the set of the given dedup keys already used by a notification."""
+        return set(cls.objects.filter(dedup_key__in=keys).values_list('dedup_key', flat=True))
+    
+    @classmethod
+    def _insert_unless_duplicate(cls, notification):
+        try:
+            with transaction.atomic():
+                cls.objects.bulk_create([notification])
+        except IntegrityError:
+            if not notification.dedup_key or not cls.objects.filter(dedup_key=notification.dedup_key).exists():
+                raise
+            return False
+        return True
+    
     @classmethod
     def get_unread_count(cls, user):
         """
         Get count of unread notifications for a user.
         """
-        return cls.objects.filter(recipient=user, is_read=False).count()
+        return UnreadCounter.get_counts(user)['notifications']
+
+
+class UnreadCounter(models.Model):
+    """
+    Denormalized per-user unread counters (notifications and messages).
+
+    Kept current with atomic F() increments when notifications/messages
+    are created or read, so the navbar badges are a primary-key lookup
+    instead of a COUNT. A row is built from the source tables the first
+    time a user is looked up, and `reconcile` recomputes rows on demand.
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='unread_counter'
+    )
+    notifications = models.PositiveIntegerField(default=0)
+    messages = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = 'Compteur non lus'
+        verbose_name_plural = 'Compteurs non lus'
+    
+    def __str__(self):
+        return f"{self.user_id}: {self.notifications} notification(s), {self.messages} message(s)"
+    
+    # Read by the navbar badges on most requests
+    CACHE_ALIAS = 'hot'
+    
+    @staticmethod
+    def cache_key(user_id):
+        return f'unread_counter:{user_id}'
+    
+    @classmethod
+    def get_counts(cls, user):
+        """
+        Return {'notifications': int, 'messages': int} for a user.
+        Reads the cache mirror first, then the counter row.
+        """
+        timeout = getattr(settings, 'UNREAD_COUNTER_CACHE_TIMEOUT', 300)
+        key = cls.cache_key(user.pk)
+        cache = caches[cls.CACHE_ALIAS]
+        if timeout:
+            counts = cache.get(key)
+            if counts is not None:
+                return counts
+        
+        counter = cls.objects.filter(user_id=user.pk).values('notifications', 'messages').first()
+        if counter is None:
+            counter = cls._build(user.pk)
+        counts = {'notifications': counter['notifications'], 'messages': counter['messages']}
+        if timeout:
+            cache.set(key, counts, timeout)
+        return counts
+    
+    @classmethod
+    def adjust(cls, user_ids, notifications=0, messages=0):
+        """
+        Atomically add deltas to the counters of the given users.
+        
+        Users without a counter row are skipped: their row is computed
+        from the source tables on first read, which already includes
+        the change being recorded here.
+        """
+        user_ids = [user_id for user_id in user_ids if user_id]
+        if not user_ids or not (notifications or messages):
+            return 0
+        
+        changes = {}
+        if notifications:
+            changes['notifications'] = Greatest(F('notifications') + notifications, 0)
+        if messages:
+            changes['messages'] = Greatest(F('messages') + messages, 0)
+        updated = cls.objects.filter(user_id__in=user_ids).update(**changes)
+        cls.invalidate(user_ids)
+        return updated
+    
+    @classmethod
+    def invalidate(cls, user_ids):
+        """
+        Drop the cache mirror of the given users, now and again once the
+        transaction commits (a concurrent reader may have cached the
+        pre-commit value in between).
+        """
+        keys = [cls.cache_key(user_id) for user_id in user_ids]
+        cache = caches[cls.CACHE_ALIAS]
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
+    
+    @classmethod
+    def compute(cls, users):
+        """
+        Compute unread counts from the source tables.
+        
+        Args:
+            users: CustomUser QuerySet
+        
+        Returns:
+            dict {user_id: (notifications, messages)}
+        """
+        from apps.messaging.models import Message
+        
+        unread_messages = Message.objects.filter(
+            conversation__participants=OuterRef('pk'),
+            is_read=False
+        ).exclude(sender=OuterRef('pk')).order_by().values(
+            'conversation__participants'
+        ).annotate(total=Count('pk')).values('total')
+        
+        rows = users.order_by().annotate(
+            unread_notifications=Count('notifications', filter=Q(notifications__is_read=False)),
+            unread_messages=Coalesce(Subquery(unread_messages), 0),
+        ).values_list('pk', 'unread_notifications', 'unread_messages')
+        return {pk: (notifs, msgs) for pk, notifs, msgs in rows}
+    
+    @classmethod
+    def reconcile(cls, users):
+        """
+        Recompute the counters of `users` from the source tables.
+        
+        Returns:
+            int, number of counters that had drifted (or were missing)
+        """
+        computed = cls.compute(users)
+        existing = {
+            counter.user_id: counter
+            for counter in cls.objects.filter(user_id__in=computed.keys())
+        }
+        
+        to_create, to_update = [], []
+        for user_id, (notifications, messages) in computed.items():
+            counter = existing.get(user_id)
+            if counter is None:
+                to_create.append(cls(user_id=user_id, notifications=notifications, messages=messages))
+            elif (counter.notifications, counter.messages) != (notifications, messages):
+                counter.notifications = notifications
+                counter.messages = messages
+                to_update.append(counter)
+        
+        cls.objects.bulk_create(to_create, ignore_conflicts=True)
+        cls.objects.bulk_update(to_update, ['notifications', 'messages'])
+        cls.invalidate(computed.keys())
+        return len(to_create) + len(to_update)
+    
+    @classmethod
+    def _build(cls, user_id):
+        from django.contrib.auth import get_user_model
+        
+        users = get_user_model().objects.filter(pk=user_id)
+        notifications, messages = cls.compute(users).get(user_id, (0, 0))
+        counter, _ = cls.objects.get_or_create(
+            user_id=user_id,
+            defaults={'notifications': notifications, 'messages': messages}
+        )
+        return {'notifications': counter.notifications, 'messages': counter.messages}
+
+
+class TaskCheckpoint(models.Model):
+    """
+    Progress marker of a long-running periodic task.
+
+    Chunked tasks store the last processed primary key under a key of
+    their run (e.g. "check_document_expiry:2026-10-17:<run id>"), which an
+    interrupted task passes on to the task it re-enqueues so that one
+    resumes where the previous one left off.
+    """
+    key = models.CharField(max_length=150, unique=True)
+    position = models.BigIntegerField(default=0)
+    completed = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = 'Point de reprise'
+        verbose_name_plural = 'Points de reprise'
+    
+    def __str__(self):
+        return f"{self.key} @ {self.position}"
+    
+    @classmethod
+    def load(cls, key):
+        checkpoint, _ = cls.objects.get_or_create(key=key)
+        return checkpoint
+    
+    def advance(self, position):
+        self.position = position
+        self.save(update_fields=['position', 'updated_at'])
+    
+    def finish(self):
+        self.completed = True
+        self.save(update_fields=['completed', 'updated_at'])
+
+
+class OutboxEmail(models.Model):
+    """
+    Rendered email waiting to be delivered by the outbox flusher.
+
+    One row per recipient: the dedup_key (suffixed with the recipient
+    address) makes enqueuing the same email twice a no-op, and failed
+    deliveries are retried with exponential backoff via next_attempt_at.
+    """
+    PENDING = 'pending'
+    SENT = 'sent'
+    FAILED = 'failed'
+    
+    STATUS_CHOICES = [
+        (PENDING, 'En attente'),
+        (SENT, 'Envoyé'),
+        (FAILED, 'Échec définitif'),
+    ]
+    
+    to_email = models.EmailField()
+    from_email = models.CharField(max_length=254)
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    html_body = models.TextField(blank=True)
+    dedup_key = models.CharField(max_length=255, unique=True, null=True, blank=True, editable=False)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['pk']
+        verbose_name = 'Email en file d\'attente'
+        verbose_name_plural = 'Emails en file d\'attente'
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='outbox_due_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.subject} → {self.to_email} ({self.status})"
@@ -0,0 +1,25 @@
+"""
+Django Signals keeping the per-user unread counters current
+"""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from apps.messaging.models import Message
+from apps.notifications.models import Notification, UnreadCounter
+
+
+@receiver(post_save, sender=Notification)
+def count_new_notification(sender, instance, created, **kwargs):
+    """
+    Increment the recipient's unread notification counter.
+    """
+    if created and not instance.is_read:
+        UnreadCounter.adjust([instance.recipient_id], notifications=1)
+
+
+@receiver(post_save, sender=Message)
+def count_new_message(sender, instance, created, **kwargs):
+    """
+    Increment the unread message counter of every other participant.
+    """
+    if created and not instance.is_read:
+        UnreadCounter.adjust(instance.get_recipient_ids(), messages=1)
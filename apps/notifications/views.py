@@ -4,17 +4,20 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
 from django.utils.timesince import timesince
-from .models import Notification
+from core.pagination import NO_COUNT, CheapCountMixin
+from .models import Notification, UnreadCounter
 
 
-class NotificationListView(LoginRequiredMixin, ListView):
+class NotificationListView(LoginRequiredMixin, CheapCountMixin, ListView):
     """
     List all notifications for the current user.
+    Pages only link to the previous and next ones: no count of the feed.
     """
     model = Notification
     template_name = 'notifications/notification_list.html'
     context_object_name = 'notifications'
     paginate_by = 20
+    count_mode = NO_COUNT
     
     def get_queryset(self):
         return Notification.objects.filter(recipient=self.request.user)
@@ -53,10 +56,12 @@ class NotificationMarkAllReadView(LoginRequiredMixin, View):
     Mark all notifications as read for the current user.
     """
     def post(self, request):
-        Notification.objects.filter(
+        marked = Notification.objects.filter(
             recipient=request.user, 
             is_read=False
         ).update(is_read=True)
+        if marked:
+            UnreadCounter.adjust([request.user.pk], notifications=-marked)
         return JsonResponse({'success': True})
 
 
@@ -79,5 +84,8 @@ class NotificationDeleteView(LoginRequiredMixin, View):
             pk=pk, 
             recipient=request.user
         )
+        was_unread = not notification.is_read
         notification.delete()
+        if was_unread:
+            UnreadCounter.adjust([request.user.pk], notifications=-1)
         return JsonResponse({'success': True})
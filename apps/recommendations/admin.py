@@ -1,5 +1,5 @@
 from django.contrib import admin
-from apps.recommendations.models import InternRecommendation
+from apps.recommendations.models import InternRecommendation, RecommendationSummary
 
 
 @admin.register(InternRecommendation)
@@ -44,3 +44,16 @@ class InternRecommendationAdmin(admin.ModelAdmin):
         return super().get_queryset(request).select_related(
             'company', 'student', 'internship'
         )
+
+
+@admin.register(RecommendationSummary)
+class RecommendationSummaryAdmin(admin.ModelAdmin):
+    """Admin interface for RecommendationSummary model (maintained by signals)."""
+    
+    list_display = ['student', 'updated_at']
+    search_fields = ['student__user__first_name', 'student__user__last_name']
+    readonly_fields = ['student', 'updated_at']
+    
+    def get_queryset(self, request):
+        """Optimize queryset with select_related."""
+        return super().get_queryset(request).select_related('student__user')
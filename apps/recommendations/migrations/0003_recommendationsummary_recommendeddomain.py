@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:23
+
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def build_summaries(apps, schema_editor):
+    """Compute the summary of every recommended student."""
+    InternRecommendation = apps.get_model('recommendations', 'InternRecommendation')
+    RecommendationSummary = apps.get_model('recommendations', 'RecommendationSummary')
+    RecommendedDomain = apps.get_model('recommendations', 'RecommendedDomain')
+
+    totals = InternRecommendation.objects.values('student_id').annotate(
+        count=Count('pk'), total=Sum('rating')
+    ).order_by()
+    RecommendationSummary.objects.bulk_create([
+        RecommendationSummary(
+            student_id=row['student_id'],
+            recommendation_count=row['count'],
+            rating_sum=row['total'] or 0,
+            avg_rating=(Decimal(row['total'] or 0) / row['count']).quantize(Decimal('0.01')),
+        )
+        for row in totals
+    ], batch_size=500)
+
+    domains = set()
+    for student_id, recommended_domains in InternRecommendation.objects.values_list('student_id', 'recommended_domains').iterator():
+        domains.update((student_id, str(domain)[:200]) for domain in recommended_domains or [] if domain)
+    RecommendedDomain.objects.bulk_create([
+        RecommendedDomain(summary_id=student_id, domain=domain) for student_id, domain in domains
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommendations', '0002_internrecommendation_rec_rating_idx_and_more'),
+        ('users', '0010_alter_userdocument_document_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecommendationSummary',
+            fields=[
+                ('student', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='recommendation_summary', serialize=False, to='users.studentprofile')),
+                ('recommendation_count', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.PositiveIntegerField(default=0)),
+                ('avg_rating', models.DecimalField(decimal_places=2, default=0, max_digits=3)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Synthèse des recommandations',
+                'verbose_name_plural': 'Synthèses des recommandations',
+                'indexes': [
+                    models.Index(fields=['-recommendation_count', '-avg_rating'], name='rec_summary_rank_idx'),
+                    models.Index(fields=['avg_rating'], name='rec_summary_rating_idx'),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name='RecommendedDomain',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('domain', models.CharField(max_length=200)),
+                ('summary', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='domains', to='recommendations.recommendationsummary')),
+            ],
+            options={
+                'verbose_name': 'Domaine recommandé',
+                'verbose_name_plural': 'Domaines recommandés',
+                'indexes': [models.Index(fields=['domain', 'summary'], name='rec_domain_idx')],
+                'constraints': [models.UniqueConstraint(fields=('summary', 'domain'), name='unique_recommended_domain')],
+            },
+        ),
+        migrations.RunPython(build_summaries, migrations.RunPython.noop),
+    ]
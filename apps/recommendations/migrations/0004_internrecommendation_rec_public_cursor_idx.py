@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommendations', '0003_recommendationsummary_recommendeddomain'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='internrecommendation',
+            index=models.Index(fields=['is_public', '-rating', '-created_at', '-id'], name='rec_public_cursor_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommendations', '0004_internrecommendation_rec_public_cursor_idx'),
+        ('users', '0014_studentprofile_recommendation_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='recommendationsummary',
+            name='rec_summary_rank_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='recommendationsummary',
+            name='rec_summary_rating_idx',
+        ),
+        migrations.RemoveField(
+            model_name='recommendationsummary',
+            name='avg_rating',
+        ),
+        migrations.RemoveField(
+            model_name='recommendationsummary',
+            name='rating_sum',
+        ),
+        migrations.RemoveField(
+            model_name='recommendationsummary',
+            name='recommendation_count',
+        ),
+    ]
@@ -1,8 +1,13 @@
-from django.db import models
+from django.db import models, transaction
 
+from core.field_tracking import FieldTrackingMixin
 
-class InternRecommendation(models.Model):
+
+class InternRecommendation(FieldTrackingMixin, models.Model):
     """Recommandation d'un stagiaire par une entreprise"""
+    # Valeurs chargées, pour mettre à jour les agrégats du profil étudiant
+    tracked_fields = ('student', 'rating')
+    
     RATING_CHOICES = [(i, f"{i} étoile{'s' if i > 1 else ''}") for i in range(1, 6)]
     
     # Relations
@@ -59,7 +64,82 @@ class InternRecommendation(models.Model):
             models.Index(fields=['is_public'], name='rec_public_idx'),
             models.Index(fields=['is_featured'], name='rec_featured_idx'),
             models.Index(fields=['-created_at'], name='rec_created_idx'),
+            # Keyset pagination of RecommendedStudentsView
+            models.Index(fields=['is_public', '-rating', '-created_at', '-id'], name='rec_public_cursor_idx'),
         ]
     
     def __str__(self):
         return f"Recommandation de {self.company} pour {self.student}"
+
+
+class RecommendationSummary(models.Model):
+    """
+    Domaines recommandés à un étudiant.
+
+    Tenu à jour par les signaux de InternRecommendation
+    (apps/recommendations/signals.py) : le filtre par secteur des étudiants
+    recommandés lit cette table au lieu de parcourir les recommandations.
+    Le nombre de recommandations et la note moyenne sont sur StudentProfile
+    (adjust_recommendation_stats).
+    """
+    student = models.OneToOneField(
+        'users.StudentProfile',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='recommendation_summary'
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Synthèse des recommandations"
+        verbose_name_plural = "Synthèses des recommandations"
+
+    def __str__(self):
+        return f"{self.student} : {self.domains.count()} domaine(s)"
+
+    @classmethod
+    def refresh(cls, student_id):
+        """
+        Recompute the recommended domains of one student from their recommendations.
+
+        The summary row is locked first, so concurrent recommendations for
+        the same student are applied one after the other.
+        """
+        with transaction.atomic():
+            summary, _ = cls.objects.get_or_create(student_id=student_id)
+            summary = cls.objects.select_for_update().get(pk=summary.pk)
+            summary.save()
+
+            domains = set()
+            recommendations = InternRecommendation.objects.filter(student_id=student_id)
+            for recommended_domains in recommendations.values_list('recommended_domains', flat=True):
+                domains.update(str(domain)[:200] for domain in recommended_domains or [] if domain)
+            stored = set(summary.domains.values_list('domain', flat=True))
+            summary.domains.filter(domain__in=stored - domains).delete()
+            RecommendedDomain.objects.bulk_create(
+                [RecommendedDomain(summary=summary, domain=domain) for domain in domains - stored]
+            )
+        return summary
+
+
+class RecommendedDomain(models.Model):
+    """Domaine recommandé au moins une fois pour un étudiant (index des filtres par secteur)"""
+    summary = models.ForeignKey(
+        RecommendationSummary,
+        on_delete=models.CASCADE,
+        related_name='domains'
+    )
+    domain = models.CharField(max_length=200)
+
+    class Meta:
+        verbose_name = "Domaine recommandé"
+        verbose_name_plural = "Domaines recommandés"
+        constraints = [
+            models.UniqueConstraint(fields=['summary', 'domain'], name='unique_recommended_domain'),
+        ]
+        indexes = [
+            models.Index(fields=['domain', 'summary'], name='rec_domain_idx'),
+        ]
+
+    def __str__(self):
+        return self.domain
@@ -0,0 +1,73 @@
+"""
+Django Signals keeping the recommended domains, the student profile
+rating aggregates and the cached recommended students lists current
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from apps.recommendations.models import InternRecommendation, RecommendationSummary
+from apps.users.profile_models import StudentProfile
+from core.services.recommendation_service import RecommendationService
+
+
+@receiver(post_save, sender=InternRecommendation)
+def refresh_summary_on_save(sender, instance, **kwargs):
+    RecommendationSummary.refresh(instance.student_id)
+    previous = instance.get_loaded_value('student')
+    if previous is not None and previous != instance.student_id:
+        RecommendationSummary.refresh(previous)
+
+
+@receiver(post_delete, sender=InternRecommendation)
+def refresh_summary_on_delete(sender, instance, **kwargs):
+    # The student may be the object being deleted (cascade)
+    if StudentProfile.objects.filter(pk=instance.student_id).exists():
+        RecommendationSummary.refresh(instance.student_id)
+
+
+@receiver([post_save, post_delete], sender=InternRecommendation)
+def invalidate_recommended_students(sender, **kwargs):
+    RecommendationService.invalidate_cache()
+
+
+@receiver(post_save, sender=InternRecommendation)
+def adjust_rating_stats_on_save(sender, instance, created, **kwargs):
+    """
+    Bump the profile aggregates by the difference with the loaded values.
+    
+    Only the fields written by the save count: a partial save leaves the
+    others as they are in the database, whatever the instance holds.
+    """
+    if created:
+        StudentProfile.adjust_recommendation_stats(instance.student_id, 1, instance.rating)
+        return
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and not update_fields & {'student', 'student_id', 'rating'}:
+        return
+    if not (instance.is_loaded('student') and instance.is_loaded('rating')):
+        # Previous values unknown: leave it to the periodic reconciliation
+        return
+    
+    previous_student = instance.get_loaded_value('student')
+    previous_rating = instance.get_loaded_value('rating')
+    student = instance.student_id
+    rating = instance.rating
+    if update_fields is not None:
+        if not update_fields & {'student', 'student_id'}:
+            student = previous_student
+        if 'rating' not in update_fields:
+            rating = previous_rating
+    if previous_student != student:
+        StudentProfile.adjust_recommendation_stats(previous_student, -1, -previous_rating)
+        StudentProfile.adjust_recommendation_stats(student, 1, rating)
+    else:
+        StudentProfile.adjust_recommendation_stats(student, 0, rating - previous_rating)
+
+
+@receiver(post_delete, sender=InternRecommendation)
+def adjust_rating_stats_on_delete(sender, instance, **kwargs):
+    # The row holds the loaded values, not unsaved changes of the instance
+    StudentProfile.adjust_recommendation_stats(
+        instance.get_loaded_value('student', instance.student_id),
+        -1,
+        -instance.get_loaded_value('rating', instance.rating)
+    )
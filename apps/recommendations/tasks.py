@@ -0,0 +1,17 @@
+"""
+Recommendation-related Celery tasks.
+"""
+from celery import shared_task
+
+
+@shared_task
+def reconcile_recommendation_stats():
+    """
+    Recompute the student profile rating aggregates from the recommendations.
+    Catches drift from queryset.update()/bulk writes, which send no signals.
+    """
+    from apps.users.profile_models import StudentProfile
+    
+    fixed = StudentProfile.reconcile_recommendation_stats()
+    
+    return f"Reconciled {fixed} student profiles"
@@ -0,0 +1,27 @@
+"""
+Django Signals purging the cached housing, carpooling and forum pages
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from apps.services.models import CarpoolingOffer, ForumComment, ForumPost, HousingOffer
+from core.cache import invalidate_tags
+from core.response_cache import CARPOOLING_TAG, FORUM_TAG, HOUSING_TAG
+
+
+@receiver([post_save, post_delete], sender=HousingOffer)
+def purge_housing_pages(sender, **kwargs):
+    invalidate_tags(HOUSING_TAG)
+
+
+@receiver([post_save, post_delete], sender=CarpoolingOffer)
+def purge_carpooling_pages(sender, **kwargs):
+    invalidate_tags(CARPOOLING_TAG)
+
+
+@receiver([post_save, post_delete], sender=ForumPost)
+@receiver([post_save, post_delete], sender=ForumComment)
+def purge_forum_pages(sender, **kwargs):
+    """
+    The forum list shows the comment count of each post.
+    """
+    invalidate_tags(FORUM_TAG)
@@ -3,16 +3,18 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.urls import reverse, reverse_lazy
 from django.shortcuts import get_object_or_404, redirect
 from django.contrib import messages
+from core.response_cache import CARPOOLING_TAG, FORUM_TAG, HOUSING_TAG, CachedResponseMixin
 from .models import HousingOffer, HousingApplication, CarpoolingOffer, ForumPost, ForumComment
 
 # ... (Existing Views: Housing, Transport, Forum) ...
 
 # Housing Views
-class HousingListView(ListView):
+class HousingListView(CachedResponseMixin, ListView):
     model = HousingOffer
     template_name = 'services/housing_list.html'
     context_object_name = 'housing_offers'
     ordering = ['-created_at']
+    response_cache_tags = (HOUSING_TAG,)
 
 class HousingDetailView(DetailView):
     model = HousingOffer
@@ -76,11 +78,12 @@ class HousingCreateView(LoginRequiredMixin, CreateView):
         return super().form_valid(form)
 
 # Transport Views
-class CarpoolingListView(ListView):
+class CarpoolingListView(CachedResponseMixin, ListView):
     model = CarpoolingOffer
     template_name = 'services/transport_list.html'
     context_object_name = 'carpooling_offers'
     ordering = ['date_time']
+    response_cache_tags = (CARPOOLING_TAG,)
 
 class CarpoolingCreateView(LoginRequiredMixin, CreateView):
     model = CarpoolingOffer
@@ -93,11 +96,12 @@ class CarpoolingCreateView(LoginRequiredMixin, CreateView):
         return super().form_valid(form)
 
 # Forum Views
-class ForumPostListView(ListView):
+class ForumPostListView(CachedResponseMixin, ListView):
     model = ForumPost
     template_name = 'services/forum_list.html'
     context_object_name = 'posts'
     ordering = ['-created_at']
+    response_cache_tags = (FORUM_TAG,)
 
 class ForumPostCreateView(LoginRequiredMixin, CreateView):
     model = ForumPost
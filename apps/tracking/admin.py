@@ -1,5 +1,5 @@
 from django.contrib import admin
-from apps.tracking.models import StudentEvolutionTracking
+from apps.tracking.models import EvolutionEvent, StudentEvolutionTracking
 
 
 @admin.register(StudentEvolutionTracking)
@@ -43,3 +43,18 @@ class StudentEvolutionTrackingAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """Optimize queryset with select_related."""
         return super().get_queryset(request).select_related('company', 'student')
+
+
+@admin.register(EvolutionEvent)
+class EvolutionEventAdmin(admin.ModelAdmin):
+    """Admin interface for EvolutionEvent model (append-only history)."""
+    
+    list_display = ['id', 'student', 'tracking', 'created_at']
+    list_filter = ['created_at']
+    search_fields = ['student__first_name', 'student__last_name']
+    raw_id_fields = ['tracking', 'student']
+    readonly_fields = ['created_at']
+    
+    def get_queryset(self, request):
+        """Optimize queryset with select_related."""
+        return super().get_queryset(request).select_related('student', 'tracking')
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:17
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.utils.dateparse import parse_datetime
+
+
+def copy_evolution_history(apps, schema_editor):
+    """Move the evolution_history JSON entries into EvolutionEvent rows."""
+    StudentEvolutionTracking = apps.get_model('tracking', 'StudentEvolutionTracking')
+    EvolutionEvent = apps.get_model('tracking', 'EvolutionEvent')
+
+    for tracking in StudentEvolutionTracking.objects.exclude(evolution_history=[]).iterator():
+        events = []
+        for entry in tracking.evolution_history or []:
+            if not isinstance(entry, dict):
+                continue
+            created_at = parse_datetime(str(entry.get('date', ''))) or tracking.updated_at
+            events.append(EvolutionEvent(
+                tracking_id=tracking.pk,
+                student_id=tracking.student_id,
+                changes=entry.get('changes', []),
+                created_at=created_at,
+            ))
+        if events:
+            EvolutionEvent.objects.bulk_create(events)
+            StudentEvolutionTracking.objects.filter(pk=tracking.pk).update(
+                last_event=EvolutionEvent.objects.filter(tracking_id=tracking.pk)
+                .order_by('-created_at', '-pk').values('pk')[:1]
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracking', '0005_internshiptracking_teacher'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EvolutionEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('changes', models.JSONField(default=list)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='evolution_events', to=settings.AUTH_USER_MODEL)),
+                ('tracking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='events', to='tracking.studentevolutiontracking')),
+            ],
+            options={
+                'verbose_name': "Événement d'évolution",
+                'verbose_name_plural': "Événements d'évolution",
+                'ordering': ['created_at', 'pk'],
+                'indexes': [models.Index(fields=['student', 'created_at'], name='evolution_student_created_idx')],
+            },
+        ),
+        migrations.AddField(
+            model_name='studentevolutiontracking',
+            name='last_event',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='tracking.evolutionevent'),
+        ),
+        migrations.RunPython(copy_evolution_history, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='studentevolutiontracking',
+            name='evolution_history',
+        ),
+    ]
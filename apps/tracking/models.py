@@ -169,8 +169,14 @@ class StudentEvolutionTracking(models.Model):
         default='AVAILABLE'
     )
     
-    # Historique
-    evolution_history = models.JSONField(default=list)  # Historique des changements
+    # Dernier changement (historique complet : EvolutionEvent)
+    last_event = models.ForeignKey(
+        'EvolutionEvent',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+'
+    )
     
     # Notifications
     notify_on_level_change = models.BooleanField(default=True)
@@ -194,3 +200,39 @@ class StudentEvolutionTracking(models.Model):
     
     def __str__(self):
         return f"{self.company.company_name} tracking {self.student.first_name} {self.student.last_name}"
+    
+    @property
+    def evolution_history(self):
+        """Historique des changements, du plus ancien au plus récent"""
+        return [
+            {'date': event.created_at.isoformat(), 'changes': event.changes}
+            for event in self.events.all()
+        ]
+
+
+class EvolutionEvent(models.Model):
+    """Changement d'évolution d'un étudiant enregistré pour un suivi (ajout seul)"""
+    
+    tracking = models.ForeignKey(
+        StudentEvolutionTracking,
+        on_delete=models.CASCADE,
+        related_name='events'
+    )
+    student = models.ForeignKey(
+        CustomUser,
+        on_delete=models.CASCADE,
+        related_name='evolution_events'
+    )
+    changes = models.JSONField(default=list)  # Ex: ["Niveau: BEGINNER → ADVANCED"]
+    created_at = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        verbose_name = "Événement d'évolution"
+        verbose_name_plural = "Événements d'évolution"
+        ordering = ['created_at', 'pk']
+        indexes = [
+            models.Index(fields=['student', 'created_at'], name='evolution_student_created_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.student} - {', '.join(self.changes)}"
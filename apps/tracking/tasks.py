@@ -0,0 +1,30 @@
+"""
+Tracking-related Celery tasks.
+"""
+from celery import shared_task
+
+
+@shared_task
+def update_student_evolution(student_id, new_level=None, new_domain=None, new_status=None):
+    """
+    Propagate a student's profile changes to the companies tracking them.
+    
+    Args:
+        student_id: ID of the student CustomUser
+        new_level, new_domain, new_status: Current profile values
+    """
+    from apps.users.models import CustomUser
+    from core.services.evolution_service import StudentEvolutionService
+    
+    student = CustomUser.objects.filter(pk=student_id).first()
+    if student is None:
+        return f"Student {student_id} not found"
+    
+    updated = StudentEvolutionService.update_student_evolution(
+        student,
+        new_level=new_level,
+        new_domain=new_domain,
+        new_status=new_status,
+    )
+    
+    return f"Updated {len(updated)} trackings"
@@ -105,7 +105,7 @@ class StudentProfileAdmin(admin.ModelAdmin):
     list_display = ('user', 'school', 'current_level', 'field_of_study', 'status', 'looking_for_internship', 'total_recommendations')
     list_filter = ('status', 'looking_for_internship', 'school')
     search_fields = ('user__email', 'user__first_name', 'user__last_name', 'school', 'field_of_study')
-    readonly_fields = ('total_recommendations', 'average_recommendation_rating', 'created_at', 'updated_at')
+    readonly_fields = ('total_recommendations', 'recommendation_rating_sum', 'average_recommendation_rating', 'created_at', 'updated_at')
     ordering = ('-created_at',)
     
     fieldsets = (
@@ -122,7 +122,7 @@ class StudentProfileAdmin(admin.ModelAdmin):
             'fields': ('skills', 'languages', 'portfolio_url', 'cv')
         }),
         ('Statistiques de recommandation', {
-            'fields': ('total_recommendations', 'average_recommendation_rating'),
+            'fields': ('total_recommendations', 'recommendation_rating_sum', 'average_recommendation_rating'),
             'classes': ('collapse',)
         }),
         ('Métadonnées', {
@@ -131,6 +131,14 @@ class StudentProfileAdmin(admin.ModelAdmin):
         }),
     )
 
+    def save_model(self, request, obj, form, change):
+        # The recommendation aggregates are written with F() updates only:
+        # save the edited fields so a page opened earlier never rolls them back
+        if change:
+            obj.save(update_fields=[*form.changed_data, 'updated_at'])
+        else:
+            obj.save()
+
 
 @admin.register(SchoolProfile)
 class SchoolProfileAdmin(admin.ModelAdmin):
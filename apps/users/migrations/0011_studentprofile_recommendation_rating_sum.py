@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:40
+
+from decimal import Decimal
+
+import django.core.validators
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def compute_recommendation_stats(apps, schema_editor):
+    """Fill the rating sum, count and average from the recommendations."""
+    StudentProfile = apps.get_model('users', 'StudentProfile')
+    InternRecommendation = apps.get_model('recommendations', 'InternRecommendation')
+
+    profiles = []
+    for row in InternRecommendation.objects.values('student_id').annotate(count=Count('pk'), total=Sum('rating')).order_by():
+        profiles.append(StudentProfile(
+            pk=row['student_id'],
+            total_recommendations=row['count'],
+            recommendation_rating_sum=row['total'] or 0,
+            average_recommendation_rating=(Decimal(row['total'] or 0) / row['count']).quantize(Decimal('0.01')),
+        ))
+    StudentProfile.objects.bulk_update(
+        profiles,
+        ['total_recommendations', 'recommendation_rating_sum', 'average_recommendation_rating'],
+        batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0010_alter_userdocument_document_type'),
+        ('recommendations', '0002_internrecommendation_rec_rating_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentprofile',
+            name='recommendation_rating_sum',
+            field=models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name='Somme des notes de recommandation'),
+        ),
+        migrations.RunPython(compute_recommendation_stats, migrations.RunPython.noop),
+    ]
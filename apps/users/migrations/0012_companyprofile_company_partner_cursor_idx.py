@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0011_studentprofile_recommendation_rating_sum'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='companyprofile',
+            index=models.Index(fields=['is_partner', 'is_visible_on_partners_page', '-partner_since', '-id'], name='company_partner_cursor_idx'),
+        ),
+    ]
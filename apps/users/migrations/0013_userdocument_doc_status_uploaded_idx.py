@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0012_companyprofile_company_partner_cursor_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userdocument',
+            index=models.Index(fields=['status', '-uploaded_at'], name='doc_status_uploaded_idx'),
+        ),
+    ]
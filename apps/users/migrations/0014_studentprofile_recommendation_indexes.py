@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:20
+
+from django.db import migrations, models
+from django.db.models import Case, F, FloatField, Value, When
+from django.db.models.functions import Cast, Round
+from django.db.models.lookups import GreaterThan
+
+
+def round_averages(apps, schema_editor):
+    """Recompute the averages with the database rounding used by the F() updates."""
+    StudentProfile = apps.get_model('users', 'StudentProfile')
+    count, rating_sum = F('total_recommendations'), F('recommendation_rating_sum')
+    StudentProfile.objects.update(average_recommendation_rating=Case(
+        When(GreaterThan(count, 0), then=Round(Cast(rating_sum, FloatField()) / count, 2)),
+        default=Value(0.0),
+        output_field=FloatField(),
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0013_userdocument_doc_status_uploaded_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='studentprofile',
+            index=models.Index(fields=['-total_recommendations', '-average_recommendation_rating'], name='student_rec_rank_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentprofile',
+            index=models.Index(fields=['average_recommendation_rating'], name='student_rec_rating_idx'),
+        ),
+        migrations.RunPython(round_averages, migrations.RunPython.noop),
+    ]
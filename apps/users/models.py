@@ -2,6 +2,8 @@ from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from core.field_tracking import FieldTrackingMixin
+
 # Import profile models to ensure they're registered
 from .profile_models import (
     CompanyProfile,
@@ -18,11 +20,14 @@ from .profile_models import (
 from .models_documents import UserDocument
 
 
-class CustomUser(AbstractUser):
+class CustomUser(FieldTrackingMixin, AbstractUser):
     """
     Custom user model for Yana Pratique.
     Extended with comprehensive profile information.
     """
+    # Loaded values kept for change detection in signals (notifications, status counts)
+    tracked_fields = ('verification_status', 'user_type')
+    
     email = models.EmailField(_('email address'), unique=True)
     
     # User Types
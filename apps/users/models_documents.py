@@ -5,6 +5,8 @@ from django.db import models
 from django.conf import settings
 from django.core.exceptions import ValidationError
 
+from core.field_tracking import FieldTrackingMixin
+
 
 # Define REQUIRED_DOCUMENTS locally to avoid circular import
 REQUIRED_DOCUMENTS = {
@@ -16,10 +18,13 @@ REQUIRED_DOCUMENTS = {
 }
 
 
-class UserDocument(models.Model):
+class UserDocument(FieldTrackingMixin, models.Model):
     """
     Documents uploaded by users for verification or tracking purposes
     """
+    # Loaded status, for the materialized status counts (apps/dashboard/signals.py)
+    tracked_fields = ('status',)
+
     DOCUMENT_TYPES = [
         # Documents d'identité et justificatifs
         ('id_card', 'Pièce d\'identité'),
@@ -154,6 +159,8 @@ class UserDocument(models.Model):
             models.Index(fields=['user', 'status'], name='doc_user_status_idx'),
             models.Index(fields=['document_type'], name='doc_type_idx'),
             models.Index(fields=['expiry_date'], name='doc_expiry_idx'),
+            # Admin review queue, newest first
+            models.Index(fields=['status', '-uploaded_at'], name='doc_status_uploaded_idx'),
         ]
     
     def __str__(self):
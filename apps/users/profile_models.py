@@ -3,16 +3,24 @@ Profile models for different user types in the PRATIK platform.
 Each profile extends the base CustomUser with specific fields for their role.
 """
 from django.db import models
+from django.db.models import Case, Count, F, FloatField, Q, Sum, Value, When
+from django.db.models.functions import Cast, Round
+from django.db.models.lookups import GreaterThan
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
 
+from core.field_tracking import FieldTrackingMixin
 
-class CompanyProfile(models.Model):
+
+class CompanyProfile(FieldTrackingMixin, models.Model):
     """
     Extended profile for company users with partnership features.
     Validates Requirements: Section 1.1.2 (Company Profile)
     """
+    # Fields feeding the cached partner directory snapshot
+    tracked_fields = ('is_partner', 'sector', 'city', 'total_interns_hosted', 'average_rating')
+    
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -69,16 +77,26 @@ class CompanyProfile(models.Model):
         verbose_name = "Profil Entreprise"
         verbose_name_plural = "Profils Entreprises"
         ordering = ['company_name']
+        indexes = [
+            # Keyset pagination of PartnerCompaniesView
+            models.Index(
+                fields=['is_partner', 'is_visible_on_partners_page', '-partner_since', '-id'],
+                name='company_partner_cursor_idx',
+            ),
+        ]
     
     def __str__(self):
         return self.company_name
 
 
-class StudentProfile(models.Model):
+class StudentProfile(FieldTrackingMixin, models.Model):
     """
     Extended profile for student users with recommendations and tracking.
     Validates Requirements: Section 1.1.1 (Student Profile)
     """
+    # Fields followed by companies tracking the student's evolution
+    tracked_fields = ('current_level', 'domain', 'status')
+    
     STATUS_CHOICES = [
         ('STUDYING', 'En études'),
         ('EMPLOYED', 'En emploi'),
@@ -146,6 +164,11 @@ class StudentProfile(models.Model):
         validators=[MinValueValidator(0), MaxValueValidator(5)],
         verbose_name="Note moyenne des recommandations"
     )
+    recommendation_rating_sum = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        verbose_name="Somme des notes de recommandation"
+    )
     
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Créé le")
@@ -155,6 +178,14 @@ class StudentProfile(models.Model):
         verbose_name = "Profil Étudiant"
         verbose_name_plural = "Profils Étudiants"
         ordering = ['-created_at']
+        indexes = [
+            # Recommended students leaderboard (RecommendationService.get_recommended_student_ids)
+            models.Index(
+                fields=['-total_recommendations', '-average_recommendation_rating'],
+                name='student_rec_rank_idx'
+            ),
+            models.Index(fields=['average_recommendation_rating'], name='student_rec_rating_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.get_full_name()} - {self.current_level}"
@@ -164,6 +195,81 @@ class StudentProfile(models.Model):
         if self.skills:
             return [s.strip() for s in self.skills.split(',') if s.strip()]
         return []
+    
+    @staticmethod
+    def recommendation_average(count, rating_sum):
+        """
+        SQL expression of the average rating, for count and rating sum expressions.
+        
+        Rounded by the database (ROUND, half away from zero): every writer of
+        average_recommendation_rating goes through it, so they always agree.
+        """
+        return Case(
+            When(GreaterThan(count, 0), then=Round(Cast(rating_sum, FloatField()) / count, 2)),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+    
+    @classmethod
+    def adjust_recommendation_stats(cls, student_id, count_delta, rating_delta):
+        """
+        Apply a change to the recommendation aggregates in one atomic UPDATE.
+        
+        Count and rating sum are bumped with F() expressions and the average
+        is derived from them in the same statement, so concurrent
+        recommendations for the same student never lose an update.
+        
+        Args:
+            student_id: StudentProfile primary key
+            count_delta: Change of the number of recommendations
+            rating_delta: Change of the sum of their ratings
+        """
+        if not count_delta and not rating_delta:
+            return
+        count = F('total_recommendations') + count_delta
+        rating_sum = F('recommendation_rating_sum') + rating_delta
+        cls.objects.filter(pk=student_id).update(
+            total_recommendations=count,
+            recommendation_rating_sum=rating_sum,
+            average_recommendation_rating=cls.recommendation_average(count, rating_sum),
+        )
+    
+    @classmethod
+    def reconcile_recommendation_stats(cls):
+        """
+        Recompute the recommendation aggregates from the recommendations
+        and fix the profiles that drifted.
+        
+        Returns:
+            int, number of profiles corrected
+        """
+        from apps.recommendations.models import InternRecommendation
+        
+        computed = {
+            row['student_id']: (row['count'], row['total'])
+            for row in InternRecommendation.objects.values('student_id').annotate(
+                count=Count('pk'), total=Sum('rating')
+            ).order_by()
+        }
+        stale = cls.objects.filter(
+            Q(pk__in=list(computed)) | Q(total_recommendations__gt=0) | Q(recommendation_rating_sum__gt=0)
+        ).only('pk', 'total_recommendations', 'recommendation_rating_sum')
+        
+        drifted = []
+        for profile in stale.iterator():
+            count, total = computed.get(profile.pk, (0, 0))
+            if (profile.total_recommendations, profile.recommendation_rating_sum) != (count, total):
+                profile.total_recommendations = count
+                profile.recommendation_rating_sum = total
+                drifted.append(profile)
+        cls.objects.bulk_update(drifted, ['total_recommendations', 'recommendation_rating_sum'], batch_size=500)
+        # Same rounding as adjust_recommendation_stats()
+        cls.objects.filter(pk__in=[profile.pk for profile in drifted]).update(
+            average_recommendation_rating=cls.recommendation_average(
+                F('total_recommendations'), F('recommendation_rating_sum')
+            )
+        )
+        return len(drifted)
 
 
 class SchoolProfile(models.Model):
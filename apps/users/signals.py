@@ -1,13 +1,17 @@
 """
 Django Signals for User-related Models
 """
-from django.db.models.signals import post_save, pre_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from apps.users.models import CustomUser
 from apps.users.models_documents import UserDocument
-from apps.users.profile_models import StudentProfile
-from apps.recommendations.models import InternRecommendation
+from apps.users.profile_models import CompanyProfile, StudentProfile
 from apps.verification.models import VerificationDocument
+from core.cache import invalidate_tags
+from core.response_cache import PARTNERS_TAG
+from core.services.document_checklist_service import DocumentChecklistService
+from core.services.partner_service import PartnerPageService
 from core.services.notification_dispatcher import (
     on_document_submitted,
     on_profile_status_changed,
@@ -27,41 +31,57 @@ def sync_superuser_type(sender, instance, **kwargs):
 
 
 @receiver(post_save, sender=StudentProfile)
-def update_student_evolution_on_profile_change(sender, instance, created, **kwargs):
+def update_student_evolution_on_profile_change(sender, instance, created, update_fields=None, **kwargs):
     """
-    Update student evolution tracking when profile changes.
+    Update student evolution tracking when a tracked profile field changes.
+    Saves touching only other fields (avatar, bio, ...) cost no query.
     """
-    if not created:
-        # Import here to avoid circular imports
-        from core.services.evolution_service import StudentEvolutionService
-        from apps.tracking.models import StudentEvolutionTracking
-        
-        # Get all companies tracking this student
-        trackings = StudentEvolutionTracking.objects.filter(student=instance.user)
-        
-        # Notify companies if student becomes available
-        if trackings.exists():
-            service = StudentEvolutionService()
-            for tracking in trackings:
-                if tracking.notify_on_availability:
-                    # Trigger notification (will be implemented in notification system)
-                    pass
+    if created:
+        return
+    if update_fields is not None and not set(update_fields) & set(StudentProfile.tracked_fields):
+        return
+    if not instance.get_dirty_fields():
+        return
+    
+    # Import here to avoid circular imports
+    from apps.tracking.tasks import update_student_evolution
+    
+    transaction.on_commit(lambda: update_student_evolution.delay(
+        instance.user_id,
+        new_level=instance.current_level,
+        new_domain=instance.domain,
+        new_status=instance.status,
+    ))
 
 
-@receiver(post_save, sender=InternRecommendation)
-def update_student_stats_on_recommendation(sender, instance, created, **kwargs):
+@receiver(post_save, sender=CompanyProfile)
+def invalidate_partner_directory_on_save(sender, instance, created, update_fields=None, **kwargs):
     """
-    Update student statistics when a new recommendation is created.
+    Drop the partner directory snapshot when a partner field changes.
+    Saves of non-partner companies, or touching other fields, keep it.
     """
-    if created:
-        # Update student profile with new recommendation
-        try:
-            student_profile = StudentProfile.objects.get(user=instance.student)
-            # Statistics will be calculated dynamically from recommendations
-            # This signal can trigger notifications
-            pass
-        except StudentProfile.DoesNotExist:
-            pass
+    if update_fields is not None and not set(update_fields) & set(CompanyProfile.tracked_fields):
+        return
+    if not instance.is_partner and (created or not instance.has_changed('is_partner')):
+        return
+    if not created and not any(instance.has_changed(field) for field in CompanyProfile.tracked_fields):
+        return
+    PartnerPageService.invalidate_directory_snapshot()
+
+
+@receiver(post_delete, sender=CompanyProfile)
+def invalidate_partner_directory_on_delete(sender, instance, **kwargs):
+    if instance.is_partner:
+        PartnerPageService.invalidate_directory_snapshot()
+
+
+@receiver([post_save, post_delete], sender=CompanyProfile)
+def purge_partner_pages(sender, instance, **kwargs):
+    """
+    The partner list shows every field of partner companies.
+    """
+    if instance.is_partner or instance.has_changed('is_partner'):
+        invalidate_tags(PARTNERS_TAG)
 
 
 @receiver(post_save, sender=VerificationDocument)
@@ -97,31 +117,45 @@ def notify_on_document_submission(sender, instance, created, **kwargs):
         on_document_submitted(instance)
 
 
+@receiver([post_save, post_delete], sender=UserDocument)
+def forget_document_checklist(sender, instance, **kwargs):
+    """
+    Drop the checklist memoized on the owner instance so the rest of the
+    request sees the new document.
+    """
+    if UserDocument.user.is_cached(instance):
+        DocumentChecklistService.forget(instance.user)
+
+
 @receiver(pre_save, sender=CustomUser)
-def detect_verification_status_change(sender, instance, **kwargs):
+def detect_verification_status_change(sender, instance, update_fields=None, **kwargs):
     """
     Detect changes to user verification_status and trigger notifications.
-    This signal fires before save to compare old and new status values.
+    The status loaded with the instance (FieldTrackingMixin) is compared with
+    the new one, so no query is needed unless the loaded value is unknown.
     """
     # Skip for new users (no pk yet)
     if not instance.pk:
         return
     
-    try:
-        # Get the old instance from database
-        old_instance = CustomUser.objects.get(pk=instance.pk)
-        old_status = old_instance.verification_status
-        new_status = instance.verification_status
-        
-        # If status has changed, notify the user
-        if old_status != new_status:
-            # Store the old status on the instance so it can be accessed in post_save
-            # We'll use post_save to actually send the notification after the save completes
-            instance._verification_status_changed = True
-            instance._old_verification_status = old_status
-    except CustomUser.DoesNotExist:
-        # This shouldn't happen, but handle gracefully
-        pass
+    # Saves that do not write the status cannot change it
+    if update_fields is not None and 'verification_status' not in update_fields:
+        return
+    
+    if instance.is_loaded('verification_status'):
+        old_status = instance.get_loaded_value('verification_status')
+    else:
+        # Instance built by hand or with the field deferred: read the stored value
+        old_status = CustomUser.objects.filter(pk=instance.pk).values_list('verification_status', flat=True).first()
+        if old_status is None:
+            return
+    
+    # If status has changed, notify the user
+    if old_status != instance.verification_status:
+        # Store the old status on the instance so it can be accessed in post_save
+        # We'll use post_save to actually send the notification after the save completes
+        instance._verification_status_changed = True
+        instance._old_verification_status = old_status
 
 
 @receiver(post_save, sender=CustomUser)
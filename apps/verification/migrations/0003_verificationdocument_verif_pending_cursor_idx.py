@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('verification', '0002_verificationdocument_verification_status_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='verificationdocument',
+            index=models.Index(fields=['status', 'submitted_at', 'id'], name='verif_pending_cursor_idx'),
+        ),
+    ]
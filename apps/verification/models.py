@@ -56,6 +56,8 @@ class VerificationDocument(models.Model):
             models.Index(fields=['document_type'], name='verification_type_idx'),
             models.Index(fields=['-submitted_at'], name='verification_submitted_idx'),
             models.Index(fields=['expiry_date'], name='verification_expiry_idx'),
+            # Keyset pagination of PendingVerificationsView
+            models.Index(fields=['status', 'submitted_at', 'id'], name='verif_pending_cursor_idx'),
         ]
     
     def __str__(self):
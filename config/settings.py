@@ -199,6 +199,52 @@ DATABASES = {
     }
 }
 
+# Caches
+# 'default' is the general purpose cache, 'hot' holds small entries read on
+# most requests (navbar unread counters), 'aggregates' stores computed
+# results (core.cache.cached_service_call) and 'sessions', declared only
+# with a shared backend, backs the session engine.
+# CACHE_BACKEND: 'locmem' (per process, the default), 'redis' (CACHE_REDIS_URL)
+# or 'fakeredis', an in-process Redis stand-in for offline development and tests
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'locmem')
+CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL', 'redis://localhost:6379/1')
+CACHE_TIMEOUTS = {
+    'default': 300,
+    'hot': 60,
+    'aggregates': 900,
+}
+SESSION_CACHE_TIMEOUT = 1209600
+
+# Sessions only go through a shared cache: locmem would differ between processes
+if CACHE_BACKEND == 'redis':
+    CACHE_TIMEOUTS['sessions'] = SESSION_CACHE_TIMEOUT
+
+
+def _cache_config(alias, timeout):
+    if CACHE_BACKEND == 'locmem':
+        return {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': f'pratik-{alias}',
+            'TIMEOUT': timeout,
+        }
+    config = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': CACHE_REDIS_URL,
+        'KEY_PREFIX': f'pratik-{alias}',
+        'TIMEOUT': timeout,
+    }
+    if CACHE_BACKEND == 'fakeredis':
+        import fakeredis
+        config['OPTIONS'] = {'connection_class': fakeredis.FakeConnection}
+    return config
+
+
+CACHES = {alias: _cache_config(alias, timeout) for alias, timeout in CACHE_TIMEOUTS.items()}
+
+if 'sessions' in CACHES:
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+    SESSION_CACHE_ALIAS = 'sessions'
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -247,15 +293,55 @@ EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS', 'True') == 'True'
 EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER', '')
 EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD', '')
 
-# Use SMTP backend if credentials are provided, otherwise console
-if EMAIL_HOST_USER and EMAIL_HOST_PASSWORD:
+# Use SMTP backend if credentials are provided, otherwise console.
+# EMAIL_BACKEND can be forced, e.g. to the locmem or file backend to
+# benchmark the mail outbox offline (see benchmark_mail_outbox).
+if os.getenv('EMAIL_BACKEND'):
+    EMAIL_BACKEND = os.getenv('EMAIL_BACKEND')
+elif EMAIL_HOST_USER and EMAIL_HOST_PASSWORD:
     EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 else:
     EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+EMAIL_FILE_PATH = os.getenv('EMAIL_FILE_PATH', str(BASE_DIR / 'tmp' / 'emails'))
 
 DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'noreply@pratik.fr')
 SITE_URL = os.getenv('SITE_URL', 'http://localhost:8000')
 
+# Mail outbox: emails claimed per flush batch, delivery attempts before an
+# email is marked failed, and base retry delay (seconds, doubled per attempt)
+MAIL_OUTBOX_BATCH_SIZE = int(os.getenv('MAIL_OUTBOX_BATCH_SIZE', '100'))
+MAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv('MAIL_OUTBOX_MAX_ATTEMPTS', '5'))
+MAIL_OUTBOX_RETRY_DELAY = int(os.getenv('MAIL_OUTBOX_RETRY_DELAY', '60'))
+# How long a flusher holds the emails it claimed before they are due again (seconds)
+MAIL_OUTBOX_CLAIM_TIMEOUT = int(os.getenv('MAIL_OUTBOX_CLAIM_TIMEOUT', '300'))
+
+# Cache lifetime of the dashboard counters (seconds); signals invalidate them earlier
+DASHBOARD_METRICS_CACHE_TIMEOUT = int(os.getenv('DASHBOARD_METRICS_CACHE_TIMEOUT', '60'))
+
+# Cache lifetime of the partner directory snapshot (seconds); signals invalidate it earlier
+PARTNER_SNAPSHOT_CACHE_TIMEOUT = int(os.getenv('PARTNER_SNAPSHOT_CACHE_TIMEOUT', '3600'))
+
+# cached_service_call: how long a recomputation holds its lock, and how long
+# callers missing the same entry wait for it before computing it themselves (seconds)
+SERVICE_CACHE_LOCK_TIMEOUT = int(os.getenv('SERVICE_CACHE_LOCK_TIMEOUT', '30'))
+SERVICE_CACHE_LOCK_WAIT = float(os.getenv('SERVICE_CACHE_LOCK_WAIT', '2'))
+
+# Cache lifetime of the upcoming calendars and recommended students lists (seconds);
+# signals invalidate them earlier
+CALENDAR_CACHE_TIMEOUT = int(os.getenv('CALENDAR_CACHE_TIMEOUT', '900'))
+RECOMMENDATION_CACHE_TIMEOUT = int(os.getenv('RECOMMENDATION_CACHE_TIMEOUT', '900'))
+
+# Cache lifetime of the public catalog pages served to anonymous visitors, and of
+# the catalog fragments cached per role (seconds); signals invalidate them earlier
+RESPONSE_CACHE_TIMEOUT = int(os.getenv('RESPONSE_CACHE_TIMEOUT', '300'))
+
+# Paginated lists whose planner estimate reaches this many rows show the
+# estimate instead of running COUNT(*) (PostgreSQL only)
+PAGINATION_ESTIMATE_THRESHOLD = int(os.getenv('PAGINATION_ESTIMATE_THRESHOLD', '10000'))
+
+# Cache mirror of the navbar unread counters (seconds, 0 disables the mirror)
+UNREAD_COUNTER_CACHE_TIMEOUT = int(os.getenv('UNREAD_COUNTER_CACHE_TIMEOUT', '300'))
+
 # ============================================================================
 # REST FRAMEWORK CONFIGURATION
 # ============================================================================
@@ -367,6 +453,18 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'core.tasks.notification_tasks.send_upcoming_calendar_reminders',
         'schedule': crontab(day_of_week='monday', hour=10, minute=0),  # Every Monday at 10:00 AM
     },
+    'flush-mail-outbox-every-minute': {
+        'task': 'core.tasks.email_tasks.flush_mail_outbox',
+        'schedule': crontab(),  # Every minute (picks up emails due for retry)
+    },
+    'reconcile-status-counts-hourly': {
+        'task': 'apps.dashboard.tasks.reconcile_status_counts',
+        'schedule': crontab(minute=15),  # Every hour at :15
+    },
+    'reconcile-recommendation-stats-daily': {
+        'task': 'apps.recommendations.tasks.reconcile_recommendation_stats',
+        'schedule': crontab(hour=3, minute=30),  # Every day at 3:30 AM
+    },
     'cleanup-old-notifications-weekly': {
         'task': 'core.tasks.notification_tasks.cleanup_old_notifications',
         'schedule': crontab(day_of_week='sunday', hour=2, minute=0),  # Every Sunday at 2:00 AM
@@ -91,9 +91,11 @@ if USE_S3:
 USE_REDIS = os.getenv('USE_REDIS', 'False') == 'True'
 if USE_REDIS:
     CACHES = {
-        'default': {
+        alias: {
             'BACKEND': 'django_redis.cache.RedisCache',
             'LOCATION': os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+            'KEY_PREFIX': f'pratik-{alias}',
+            'TIMEOUT': timeout,
             'OPTIONS': {
                 'CLIENT_CLASS': 'django_redis.client.DefaultClient',
                 'SOCKET_CONNECT_TIMEOUT': 5,
@@ -102,9 +104,10 @@ if USE_REDIS:
                 'MAX_CONNECTIONS': 50,
             }
         }
+        for alias, timeout in {**CACHE_TIMEOUTS, 'sessions': SESSION_CACHE_TIMEOUT}.items()
     }
     SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
-    SESSION_CACHE_ALIAS = 'default'
+    SESSION_CACHE_ALIAS = 'sessions'
 
 # Optional: Sentry Error Tracking
 SENTRY_DSN = os.getenv('SENTRY_DSN')
@@ -4,6 +4,7 @@ Pytest configuration and fixtures for Pratik tests.
 import pytest
 from datetime import date, timedelta
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
 from apps.internships.models import Internship
 from apps.applications.models import Application
 from apps.notifications.models import Notification
@@ -12,6 +13,28 @@ from apps.calendars.models import ProgramManager
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Cached values must not leak from one test to the next."""
+    for cache in caches.all():
+        cache.clear()
+    yield
+
+
+@pytest.fixture
+def make_user(db):
+    """Factory creating a user named after its username."""
+    def _make_user(username, user_type='student', **kwargs):
+        return User.objects.create_user(
+            username=username,
+            email=f'{username}@test.com',
+            password='testpass123',
+            user_type=user_type,
+            **kwargs
+        )
+    return _make_user
+
+
 @pytest.fixture
 def student_user(db):
     """Create a student user for testing."""
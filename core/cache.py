@@ -0,0 +1,208 @@
+"""
+Service call caching
+
+cached_service_call stores what a service function returns in one of the
+CACHES aliases, keyed on the function, its arguments and the current version
+of its tags. invalidate_tags() bumps a tag version, which orphans every entry
+built under the previous one without having to know their keys.
+
+Cache stampedes are avoided two ways: a single caller recomputes an entry
+(the others wait for it on a miss, or keep serving the current value), and
+entries are refreshed a little before they expire, with a probability growing
+as expiry nears (probabilistic early expiration, "XFetch").
+"""
+import functools
+import hashlib
+import math
+import random
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Model
+
+
+DEFAULT_ALIAS = 'aggregates'
+
+KEY = 'svc:{name}:{tags}:{args}'
+TAG_KEY = 'svc-tag:{tag}'
+LOCK_KEY = '{key}:lock'
+
+# Poll interval while waiting for another caller to fill a missing entry (seconds)
+LOCK_POLL_INTERVAL = 0.05
+
+
+def _key_part(value):
+    """Stable text for a call argument (model instances by primary key)."""
+    if isinstance(value, Model):
+        return f'{value._meta.label_lower}:{value.pk}'
+    if isinstance(value, dict):
+        items = sorted((str(key), _key_part(item)) for key, item in value.items())
+        return '{' + ','.join(f'{key}={item}' for key, item in items) + '}'
+    if isinstance(value, (set, frozenset)):
+        return '{' + ','.join(sorted(_key_part(item) for item in value)) + '}'
+    if isinstance(value, (list, tuple)):
+        return '[' + ','.join(_key_part(item) for item in value) + ']'
+    return repr(value)
+
+
+def _new_tag_version():
+    # Time-based (microseconds), so a tag evicted from the cache never comes
+    # back with a version older entries were built under
+    return time.time_ns() // 1000
+
+
+def get_tag_versions(tags, alias=DEFAULT_ALIAS):
+    """
+    Get the current version of tags, creating the missing ones.
+
+    Args:
+        tags: Iterable of tag names
+        alias: CACHES alias holding the tags
+
+    Returns:
+        dict {tag: version}
+    """
+    cache = caches[alias]
+    keys = {TAG_KEY.format(tag=tag): tag for tag in tags}
+    found = cache.get_many(keys)
+    versions = {keys[key]: version for key, version in found.items()}
+    for key, tag in keys.items():
+        if tag not in versions:
+            cache.add(key, _new_tag_version(), None)
+            versions[tag] = cache.get(key)
+    return versions
+
+
+def _bump_tags(tags, alias):
+    cache = caches[alias]
+    for tag in tags:
+        key = TAG_KEY.format(tag=tag)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _new_tag_version(), None)
+
+
+def invalidate_tags(*tags, alias=DEFAULT_ALIAS):
+    """
+    Invalidate every cached service call built under one of the tags.
+
+    Inside a transaction the tags are bumped again once it commits, so a
+    value recomputed by another process before the commit is dropped too.
+
+    Args:
+        tags: Tag names
+        alias: CACHES alias holding the tags
+    """
+    _bump_tags(tags, alias)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _bump_tags(tags, alias))
+
+
+def _resolve_timeout(timeout, cache):
+    if timeout is None:
+        return cache.default_timeout
+    if isinstance(timeout, str):
+        return getattr(settings, timeout)
+    return timeout
+
+
+def _expires_early(delta, expires_at, beta):
+    """XFetch: refresh early, sooner for values that took longer to compute."""
+    if expires_at is None:
+        return False
+    return time.time() - delta * beta * math.log(1 - random.random()) >= expires_at
+
+
+def cached_service_call(timeout=None, alias=DEFAULT_ALIAS, tags=(), version=1, beta=1.0):
+    """
+    Cache the return value of a service function.
+
+    Arguments must have a stable repr() (model instances are keyed on their
+    primary key) and the return value must be picklable: cache primary keys
+    or plain data rather than QuerySets.
+
+    Usage:
+        @staticmethod
+        @cached_service_call(timeout='PARTNER_SNAPSHOT_CACHE_TIMEOUT', tags=('partners',))
+        def get_snapshot():
+            ...
+
+        invalidate_tags('partners')
+
+    Args:
+        timeout: Seconds, name of a setting holding them, or None for the alias default
+        alias: CACHES alias storing the values
+        tags: Tag names, or a callable taking the call arguments and returning them
+        version: Bump it when the shape of the cached value changes
+        beta: Early refresh eagerness (0 disables it, above 1 favours earlier refreshes)
+
+    The decorated function gains:
+        uncached(*args, **kwargs): call the function without the cache
+        invalidate(*args, **kwargs): drop the entry for these arguments
+        cache_key(*args, **kwargs): the key of the entry for these arguments
+    """
+    def decorator(func):
+        name = f'{func.__module__}.{func.__qualname__}'
+
+        def cache_key(*args, **kwargs):
+            call_tags = tags(*args, **kwargs) if callable(tags) else tags
+            versions = get_tag_versions(call_tags, alias) if call_tags else {}
+            tag_part = ','.join(f'{tag}={versions[tag]}' for tag in sorted(versions))
+            arg_part = _key_part(args) + _key_part(kwargs)
+            return KEY.format(
+                name=name,
+                tags=hashlib.md5(tag_part.encode()).hexdigest(),
+                args=hashlib.md5(arg_part.encode()).hexdigest(),
+            )
+
+        def compute(cache, key, args, kwargs):
+            started = time.monotonic()
+            value = func(*args, **kwargs)
+            delta = time.monotonic() - started
+            ttl = _resolve_timeout(timeout, cache)
+            expires_at = None if ttl is None else time.time() + ttl
+            cache.set(key, (value, delta, expires_at), ttl, version=version)
+            return value
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = caches[alias]
+            key = cache_key(*args, **kwargs)
+            lock_key = LOCK_KEY.format(key=key)
+            lock_timeout = settings.SERVICE_CACHE_LOCK_TIMEOUT
+
+            entry = cache.get(key, version=version)
+            if entry is not None:
+                value, delta, expires_at = entry
+                if not _expires_early(delta, expires_at, beta):
+                    return value
+                # One caller refreshes; the others keep serving the current value
+                if not cache.add(lock_key, True, lock_timeout, version=version):
+                    return value
+            elif not cache.add(lock_key, True, lock_timeout, version=version):
+                # Another caller is computing it: wait for its result, within limits
+                deadline = time.monotonic() + settings.SERVICE_CACHE_LOCK_WAIT
+                while time.monotonic() < deadline:
+                    time.sleep(LOCK_POLL_INTERVAL)
+                    entry = cache.get(key, version=version)
+                    if entry is not None:
+                        return entry[0]
+                return compute(cache, key, args, kwargs)
+
+            try:
+                return compute(cache, key, args, kwargs)
+            finally:
+                cache.delete(lock_key, version=version)
+
+        def invalidate(*args, **kwargs):
+            caches[alias].delete(cache_key(*args, **kwargs), version=version)
+
+        wrapper.uncached = func
+        wrapper.invalidate = invalidate
+        wrapper.cache_key = cache_key
+        return wrapper
+
+    return decorator
@@ -0,0 +1,83 @@
+"""
+Field change tracking for models
+
+Models listing ``tracked_fields`` remember the values those fields had when
+the instance was loaded from the database, so signal receivers can tell what
+changed without re-reading the row. The snapshot is refreshed after every
+save(), once the post_save receivers have run.
+"""
+
+
+class FieldTrackingMixin:
+    """
+    Mixin for models.Model subclasses: snapshot tracked fields at load time.
+
+    Usage:
+        class Profile(FieldTrackingMixin, models.Model):
+            tracked_fields = ('status',)
+
+        profile.has_changed('status')
+        profile.get_dirty_fields()  # {'status': <loaded value>}
+    """
+
+    tracked_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.snapshot_tracked_fields()
+        return instance
+
+    def snapshot_tracked_fields(self, fields=None):
+        """
+        Remember the current value of tracked fields.
+
+        Deferred fields are not snapshotted: their previous value stays unknown.
+
+        Args:
+            fields: Field names to refresh (default: every tracked field)
+        """
+        loaded = self.__dict__.setdefault('_loaded_values', {})
+        for name in self.tracked_fields if fields is None else fields:
+            if name not in self.tracked_fields:
+                continue
+            attname = self._meta.get_field(name).attname
+            if attname in self.__dict__:
+                loaded[name] = self.__dict__[attname]
+
+    def is_loaded(self, field):
+        """Return True if the loaded value of a tracked field is known."""
+        return field in self.__dict__.get('_loaded_values', {})
+
+    def get_loaded_value(self, field, default=None):
+        """Return the value a tracked field had when loaded (or last saved)."""
+        return self.__dict__.get('_loaded_values', {}).get(field, default)
+
+    def has_changed(self, field):
+        """
+        Return True if a tracked field differs from its loaded value.
+
+        Unknown loaded values (new instance, deferred field) count as changed.
+        """
+        if not self.is_loaded(field):
+            return True
+        attname = self._meta.get_field(field).attname
+        return self.__dict__.get(attname) != self.get_loaded_value(field)
+
+    def get_dirty_fields(self):
+        """
+        Return {field: loaded value} for the tracked fields known to have changed.
+        """
+        return {
+            field: self.get_loaded_value(field)
+            for field in self.tracked_fields
+            if self.is_loaded(field) and self.has_changed(field)
+        }
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.snapshot_tracked_fields(kwargs.get('update_fields'))
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self.snapshot_tracked_fields(kwargs.get('fields'))
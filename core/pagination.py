@@ -0,0 +1,180 @@
+"""
+Pagination without COUNT(*)
+
+Django's Paginator counts the whole queryset to number its pages, which
+costs a scan of every matching row on large tables. CheapCountPaginator
+takes the total from somewhere cheaper, in this order:
+
+- a count the view already has (the status counts of its badges);
+- the PostgreSQL planner estimate, when it reaches
+  PAGINATION_ESTIMATE_THRESHOLD rows;
+- COUNT(*), for small lists and other databases.
+
+With the count mode NO_COUNT, no total is computed at all. Whenever the
+total is not an exact COUNT(*), pages are read one row past their end to
+know whether a next page exists, so navigation never depends on the total.
+"""
+import json
+
+from django.conf import settings
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+AUTO = 'auto'
+NO_COUNT = 'none'
+
+KNOWN = 'known'
+ESTIMATE = 'estimate'
+EXACT = 'exact'
+
+
+def estimate_count(queryset):
+    """
+    Planner estimate of the number of rows of a queryset.
+
+    Unfiltered querysets read pg_class.reltuples, the others the row estimate
+    of their EXPLAIN plan.
+
+    Args:
+        queryset: QuerySet to estimate
+
+    Returns:
+        int, or None when the database gives no estimate (not PostgreSQL)
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    query = queryset.query
+    if not query.where and not query.distinct and query.group_by is None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        # -1: never analyzed
+        if row and row[0] >= 0:
+            return int(row[0])
+    plan = json.loads(queryset.order_by().explain(format='json'))
+    if isinstance(plan, list):
+        plan = plan[0]
+    return int(plan['Plan']['Plan Rows'])
+
+
+class LookaheadPage(Page):
+    """Page that knows whether a next page exists from one extra row read."""
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def end_index(self):
+        return self.start_index() + len(self) - 1 if len(self) else 0
+
+
+class CheapCountPaginator(Paginator):
+    """
+    Paginator taking its total from a known count or an estimate before COUNT(*).
+
+    Usage:
+        CheapCountPaginator(queryset, 25, count=pending_count)
+        CheapCountPaginator(queryset, 20, count_mode=NO_COUNT)
+
+    count_source tells where the total came from (KNOWN, ESTIMATE or EXACT),
+    once count has been read; count and num_pages are None with NO_COUNT.
+    Orphans only apply to exact counts.
+    """
+
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True,
+                 count=None, count_mode=AUTO, estimate_threshold=None, **kwargs):
+        super().__init__(object_list, per_page, orphans, allow_empty_first_page, **kwargs)
+        self.known_count = count
+        self.count_mode = count_mode
+        if estimate_threshold is None:
+            estimate_threshold = settings.PAGINATION_ESTIMATE_THRESHOLD
+        self.estimate_threshold = estimate_threshold
+        self.count_source = None
+
+    @cached_property
+    def count(self):
+        if self.count_mode == NO_COUNT:
+            return None
+        if self.known_count is not None:
+            self.count_source = KNOWN
+            return self.known_count
+        estimate = estimate_count(self.object_list) if hasattr(self.object_list, 'query') else None
+        if estimate is not None and estimate >= self.estimate_threshold:
+            self.count_source = ESTIMATE
+            return estimate
+        self.count_source = EXACT
+        return Paginator.count.func(self)
+
+    @cached_property
+    def num_pages(self):
+        if self.count is None:
+            return None
+        return Paginator.num_pages.func(self)
+
+    @property
+    def is_exact(self):
+        return self.count is not None and self.count_source == EXACT
+
+    def validate_number(self, number):
+        if self.is_exact:
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages['invalid_page'])
+        if number < 1:
+            raise EmptyPage(self.error_messages['min_page'])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if self.is_exact:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and (number > 1 or not self.allow_empty_first_page):
+            raise EmptyPage(self.error_messages['no_results'])
+        return LookaheadPage(rows[:self.per_page], number, self, has_next=len(rows) > self.per_page)
+
+
+class CheapCountMixin:
+    """
+    Paginate a ListView with CheapCountPaginator.
+
+    Usage:
+        class ApplicationManageListView(CheapCountMixin, ListView):
+            paginate_by = 20
+
+            def get_pagination_count(self):
+                return self.get_status_counts()['total']
+
+    Set count_mode = NO_COUNT for lists that only need previous/next links.
+    """
+
+    count_mode = AUTO
+
+    def get_pagination_count(self):
+        """Total of the filtered list when the view already knows it, else None."""
+        return None
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        return CheapCountPaginator(
+            queryset,
+            per_page,
+            orphans=orphans,
+            allow_empty_first_page=allow_empty_first_page,
+            count=self.get_pagination_count() if self.count_mode != NO_COUNT else None,
+            count_mode=self.count_mode,
+            **kwargs
+        )
@@ -0,0 +1,177 @@
+"""
+Response caching for public catalog pages
+
+CachedResponseMixin serves GET requests of anonymous visitors from a cache
+of full responses, keyed on the path and the normalized query string, and
+answers conditional requests (If-None-Match / If-Modified-Since) with a 304.
+Logged-in users get a fresh page (navbar, CSRF tokens), but templates can
+cache the catalog part with {% cache %}, keyed by role and query through the
+fragment_cache_key context variable.
+
+Each view lists the tags of the models it shows; the apps' signals call
+invalidate_tags() on writes, which orphans every cached response and
+fragment built from them.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.contrib.messages.storage.session import SessionStorage
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, urlencode
+
+from core.cache import get_tag_versions
+
+
+RESPONSE_KEY = 'response:{path}:{vary}:{tags}:{query}'
+FRAGMENT_KEY = '{role}:{path}:{tags}:{query}'
+
+# Model tags, invalidated by the signals of each app
+INTERNSHIPS_TAG = 'catalog-internships'
+HOUSING_TAG = 'catalog-housing'
+CARPOOLING_TAG = 'catalog-carpooling'
+FORUM_TAG = 'catalog-forum'
+RESOURCES_TAG = 'catalog-resources'
+TRAININGS_TAG = 'catalog-trainings'
+PARTNERS_TAG = 'catalog-partners'
+
+# Query parameters that never change the page (analytics, cache busters)
+IGNORED_PARAMS = frozenset({
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', '_',
+})
+
+
+def normalize_query(query_dict):
+    """
+    Canonical query string: sorted keys and values, empty and ignored params dropped.
+
+    Args:
+        query_dict: request.GET
+    """
+    params = []
+    for key in sorted(query_dict):
+        if key in IGNORED_PARAMS:
+            continue
+        for value in sorted(query_dict.getlist(key)):
+            if value.strip():
+                params.append((key, value.strip()))
+    return urlencode(params)
+
+
+def get_role(user):
+    """Role a user sees catalog pages as."""
+    if not user.is_authenticated:
+        return 'anonymous'
+    if user.is_staff or user.is_superuser:
+        return 'admin'
+    return user.user_type
+
+
+def _has_pending_messages(request):
+    if CookieStorage.cookie_name in request.COOKIES:
+        return True
+    if settings.SESSION_COOKIE_NAME not in request.COOKIES:
+        return False
+    return bool(request.session.get(SessionStorage.session_key))
+
+
+class CachedResponseMixin:
+    """
+    Cache the GET responses of a view for anonymous visitors.
+
+    Usage:
+        class InternshipListView(CachedResponseMixin, ListView):
+            response_cache_tags = (INTERNSHIPS_TAG,)
+
+    Only 200 responses setting no cookie are stored. Templates may cache
+    their catalog part for logged-in users, as long as it holds no per-user
+    content (CSRF tokens, names):
+        {% cache fragment_cache_timeout 'internship-list' fragment_cache_key %}
+    """
+
+    response_cache_tags = ()
+    # Request headers the response depends on
+    response_cache_vary = ('HX-Request',)
+    response_cache_alias = 'default'
+
+    def get_response_cache_tags(self):
+        return self.response_cache_tags
+
+    def _tags_part(self):
+        versions = get_tag_versions(self.get_response_cache_tags())
+        tags = ','.join(f'{tag}={versions[tag]}' for tag in sorted(versions))
+        return hashlib.md5(tags.encode()).hexdigest()
+
+    def get_response_cache_key(self):
+        request = self.request
+        vary = '|'.join(request.headers.get(header, '') for header in self.response_cache_vary)
+        return RESPONSE_KEY.format(
+            path=hashlib.md5(request.path.encode()).hexdigest(),
+            vary=hashlib.md5(vary.encode()).hexdigest(),
+            tags=self._tags_part(),
+            query=hashlib.md5(normalize_query(request.GET).encode()).hexdigest(),
+        )
+
+    def get_fragment_cache_key(self):
+        return FRAGMENT_KEY.format(
+            role=get_role(self.request.user),
+            path=hashlib.md5(self.request.path.encode()).hexdigest(),
+            tags=self._tags_part(),
+            query=hashlib.md5(normalize_query(self.request.GET).encode()).hexdigest(),
+        )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['fragment_cache_key'] = self.get_fragment_cache_key()
+        context['fragment_cache_timeout'] = settings.RESPONSE_CACHE_TIMEOUT
+        return context
+
+    def is_response_cacheable(self, request):
+        return (
+            request.method in ('GET', 'HEAD')
+            and not request.user.is_authenticated
+            and 'HTTP_AUTHORIZATION' not in request.META
+            and not _has_pending_messages(request)
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        if not self.is_response_cacheable(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        cache = caches[self.response_cache_alias]
+        key = self.get_response_cache_key()
+        entry = cache.get(key)
+        if entry is None:
+            response = super().dispatch(request, *args, **kwargs)
+            if hasattr(response, 'render') and callable(response.render):
+                response = response.render()
+            if (
+                response.status_code != 200
+                or response.cookies
+                or response.streaming
+                or request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+            ):
+                return response
+            entry = {
+                'content': response.content,
+                'content_type': response['Content-Type'],
+                'etag': f'"{hashlib.md5(response.content).hexdigest()}"',
+                'last_modified': int(time.time()),
+            }
+            cache.set(key, entry, settings.RESPONSE_CACHE_TIMEOUT)
+        else:
+            response = HttpResponse(entry['content'], content_type=entry['content_type'])
+
+        response['ETag'] = entry['etag']
+        response['Last-Modified'] = http_date(entry['last_modified'])
+        patch_vary_headers(response, self.response_cache_vary)
+        return get_conditional_response(
+            request,
+            etag=entry['etag'],
+            last_modified=entry['last_modified'],
+            response=response,
+        )
@@ -10,6 +10,10 @@ from .evolution_service import StudentEvolutionService
 from .calendar_service import InternshipCalendarService
 from .verification_service import VerificationService
 from .partner_service import PartnerPageService
+from .search_service import InternshipSearchService
+from .mail_outbox import MailOutboxService
+from .dashboard_metrics import DashboardMetricsService
+from .document_review_service import DocumentReviewService
 
 __all__ = [
     'RecommendationService',
@@ -17,4 +21,8 @@ __all__ = [
     'InternshipCalendarService',
     'VerificationService',
     'PartnerPageService',
+    'InternshipSearchService',
+    'MailOutboxService',
+    'DashboardMetricsService',
+    'DocumentReviewService',
 ]
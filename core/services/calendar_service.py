@@ -8,6 +8,10 @@ from datetime import timedelta
 from django.utils import timezone
 from django.db.models import Q
 from apps.calendars.models import InternshipCalendar
+from core.cache import cached_service_call, invalidate_tags
+
+
+CALENDARS_TAG = 'calendars'
 
 
 class InternshipCalendarService:
@@ -149,15 +153,39 @@ class InternshipCalendarService:
         Returns:
             QuerySet of InternshipCalendar instances
         """
-        today = timezone.now().date()
+        calendar_ids = InternshipCalendarService.get_upcoming_calendar_ids(
+            months_ahead, timezone.now().date()
+        )
+        return InternshipCalendar.objects.filter(
+            pk__in=calendar_ids
+        ).select_related('school', 'school__user', 'program_manager').order_by('start_date')
+    
+    @staticmethod
+    @cached_service_call(timeout='CALENDAR_CACHE_TIMEOUT', tags=(CALENDARS_TAG,))
+    def get_upcoming_calendar_ids(months_ahead, today):
+        """
+        Get the IDs of the calendars starting between today and X months later.
+        
+        Args:
+            months_ahead: int, number of months to look ahead
+            today: date the window starts (part of the cache key)
+        
+        Returns:
+            list of InternshipCalendar IDs
+        """
         future_date = today + timedelta(days=30 * months_ahead)
         
-        return InternshipCalendar.objects.filter(
+        return list(InternshipCalendar.objects.filter(
             is_published=True,
             is_visible_to_companies=True,
             start_date__gte=today,
             start_date__lte=future_date
-        ).select_related('school', 'school__user', 'program_manager').order_by('start_date')
+        ).values_list('pk', flat=True))
+    
+    @staticmethod
+    def invalidate_cache():
+        """Drop the cached calendar lists."""
+        invalidate_tags(CALENDARS_TAG)
     
     @staticmethod
     def get_school_calendars(school):
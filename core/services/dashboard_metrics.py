@@ -0,0 +1,136 @@
+"""
+Dashboard Metrics Service
+
+Computes the counters shown on the role dashboards with one conditional
+aggregate (Count(filter=Q(...))) per table, and caches them for a short
+time. Admin counters are global; the other roles are cached per user.
+apps/dashboard/signals.py drops the affected entries when the underlying
+rows change.
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from apps.applications.models import Application
+from apps.internships.models import Internship
+from apps.services.models import CarpoolingOffer, HousingOffer
+from apps.users.models_documents import UserDocument
+
+
+CACHE_KEY = 'dashboard-metrics:{scope}:{user_id}'
+
+
+class DashboardMetricsService:
+    """
+    Service for the dashboard counters of each role
+    """
+
+    # Role -> counter set (recruiters see the same counters as companies)
+    SCOPES = {
+        'admin': 'admin',
+        'student': 'student',
+        'company': 'company',
+        'recruiter': 'company',
+        'landlord': 'landlord',
+        'driver': 'driver',
+    }
+
+    @staticmethod
+    def cache_key(scope, user_id=None):
+        return CACHE_KEY.format(scope=scope, user_id=user_id or 'all')
+
+    @staticmethod
+    def get_counters(role, user):
+        """
+        Get the dashboard counters of a role, from cache when possible.
+
+        Args:
+            role: Effective dashboard role ('admin', 'student', ...)
+            user: User viewing the dashboard
+
+        Returns:
+            dict of counters (empty for roles without cached counters)
+        """
+        scope = DashboardMetricsService.SCOPES.get(role)
+        if scope is None:
+            return {}
+        user_id = None if scope == 'admin' else user.pk
+        key = DashboardMetricsService.cache_key(scope, user_id)
+        counters = cache.get(key)
+        if counters is None:
+            compute = getattr(DashboardMetricsService, f'compute_{scope}')
+            counters = compute() if user_id is None else compute(user_id)
+            cache.set(key, counters, settings.DASHBOARD_METRICS_CACHE_TIMEOUT)
+        return counters
+
+    @staticmethod
+    def invalidate(scope, user_ids=()):
+        """
+        Drop cached counters.
+
+        Args:
+            scope: 'admin', 'student', 'company', 'landlord' or 'driver'
+            user_ids: Users whose counters changed (ignored for 'admin')
+        """
+        if scope == 'admin':
+            cache.delete(DashboardMetricsService.cache_key('admin'))
+            return
+        cache.delete_many([
+            DashboardMetricsService.cache_key(scope, user_id)
+            for user_id in user_ids if user_id
+        ])
+
+    @staticmethod
+    def compute_admin():
+        """Platform-wide counters: one aggregate per table (4 queries)."""
+        User = get_user_model()
+        counters = User.objects.aggregate(
+            total_users=Count('pk'),
+            total_students=Count('pk', filter=Q(user_type='student')),
+            total_companies=Count('pk', filter=Q(user_type='company')),
+            pending_verifications=Count(
+                'pk',
+                filter=~Q(user_type__in=['student', 'admin']) & ~Q(verification_status='verified')
+            ),
+        )
+        counters.update(Internship.objects.aggregate(total_internships=Count('pk')))
+        counters.update(Application.objects.aggregate(total_applications=Count('pk')))
+        counters.update(UserDocument.objects.aggregate(
+            pending_documents_count=Count('pk', filter=Q(status='pending')),
+            approved_documents_count=Count('pk', filter=Q(status='approved')),
+            rejected_documents_count=Count('pk', filter=Q(status='rejected')),
+        ))
+        return counters
+
+    @staticmethod
+    def compute_student(user_id):
+        return Application.objects.filter(student_id=user_id).aggregate(
+            applications_count=Count('pk'),
+            pending_count=Count('pk', filter=Q(status=Application.PENDING)),
+        )
+
+    @staticmethod
+    def compute_company(user_id):
+        counters = Internship.objects.filter(company_id=user_id).aggregate(
+            internships_count=Count('pk'),
+        )
+        counters.update(Application.objects.filter(internship__company_id=user_id).aggregate(
+            applications_count=Count('pk'),
+            pending_count=Count('pk', filter=Q(status=Application.PENDING)),
+        ))
+        return counters
+
+    @staticmethod
+    def compute_landlord(user_id):
+        return HousingOffer.objects.filter(owner_id=user_id).aggregate(
+            housing_count=Count('pk'),
+            active_count=Count('pk', filter=Q(is_available=True)),
+        )
+
+    @staticmethod
+    def compute_driver(user_id):
+        return CarpoolingOffer.objects.filter(driver_id=user_id).aggregate(
+            rides_count=Count('pk'),
+            active_count=Count('pk', filter=Q(is_active=True)),
+        )
@@ -2,6 +2,8 @@
 Document Checklist Service
 
 Determines required documents per user type and computes checklist status.
+The latest document of every required type is fetched in one query, for one
+user or a whole page of users.
 """
 from dataclasses import dataclass
 from datetime import datetime
@@ -34,6 +36,10 @@ REQUIRED_DOCUMENTS = {
 }
 
 
+# Attribute holding the checklist memoized on a user instance
+CHECKLIST_CACHE_ATTR = '_document_checklist'
+
+
 @dataclass
 class ChecklistItem:
     """Represents a single item in the document checklist"""
@@ -61,75 +67,158 @@ class DocumentChecklistService:
         return REQUIRED_DOCUMENTS.get(user_type, [])
     
     @staticmethod
-    def get_checklist(user) -> list[ChecklistItem]:
+    def get_latest_documents(users) -> dict:
         """
-        Return checklist items with status for each required document.
+        Fetch the latest document per required type for many users in one query.
+        
+        A ROW_NUMBER() window partitioned by (user, document type) keeps only
+        the most recent upload of each type.
         
         Args:
-            user: CustomUser instance
+            users: Iterable of CustomUser instances
             
         Returns:
-            List of ChecklistItem objects showing status of each required document
+            Dict {user_id: {document_type: UserDocument}}
         """
+        from django.db.models import F, Window
+        from django.db.models.functions import RowNumber
         from apps.users.models_documents import UserDocument
         
-        user_type = user.user_type
-        required_types = DocumentChecklistService.get_required_document_types(user_type)
+        required_types = set()
+        user_ids = []
+        for user in users:
+            types = DocumentChecklistService.get_required_document_types(user.user_type)
+            if types:
+                required_types.update(types)
+                user_ids.append(user.pk)
         
-        if not required_types:
-            return []
+        latest = {user_id: {} for user_id in user_ids}
+        if not user_ids:
+            return latest
         
-        checklist = []
+        documents = UserDocument.objects.filter(
+            user_id__in=user_ids,
+            document_type__in=required_types
+        ).annotate(
+            position=Window(
+                RowNumber(),
+                partition_by=[F('user_id'), F('document_type')],
+                order_by=[F('uploaded_at').desc(), F('pk').desc()]
+            )
+        ).filter(position=1).only('id', 'user_id', 'document_type', 'status', 'uploaded_at')
         
-        for doc_type in required_types:
-            # Get the latest document of this type for the user
-            latest_doc = UserDocument.objects.filter(
-                user=user,
-                document_type=doc_type
-            ).order_by('-uploaded_at').first()
+        for document in documents:
+            latest[document.user_id][document.document_type] = document
+        return latest
+    
+    @staticmethod
+    def build_checklist(user_type: str, latest_documents: dict) -> list[ChecklistItem]:
+        """
+        Build checklist items from the latest document of each type.
+        
+        Args:
+            user_type: The user type
+            latest_documents: Dict {document_type: UserDocument}
             
-            if latest_doc:
-                # Document exists - use its status
-                status = latest_doc.status
-                document_id = latest_doc.id
-                uploaded_at = latest_doc.uploaded_at
-            else:
-                # Document missing
-                status = 'missing'
-                document_id = None
-                uploaded_at = None
+        Returns:
+            List of ChecklistItem objects, in required order
+        """
+        checklist = []
+        
+        for doc_type in DocumentChecklistService.get_required_document_types(user_type):
+            latest_doc = latest_documents.get(doc_type)
             
             checklist.append(ChecklistItem(
                 document_type=doc_type,
                 label=DOCUMENT_TYPE_LABELS.get(doc_type, doc_type),
-                status=status,
-                document_id=document_id,
-                uploaded_at=uploaded_at
+                status=latest_doc.status if latest_doc else 'missing',
+                document_id=latest_doc.id if latest_doc else None,
+                uploaded_at=latest_doc.uploaded_at if latest_doc else None
             ))
         
         return checklist
     
     @staticmethod
-    def get_completion_percentage(user) -> int:
+    def get_checklists(users) -> dict:
         """
-        Return 0-100 percentage of approved documents vs required.
+        Compute the checklists of many users with a single query.
         
         Args:
-            user: CustomUser instance
+            users: Iterable of CustomUser instances
             
         Returns:
-            Integer percentage (0-100)
+            Dict {user_id: list of ChecklistItem}
         """
-        checklist = DocumentChecklistService.get_checklist(user)
+        users = list(users)
+        latest = DocumentChecklistService.get_latest_documents(users)
+        return {
+            user.pk: DocumentChecklistService.build_checklist(user.user_type, latest.get(user.pk, {}))
+            for user in users
+        }
+    
+    @staticmethod
+    def get_checklist(user) -> list[ChecklistItem]:
+        """
+        Return checklist items with status for each required document.
+        
+        The result is memoized on the user instance (request.user lives for
+        one request); saving or deleting one of the user's documents through
+        that instance clears it, see forget().
         
+        Args:
+            user: CustomUser instance
+            
+        Returns:
+            List of ChecklistItem objects showing status of each required document
+        """
+        checklist = getattr(user, CHECKLIST_CACHE_ATTR, None)
+        if checklist is None:
+            checklist = DocumentChecklistService.get_checklists([user])[user.pk]
+            setattr(user, CHECKLIST_CACHE_ATTR, checklist)
+        return checklist
+    
+    @staticmethod
+    def forget(user) -> None:
+        """Drop the checklist memoized on a user instance."""
+        user.__dict__.pop(CHECKLIST_CACHE_ATTR, None)
+    
+    @staticmethod
+    def get_completion_percentages(users) -> dict:
+        """
+        Return {user_id: 0-100 percentage} for many users in one query.
+        """
+        return {
+            user_id: DocumentChecklistService.completion_percentage(checklist)
+            for user_id, checklist in DocumentChecklistService.get_checklists(users).items()
+        }
+    
+    @staticmethod
+    def completion_percentage(checklist: list[ChecklistItem]) -> int:
+        """
+        Return 0-100 percentage of approved items in a checklist.
+        """
         if not checklist:
             # No required documents for this user type
             return 100
         
-        total_required = len(checklist)
         approved_count = sum(1 for item in checklist if item.status == 'approved')
         
-        return int((approved_count / total_required) * 100)
+        return int((approved_count / len(checklist)) * 100)
+    
+    @staticmethod
+    def get_completion_percentage(user) -> int:
+        """
+        Return 0-100 percentage of approved documents vs required.
+        
+        Args:
+            user: CustomUser instance
+            
+        Returns:
+            Integer percentage (0-100)
+        """
+        return DocumentChecklistService.completion_percentage(
+            DocumentChecklistService.get_checklist(user)
+        )
     
     @staticmethod
     def are_all_required_approved(user) -> bool:
@@ -142,8 +231,13 @@ class DocumentChecklistService:
         Returns:
             True if all required documents are approved, False otherwise
         """
-        checklist = DocumentChecklistService.get_checklist(user)
-        
+        return DocumentChecklistService.all_approved(DocumentChecklistService.get_checklist(user))
+    
+    @staticmethod
+    def all_approved(checklist: list[ChecklistItem]) -> bool:
+        """
+        Return True if a checklist is non-empty and fully approved.
+        """
         if not checklist:
             # No required documents for this user type
             return False
@@ -0,0 +1,137 @@
+"""
+Document Review Service
+
+Approves or rejects many UserDocuments in one transaction. Documents are
+updated with a single UPDATE, auto-verification runs once per affected
+user, and notifications and emails go out as one batch.
+"""
+from collections import Counter
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.dashboard.models import StatusCount
+from apps.users.models import CustomUser
+from apps.users.models_documents import UserDocument
+from core.services.dashboard_metrics import DashboardMetricsService
+from core.services.document_checklist_service import DocumentChecklistService
+from core.services.notification_dispatcher import on_documents_reviewed
+from core.services.verification_automator import VerificationAutomator
+
+
+class DocumentReviewService:
+    """
+    Service for bulk document review
+    """
+
+    APPROVE = 'approve'
+    REJECT = 'reject'
+
+    # Action -> resulting document status
+    STATUSES = {
+        APPROVE: 'approved',
+        REJECT: 'rejected',
+    }
+
+    @staticmethod
+    def review(document_ids, admin, action, reason=''):
+        """
+        Approve or reject documents in bulk.
+
+        Documents already in the target status are skipped.
+
+        Args:
+            document_ids: IDs of the UserDocuments to review
+            admin: The admin performing the review
+            action: APPROVE or REJECT
+            reason: Rejection reason (code from REJECTION_TEMPLATES or custom text)
+
+        Returns:
+            dict with 'documents' (reviewed documents) and 'verified'
+            (users verified automatically)
+        """
+        status = DocumentReviewService.STATUSES[action]
+        if action == DocumentReviewService.REJECT:
+            reason = reason or 'Document non conforme'
+        else:
+            reason = ''
+
+        with transaction.atomic():
+            documents = list(
+                UserDocument.objects.select_for_update(of=('self',))
+                .select_related('user')
+                .filter(pk__in=document_ids)
+                .exclude(status=status)
+                .order_by('pk')
+            )
+            if not documents:
+                return {'documents': [], 'verified': []}
+
+            now = timezone.now()
+            UserDocument.objects.filter(pk__in=[document.pk for document in documents]).update(
+                status=status,
+                verified_by=admin,
+                verified_at=now,
+                rejection_reason=reason,
+            )
+
+            # update() sends no post_save: move the status counts here
+            moved = Counter((document.status, document.user.user_type) for document in documents)
+            for (previous, user_type), count in moved.items():
+                StatusCount.adjust(StatusCount.DOCUMENT, previous, user_type, -count)
+                StatusCount.adjust(StatusCount.DOCUMENT, status, user_type, count)
+
+            users = {}
+            for document in documents:
+                document.status = status
+                document.verified_by = admin
+                document.verified_at = now
+                document.rejection_reason = reason
+                document.snapshot_tracked_fields()
+                users.setdefault(document.user_id, document.user)
+            for user in users.values():
+                DocumentChecklistService.forget(user)
+
+            verified = []
+            if action == DocumentReviewService.APPROVE:
+                verified = VerificationAutomator().check_and_verify_many(users.values(), admin)
+            else:
+                DocumentReviewService.mark_incomplete(documents, users, reason)
+
+            on_documents_reviewed(documents, reason=reason or None, verified_users=verified)
+
+        DashboardMetricsService.invalidate('admin')
+        return {'documents': documents, 'verified': verified}
+
+    @staticmethod
+    def mark_incomplete(documents, users, reason):
+        """
+        Set the owners of rejected documents back to 'incomplete'.
+
+        Args:
+            documents: The rejected documents
+            users: Dict {user_id: user} of their owners
+            reason: Rejection reason, copied into the verification note
+        """
+        titles = {}
+        for document in documents:
+            titles.setdefault(document.user_id, []).append(f'« {document.title} »')
+
+        moved = Counter()
+        for user_id, user in users.items():
+            if len(titles[user_id]) == 1:
+                note = f'Document {titles[user_id][0]} rejeté : {reason}'
+            else:
+                note = f'Documents {", ".join(titles[user_id])} rejetés : {reason}'
+            moved[(user.verification_status, user.user_type)] += 1
+            user.verification_status = CustomUser.VERIFICATION_INCOMPLETE
+            user.verification_note = note
+            user.is_verified = False
+            user.snapshot_tracked_fields()
+        CustomUser.objects.bulk_update(users.values(), ['verification_status', 'verification_note', 'is_verified'])
+
+        # bulk_update() sends no post_save: move the status counts here
+        for (previous, user_type), count in moved.items():
+            if previous != CustomUser.VERIFICATION_INCOMPLETE:
+                StatusCount.adjust(StatusCount.USER, previous, user_type, -count)
+                StatusCount.adjust(StatusCount.USER, CustomUser.VERIFICATION_INCOMPLETE, user_type, count)
@@ -4,8 +4,9 @@ Student Evolution Service
 Handles business logic for tracking student academic and professional evolution.
 """
 
+from django.db import transaction
 from django.utils import timezone
-from apps.tracking.models import StudentEvolutionTracking
+from apps.tracking.models import EvolutionEvent, StudentEvolutionTracking
 
 
 class StudentEvolutionService:
@@ -30,7 +31,6 @@ class StudentEvolutionService:
                 'current_level': getattr(student, 'current_level', ''),
                 'domain': getattr(student, 'domain', ''),
                 'status': getattr(student, 'status', 'STUDYING'),
-                'evolution_history': []
             }
         )
         
@@ -45,8 +45,11 @@ class StudentEvolutionService:
         """
         Update student evolution and notify tracking companies.
         
+        Each change is appended as an EvolutionEvent (one bulk INSERT) and
+        the changed trackings are written with a single bulk_update.
+        
         Args:
-            student: StudentProfile instance
+            student: Student CustomUser instance
             new_level: str, new academic level (optional)
             new_domain: str, new domain/field (optional)
             new_status: str, new status (optional)
@@ -56,6 +59,8 @@ class StudentEvolutionService:
         """
         trackings = StudentEvolutionTracking.objects.filter(student=student)
         updated_trackings = []
+        events = []
+        now = timezone.now()
         
         for tracking in trackings:
             changes = []
@@ -80,12 +85,14 @@ class StudentEvolutionService:
             # If there are changes, update history and notify
             if changes:
                 # Add to evolution history
-                history_entry = {
-                    'date': timezone.now().isoformat(),
-                    'changes': changes
-                }
-                tracking.evolution_history.append(history_entry)
-                tracking.save()
+                events.append(EvolutionEvent(
+                    tracking=tracking,
+                    student_id=tracking.student_id,
+                    changes=changes,
+                    created_at=now
+                ))
+                # bulk_update() does not apply auto_now
+                tracking.updated_at = now
                 
                 # TODO: Notify the company about the evolution
                 # NotificationService.send_evolution_notification(
@@ -96,6 +103,16 @@ class StudentEvolutionService:
                 
                 updated_trackings.append(tracking)
         
+        if updated_trackings:
+            with transaction.atomic():
+                EvolutionEvent.objects.bulk_create(events)
+                for tracking, event in zip(updated_trackings, events):
+                    tracking.last_event = event
+                StudentEvolutionTracking.objects.bulk_update(
+                    updated_trackings,
+                    ['current_level', 'domain', 'status', 'last_event', 'updated_at']
+                )
+        
         return updated_trackings
     
     @staticmethod
@@ -115,7 +132,7 @@ class StudentEvolutionService:
         """
         trackings = StudentEvolutionTracking.objects.filter(
             company=company
-        ).select_related('student', 'student__user').order_by('-last_updated_at')
+        ).select_related('student', 'student__user').prefetch_related('events').order_by('-last_updated_at')
         
         if filters:
             if 'status' in filters and filters['status']:
@@ -0,0 +1,189 @@
+"""
+Index Advisor Service
+
+Runs the hot query shapes of the services and views (get_query_corpus) under
+EXPLAIN, flags the tables they read with a sequential scan and suggests an
+index for each: equality columns first, then the ordering, then ranges.
+
+On PostgreSQL, sequential scans are disabled while explaining, so a small
+development database (where the planner scans every table anyway) still
+reveals the queries no index can serve. SQLite plans are read from
+EXPLAIN QUERY PLAN ("SCAN <table>" without an index); they are only
+indicative, as SQLite cannot look up the bare boolean columns Django
+filters on (WHERE "is_active") in an index.
+"""
+import json
+import re
+from collections import namedtuple
+from datetime import timedelta
+
+from django.apps import apps
+from django.db import connections, transaction
+from django.db.models.lookups import Exact, In, IsNull
+from django.utils import timezone
+
+
+# Placeholder primary key: plans do not depend on the rows being present
+SAMPLE_ID = 1
+
+SQLITE_SCAN = re.compile(r'\bSCAN (?:TABLE )?(\w+)(?: AS \w+)?(?P<index> USING)?')
+
+Finding = namedtuple('Finding', ['name', 'table', 'suggestion', 'plan'])
+
+
+def get_query_corpus():
+    """(name, queryset) pairs of the hot queries, built on each call."""
+    from apps.applications.models import Application
+    from apps.calendars.models import InternshipCalendar
+    from apps.internships.models import Internship
+    from apps.messaging.models import Message
+    from apps.notifications.models import Notification
+    from apps.recommendations.models import InternRecommendation
+    from apps.users.models_documents import UserDocument
+    from core.services.partner_service import PartnerPageService
+    from core.services.verification_service import VerificationService
+
+    today = timezone.now().date()
+    return [
+        # NotificationListView, navbar dropdown
+        ('notifications.list', Notification.objects.filter(recipient_id=SAMPLE_ID).order_by('-created_at')[:20]),
+        ('notifications.unread', Notification.objects.filter(recipient_id=SAMPLE_ID, is_read=False).order_by('-created_at')),
+        # Conversation.get_unread_count, ConversationDetailView
+        ('messaging.unread', Message.objects.filter(conversation_id=SAMPLE_ID, is_read=False).exclude(sender_id=SAMPLE_ID)),
+        # ApplicationManageListView
+        ('applications.company', Application.objects.filter(
+            internship__company_id=SAMPLE_ID, status='pending'
+        ).order_by('-created_at')[:20]),
+        # InternshipListView, home page
+        ('internships.active', Internship.objects.filter(is_active=True).order_by('-created_at')[:20]),
+        # PublicCalendarsView, InternshipCalendarService.get_upcoming_calendars
+        ('calendars.public', InternshipCalendar.objects.filter(
+            is_published=True, is_visible_to_companies=True,
+            start_date__gte=today, start_date__lte=today + timedelta(days=180),
+        ).order_by('start_date')[:20]),
+        # PartnerCompaniesView
+        ('partners.directory', PartnerPageService.get_partner_companies().order_by('-partner_since')[:20]),
+        # RecommendedStudentsView
+        ('recommendations.public', InternRecommendation.objects.filter(is_public=True).order_by('-rating', '-created_at')[:20]),
+        # PendingVerificationsView
+        ('verification.pending', VerificationService.get_pending_verifications()[:20]),
+        # AdminDocumentListView
+        ('documents.review', UserDocument.objects.filter(status='pending').order_by('-uploaded_at')[:25]),
+    ]
+
+
+class IndexAdvisorService:
+    """
+    Service explaining the query corpus and suggesting indexes
+    """
+
+    @staticmethod
+    def explain(queryset):
+        """
+        Get the plan of a queryset.
+
+        Returns:
+            PostgreSQL: the JSON plan (dict); other databases: the plan text
+        """
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return queryset.explain()
+        with transaction.atomic(using=queryset.db):
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+            plan = json.loads(queryset.explain(format='json'))
+        return plan[0] if isinstance(plan, list) else plan
+
+    @staticmethod
+    def scanned_tables(plan):
+        """
+        Tables read with a sequential scan in a plan.
+
+        Returns:
+            list of table names, in plan order
+        """
+        if isinstance(plan, str):
+            return [
+                match.group(1) for match in SQLITE_SCAN.finditer(plan)
+                if not match.group('index')
+            ]
+        tables = []
+        nodes = [plan.get('Plan', plan)]
+        while nodes:
+            node = nodes.pop(0)
+            if node.get('Node Type') == 'Seq Scan':
+                tables.append(node['Relation Name'])
+            nodes.extend(node.get('Plans', []))
+        return tables
+
+    @staticmethod
+    def suggest_index(queryset, table):
+        """
+        Index serving the filters and ordering of a queryset on one of its tables.
+
+        Equality lookups come first (booleans last), then the ordering, then the
+        other lookups (ranges): an index can only be walked in order past equalities.
+
+        Returns:
+            list of field names ('-' for descending), empty when nothing applies
+        """
+        model = next((m for m in apps.get_models() if m._meta.db_table == table), None)
+        if model is None:
+            return []
+        query = queryset.query
+        columns = {field.column: field.name for field in model._meta.concrete_fields}
+
+        equalities, ranges = [], []
+        pending = [query.where]
+        while pending:
+            node = pending.pop(0)
+            if getattr(node, 'negated', False):
+                continue
+            if hasattr(node, 'children'):
+                pending.extend(node.children)
+                continue
+            target = getattr(node.lhs, 'target', None)
+            alias = getattr(node.lhs, 'alias', None)
+            if target is None or alias not in query.alias_map or query.alias_map[alias].table_name != table:
+                continue
+            bucket = equalities if isinstance(node, (Exact, In, IsNull)) else ranges
+            bucket.append(columns.get(target.column, target.name))
+        # Flags narrow down little: after the other equalities
+        equalities.sort(key=lambda name: model._meta.get_field(name).get_internal_type() == 'BooleanField')
+
+        ordering = []
+        if model is queryset.model:
+            for item in query.order_by or model._meta.ordering:
+                if isinstance(item, str) and '__' not in item and item.lstrip('-') in {
+                    field.name for field in model._meta.concrete_fields
+                }:
+                    ordering.append(item)
+
+        suggestion = []
+        for name in equalities + ordering + ranges:
+            if name.lstrip('-') not in {item.lstrip('-') for item in suggestion}:
+                suggestion.append(name)
+        return suggestion
+
+    @staticmethod
+    def analyze(corpus=None):
+        """
+        Explain each query of the corpus.
+
+        Args:
+            corpus: (name, queryset) pairs, get_query_corpus() by default
+
+        Returns:
+            list of Finding, one per sequentially scanned table
+        """
+        findings = []
+        for name, queryset in corpus if corpus is not None else get_query_corpus():
+            plan = IndexAdvisorService.explain(queryset)
+            for table in IndexAdvisorService.scanned_tables(plan):
+                findings.append(Finding(
+                    name=name,
+                    table=table,
+                    suggestion=IndexAdvisorService.suggest_index(queryset, table),
+                    plan=plan,
+                ))
+        return findings
@@ -0,0 +1,238 @@
+"""
+Mail Outbox Service
+
+Email tasks render their messages and enqueue them here instead of calling
+send_mail. The outbox flusher drains pending rows in batches over a single
+persistent connection, so a burst of emails costs one SMTP session instead
+of one per message.
+
+Every recipient gets its own OutboxEmail row: an optional dedup key is
+suffixed with the address, so enqueuing the same email twice (task
+redelivery, double submission) never mails anyone twice. Failed deliveries
+are retried with exponential backoff until MAIL_OUTBOX_MAX_ATTEMPTS.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.notifications.models import OutboxEmail
+
+
+logger = logging.getLogger(__name__)
+
+
+class MailOutboxService:
+    """
+    Service for queuing emails and delivering them in batches
+    """
+
+    @staticmethod
+    def enqueue(subject, body, recipients, html_body='', dedup_key=None, from_email=None):
+        """
+        Queue one email per recipient and schedule a flush after commit.
+
+        Args:
+            subject: Email subject
+            body: Plain text body
+            recipients: Iterable of email addresses (blanks and duplicates are ignored)
+            html_body: Optional HTML alternative
+            dedup_key: Optional key; rows already queued under the same key
+                for a recipient are skipped
+            from_email: Sender, defaults to DEFAULT_FROM_EMAIL
+
+        Returns:
+            int, number of emails queued
+        """
+        return MailOutboxService.enqueue_many([{
+            'subject': subject,
+            'body': body,
+            'recipients': recipients,
+            'html_body': html_body,
+            'dedup_key': dedup_key,
+            'from_email': from_email,
+        }])
+
+    @staticmethod
+    def enqueue_many(messages):
+        """
+        Queue many different emails with one dedup lookup and one bulk insert.
+
+        Args:
+            messages: Iterable of dicts taking the keyword arguments of enqueue()
+
+        Returns:
+            int, number of emails queued
+        """
+        emails = []
+        for message in messages:
+            dedup_key = message.get('dedup_key')
+            recipients = message['recipients']
+            addresses = dict.fromkeys(address.strip().lower() for address in recipients if address)
+            emails.extend(
+                OutboxEmail(
+                    to_email=address,
+                    from_email=message.get('from_email') or settings.DEFAULT_FROM_EMAIL,
+                    subject=message['subject'],
+                    body=message['body'],
+                    html_body=message.get('html_body', ''),
+                    dedup_key=f'{dedup_key}:{address}' if dedup_key else None
+                )
+                for address in addresses
+            )
+        keys = [email.dedup_key for email in emails if email.dedup_key]
+        if keys:
+            existing = set(OutboxEmail.objects.filter(dedup_key__in=keys).values_list('dedup_key', flat=True))
+            emails = [email for email in emails if email.dedup_key not in existing]
+        if not emails:
+            return 0
+
+        OutboxEmail.objects.bulk_create(emails, ignore_conflicts=bool(keys))
+        transaction.on_commit(MailOutboxService.schedule_flush)
+        return len(emails)
+
+    @staticmethod
+    def schedule_flush():
+        """Ask a worker to drain the outbox."""
+        from core.tasks.email_tasks import flush_mail_outbox
+        flush_mail_outbox.delay()
+
+    @staticmethod
+    def build_message(email, connection=None):
+        """
+        Turn an outbox row into an EmailMultiAlternatives.
+        """
+        message = EmailMultiAlternatives(
+            subject=email.subject,
+            body=email.body,
+            from_email=email.from_email,
+            to=[email.to_email],
+            connection=connection,
+        )
+        if email.html_body:
+            message.attach_alternative(email.html_body, 'text/html')
+        return message
+
+    @staticmethod
+    def retry_delay(attempts):
+        """
+        Backoff before the next attempt: base delay doubled per failed attempt.
+
+        Args:
+            attempts: Number of attempts made so far (>= 1)
+
+        Returns:
+            timedelta
+        """
+        return timedelta(seconds=settings.MAIL_OUTBOX_RETRY_DELAY * 2 ** (attempts - 1))
+
+    @staticmethod
+    def claim(emails, batch_size):
+        """
+        Claim a batch of due emails for delivery, in a short transaction.
+
+        Rows are selected with SELECT ... FOR UPDATE SKIP LOCKED where the
+        database supports it and leased by pushing next_attempt_at
+        MAIL_OUTBOX_CLAIM_TIMEOUT seconds ahead: concurrent flushers skip
+        them, and rows of a flusher that died become due again afterwards.
+
+        Args:
+            emails: OutboxEmail queryset to claim from
+            batch_size: Maximum rows claimed
+
+        Returns:
+            list of OutboxEmail
+        """
+        with transaction.atomic():
+            batch = list(
+                emails.select_for_update(skip_locked=True)
+                .filter(status=OutboxEmail.PENDING, next_attempt_at__lte=timezone.now())
+                .order_by('pk')[:batch_size]
+            )
+            if batch:
+                lease = timezone.now() + timedelta(seconds=settings.MAIL_OUTBOX_CLAIM_TIMEOUT)
+                OutboxEmail.objects.filter(pk__in=[email.pk for email in batch]).update(next_attempt_at=lease)
+        return batch
+
+    @staticmethod
+    def record_sent(email):
+        OutboxEmail.objects.filter(pk=email.pk).update(
+            status=OutboxEmail.SENT,
+            sent_at=timezone.now(),
+            attempts=F('attempts') + 1,
+            last_error=''
+        )
+
+    @staticmethod
+    def record_failure(email, exc):
+        email.attempts += 1
+        email.last_error = str(exc)[:1000]
+        if email.attempts >= settings.MAIL_OUTBOX_MAX_ATTEMPTS:
+            email.status = OutboxEmail.FAILED
+            logger.error(f"Giving up on outbox email {email.pk} to {email.to_email}: {exc}")
+        else:
+            email.next_attempt_at = timezone.now() + MailOutboxService.retry_delay(email.attempts)
+        email.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
+
+    @staticmethod
+    def flush(batch_size=None, connection=None, queryset=None):
+        """
+        Deliver every due email, batch by batch, over one connection.
+
+        Each batch is claimed in a short transaction (see claim()), sent
+        outside of any transaction, and the outcome of every message is
+        recorded as soon as it is known: no database lock is held during
+        SMTP exchanges, and a failure later in the batch never undoes the
+        record of the emails already delivered.
+
+        Args:
+            batch_size: Rows claimed per batch (default MAIL_OUTBOX_BATCH_SIZE)
+            connection: Email backend to use (default: get_connection())
+            queryset: Optional OutboxEmail queryset restricting the rows to deliver
+
+        Returns:
+            dict with 'sent' and 'failed' counts
+        """
+        batch_size = batch_size or settings.MAIL_OUTBOX_BATCH_SIZE
+        connection = connection or get_connection()
+        emails = OutboxEmail.objects.all() if queryset is None else queryset
+        sent = failed = 0
+
+        connection.open()
+        try:
+            while True:
+                batch = MailOutboxService.claim(emails, batch_size)
+                if not batch:
+                    break
+
+                for index, email in enumerate(batch):
+                    try:
+                        connection.send_messages([MailOutboxService.build_message(email, connection)])
+                    except Exception as exc:
+                        MailOutboxService.record_failure(email, exc)
+                        failed += 1
+                        # The session may be unusable after an error: reconnect for the rest
+                        try:
+                            connection.close()
+                            connection.open()
+                        except Exception as reconnect_exc:
+                            logger.error(f"Mail outbox flush stopped, cannot reconnect: {reconnect_exc}")
+                            # Hand the rest of the batch back to the next flush
+                            OutboxEmail.objects.filter(
+                                pk__in=[remaining.pk for remaining in batch[index + 1:]]
+                            ).update(next_attempt_at=timezone.now())
+                            return {'sent': sent, 'failed': failed}
+                    else:
+                        MailOutboxService.record_sent(email)
+                        sent += 1
+
+                if len(batch) < batch_size:
+                    break
+        finally:
+            connection.close()
+
+        return {'sent': sent, 'failed': failed}
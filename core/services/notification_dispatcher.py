@@ -4,16 +4,23 @@ Notification Dispatcher Service
 Handles dispatching notifications for document and profile verification events.
 Creates in-app notifications and triggers Celery email tasks.
 """
+from django.db import transaction
 
 from apps.notifications.models import Notification
 from apps.users.models import CustomUser
 from core.tasks.email_tasks import (
     send_document_approved_email,
     send_document_rejected_email,
+    send_document_review_emails,
     send_profile_verified_email,
     send_profile_status_email,
     send_document_submitted_admin_email,
 )
+from core.tasks.notification_tasks import fan_out_notification
+
+
+# Named recipient groups that can be resolved inside a Celery worker
+AUDIENCE_STAFF = 'staff'
 
 
 # French rejection reason templates
@@ -27,6 +34,60 @@ REJECTION_TEMPLATES = [
 ]
 
 
+def get_audience(audience):
+    """
+    Resolve a named audience to a user QuerySet.
+    
+    Args:
+        audience: One of the AUDIENCE_* constants
+    """
+    if audience == AUDIENCE_STAFF:
+        return CustomUser.objects.filter(is_staff=True, is_active=True)
+    raise ValueError(f"Unknown notification audience: {audience}")
+
+
+def dispatch_notification(notification_type, title, message, link=None,
+                          recipients=None, audience=None, defer=False):
+    """
+    Create the same in-app notification for one or many recipients.
+    
+    Rows are inserted with chunked bulk_create. With defer=True the
+    fan-out runs in a Celery task, so the caller does constant work
+    whatever the size of the audience.
+    
+    Args:
+        recipients: iterable of users (or user ids), ignored when audience is given
+        audience: One of the AUDIENCE_* constants
+        defer: bool, run the fan-out in a Celery task
+    """
+    if defer:
+        recipient_ids = None
+        if not audience:
+            recipient_ids = [getattr(recipient, 'pk', recipient) for recipient in recipients]
+        fan_out_notification.delay(
+            notification_type, title, message, link,
+            audience=audience, recipient_ids=recipient_ids
+        )
+        return None
+    
+    if audience:
+        recipients = get_audience(audience)
+    return Notification.fan_out(recipients, notification_type, title, message, link=link)
+
+
+def get_rejection_message(reason):
+    """
+    Look up the French message if reason is a template code.
+    
+    Args:
+        reason: A code from REJECTION_TEMPLATES or custom text
+    """
+    for code, message in REJECTION_TEMPLATES:
+        if code == reason:
+            return message
+    return reason
+
+
 def on_document_submitted(document):
     """
     Notify all admins when a document is submitted for review.
@@ -34,18 +95,15 @@ def on_document_submitted(document):
     Args:
         document: The submitted document instance
     """
-    # Get all admin users
-    admins = CustomUser.objects.filter(is_staff=True, is_active=True)
-    
-    for admin in admins:
-        # Create in-app notification for each admin
-        Notification.create_notification(
-            recipient=admin,
-            notification_type='document_submitted',
-            title='Nouveau document soumis',
-            message=f'Un nouveau document a été soumis par {document.user.get_full_name() or document.user.email} et attend votre vérification.',
-            link=f'/dashboard/admin/documents/{document.id}/',
-        )
+    # Fan out to every admin in the background
+    dispatch_notification(
+        notification_type='document_submitted',
+        title='Nouveau document soumis',
+        message=f'Un nouveau document a été soumis par {document.user.get_full_name() or document.user.email} et attend votre vérification.',
+        link=f'/dashboard/admin/documents/{document.id}/',
+        audience=AUDIENCE_STAFF,
+        defer=True,
+    )
     
     # Trigger Celery email task for admin notification
     send_document_submitted_admin_email.delay(document.id)
@@ -59,8 +117,8 @@ def on_document_approved(document):
         document: The approved document instance
     """
     # Create in-app notification for document owner
-    Notification.create_notification(
-        recipient=document.user,
+    dispatch_notification(
+        recipients=[document.user],
         notification_type='document_approved',
         title='Document approuvé',
         message=f'Votre document "{document.get_document_type_display()}" a été approuvé.',
@@ -79,16 +137,11 @@ def on_document_rejected(document, reason):
         document: The rejected document instance
         reason: The rejection reason (can be a code from REJECTION_TEMPLATES or custom text)
     """
-    # Look up the French message if reason is a template code
-    reason_message = reason
-    for code, message in REJECTION_TEMPLATES:
-        if code == reason:
-            reason_message = message
-            break
+    reason_message = get_rejection_message(reason)
     
     # Create in-app notification for document owner
-    Notification.create_notification(
-        recipient=document.user,
+    dispatch_notification(
+        recipients=[document.user],
         notification_type='document_rejected',
         title='Document refusé',
         message=f'Votre document "{document.get_document_type_display()}" a été refusé. Raison: {reason_message}',
@@ -99,6 +152,57 @@ def on_document_rejected(document, reason):
     send_document_rejected_email.delay(document.id, reason_message)
 
 
+def on_documents_reviewed(documents, reason=None, verified_users=()):
+    """
+    Notify the owners of documents reviewed in bulk.
+    
+    Every in-app notification (one per document, plus one per verified
+    profile) is inserted with a single bulk_create, and one Celery task
+    queues all the emails once the review transaction commits.
+    
+    Args:
+        documents: The reviewed document instances (all approved or all rejected)
+        reason: The rejection reason, None for approvals
+        verified_users: Users whose profile the review verified
+    """
+    reason_message = get_rejection_message(reason) if reason else ''
+    notifications = []
+    
+    for document in documents:
+        if document.status == 'approved':
+            notifications.append(Notification(
+                recipient_id=document.user_id,
+                notification_type='document_approved',
+                title='Document approuvé',
+                message=f'Votre document "{document.get_document_type_display()}" a été approuvé.',
+                link='/dashboard/documents/',
+            ))
+        else:
+            notifications.append(Notification(
+                recipient_id=document.user_id,
+                notification_type='document_rejected',
+                title='Document refusé',
+                message=f'Votre document "{document.get_document_type_display()}" a été refusé. Raison: {reason_message}',
+                link='/dashboard/documents/',
+            ))
+    for user in verified_users:
+        notifications.append(Notification(
+            recipient_id=user.pk,
+            notification_type='profile_verified',
+            title='Profil vérifié',
+            message='Félicitations ! Votre profil a été entièrement vérifié. Vous avez maintenant accès à toutes les fonctionnalités de la plateforme.',
+            link='/dashboard/',
+        ))
+    Notification.bulk_notify(notifications)
+    
+    # Trigger one Celery email task for the whole review
+    document_ids = [document.pk for document in documents]
+    verified_user_ids = [user.pk for user in verified_users]
+    transaction.on_commit(lambda: send_document_review_emails.delay(
+        document_ids, reason_message, verified_user_ids
+    ))
+
+
 def on_profile_verified(user):
     """
     Notify user when their profile is fully verified.
@@ -107,8 +211,8 @@ def on_profile_verified(user):
         user: The verified user instance
     """
     # Create in-app notification
-    Notification.create_notification(
-        recipient=user,
+    dispatch_notification(
+        recipients=[user],
         notification_type='profile_verified',
         title='Profil vérifié',
         message='Félicitations ! Votre profil a été entièrement vérifié. Vous avez maintenant accès à toutes les fonctionnalités de la plateforme.',
@@ -144,8 +248,8 @@ def on_profile_status_changed(user, old_status, new_status, note=None):
         message += f' Note: {note}'
     
     # Create in-app notification
-    Notification.create_notification(
-        recipient=user,
+    dispatch_notification(
+        recipients=[user],
         notification_type=notification_type,
         title='Statut de profil modifié',
         message=message,
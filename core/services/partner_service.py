@@ -2,10 +2,25 @@
 Partner Page Service
 
 Handles business logic for the public partner companies page.
+
+The directory stats, sectors and cities are computed together in one pass
+over the partner rows and cached as a snapshot (cached_service_call), with
+an ETag and a timestamp for HTTP conditional requests. apps/users/signals.py
+invalidates the snapshot when a partner field of a CompanyProfile changes.
 """
+import hashlib
+import json
+from collections import Counter
+from decimal import Decimal
+
+from django.db.models import Q
+from django.utils import timezone
 
-from django.db.models import Q, Sum, Avg
 from apps.users.profile_models import CompanyProfile
+from core.cache import cached_service_call, invalidate_tags
+
+
+DIRECTORY_TAG = 'partner-directory'
 
 
 class PartnerPageService:
@@ -50,6 +65,72 @@ class PartnerPageService:
         
         return companies
     
+    @staticmethod
+    @cached_service_call(timeout='PARTNER_SNAPSHOT_CACHE_TIMEOUT', tags=(DIRECTORY_TAG,))
+    def get_directory_snapshot():
+        """
+        Get the partner directory snapshot, computed with a single query.
+        
+        Returns:
+            dict with keys:
+                - stats (dict): see get_partner_stats()
+                - sectors (list): sorted unique sectors
+                - cities (list): sorted unique cities
+                - etag (str): hash of the content above
+                - last_modified (datetime): when the snapshot was computed
+        """
+        rows = CompanyProfile.objects.filter(is_partner=True).values_list(
+            'sector', 'city', 'total_interns_hosted', 'average_rating'
+        )
+        
+        total_partners = 0
+        total_interns_hosted = 0
+        rating_sum = Decimal(0)
+        sectors = Counter()
+        cities = set()
+        for sector, city, interns_hosted, rating in rows:
+            total_partners += 1
+            total_interns_hosted += interns_hosted or 0
+            rating_sum += rating or 0
+            if sector:
+                sectors[sector] += 1
+            if city:
+                cities.add(city)
+        
+        stats = {
+            'total_partners': total_partners,
+            'total_interns_hosted': total_interns_hosted,
+            'sectors_count': len(sectors),
+            'average_rating': float(rating_sum / total_partners) if total_partners else 0.0,
+            'cities_count': len(cities),
+            'top_sectors': [
+                {'sector': sector, 'count': count}
+                for sector, count in sorted(sectors.items(), key=lambda item: (-item[1], item[0]))[:5]
+            ],
+        }
+        content = {
+            'stats': stats,
+            'sectors': sorted(sectors),
+            'cities': sorted(cities),
+        }
+        etag = hashlib.md5(json.dumps(content, sort_keys=True).encode()).hexdigest()
+        return dict(content, etag=etag, last_modified=timezone.now())
+    
+    @staticmethod
+    def invalidate_directory_snapshot():
+        """Drop the cached partner directory snapshot."""
+        invalidate_tags(DIRECTORY_TAG)
+    
+    @staticmethod
+    def get_directory_etag(request=None, *args, **kwargs):
+        """ETag of the partner directory (usable as a condition() etag_func)."""
+        return PartnerPageService.get_directory_snapshot()['etag']
+    
+    @staticmethod
+    def get_directory_last_modified(request=None, *args, **kwargs):
+        """Last-Modified of the partner directory (usable as a condition() last_modified_func)."""
+        return PartnerPageService.get_directory_snapshot()['last_modified']
+    
     @staticmethod
     def get_sectors_list():
         """
@@ -58,12 +139,7 @@ class PartnerPageService:
         Returns:
             list of sector names (sorted)
         """
-        sectors = CompanyProfile.objects.filter(
-            is_partner=True,
-            sector__isnull=False
-        ).exclude(sector='').values_list('sector', flat=True).distinct()
-        
-        return sorted(list(sectors))
+        return list(PartnerPageService.get_directory_snapshot()['sectors'])
     
     @staticmethod
     def get_cities_list():
@@ -73,12 +149,7 @@ class PartnerPageService:
         Returns:
             list of city names (sorted)
         """
-        cities = CompanyProfile.objects.filter(
-            is_partner=True,
-            city__isnull=False
-        ).exclude(city='').values_list('city', flat=True).distinct()
-        
-        return sorted(list(cities))
+        return list(PartnerPageService.get_directory_snapshot()['cities'])
     
     @staticmethod
     def get_partner_stats():
@@ -92,22 +163,9 @@ class PartnerPageService:
                 - sectors_count (int): number of unique sectors
                 - average_rating (float): average rating across all partners
                 - cities_count (int): number of unique cities
+                - top_sectors (list): up to 5 {'sector', 'count'} dicts, most partners first
         """
-        partners = CompanyProfile.objects.filter(is_partner=True)
-        
-        stats = {
-            'total_partners': partners.count(),
-            'total_interns_hosted': partners.aggregate(
-                total=Sum('total_interns_hosted')
-            )['total'] or 0,
-            'sectors_count': partners.exclude(sector='').values('sector').distinct().count(),
-            'average_rating': partners.aggregate(
-                avg=Avg('average_rating')
-            )['avg'] or 0.0,
-            'cities_count': partners.exclude(city='').values('city').distinct().count(),
-        }
-        
-        return stats
+        return dict(PartnerPageService.get_directory_snapshot()['stats'])
     
     @staticmethod
     def get_company_by_id(company_id):
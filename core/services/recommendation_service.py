@@ -4,8 +4,12 @@ Recommendation Service
 Handles business logic for company recommendations of students/interns.
 """
 
-from django.db.models import Count, Avg, Q
+from django.db.models import F
 from apps.recommendations.models import InternRecommendation
+from core.cache import cached_service_call, invalidate_tags
+
+
+RECOMMENDED_STUDENTS_TAG = 'recommended-students'
 
 
 class RecommendationService:
@@ -49,9 +53,8 @@ class RecommendationService:
             recommended_domains=data.get('recommended_domains', []),
         )
         
-        # Update student profile statistics
-        student.total_recommendations = student.recommendations_received.count()
-        student.save()
+        # Student profile statistics are bumped by the post_save signal
+        # (StudentProfile.adjust_recommendation_stats)
         
         # TODO: Trigger notification to student
         # NotificationService.send_recommendation_notification(student, company)
@@ -89,28 +92,49 @@ class RecommendationService:
             QuerySet of StudentProfile instances with annotations:
                 - recommendation_count: number of recommendations
                 - avg_rating: average rating across recommendations
+        
+        Reads the StudentProfile aggregates and the recommended domains
+        maintained by signals, so filters and ordering use their indexes
+        instead of aggregating recommendations. The matching student IDs
+        are cached per filter set.
         """
         from apps.users.profile_models import StudentProfile
         
-        students = StudentProfile.objects.filter(
-            recommendations_received__isnull=False
-        ).annotate(
-            recommendation_count=Count('recommendations_received', distinct=True),
-            avg_rating=Avg('recommendations_received__rating')
-        ).distinct()
-        
-        if filters:
-            if 'min_rating' in filters and filters['min_rating']:
-                students = students.filter(avg_rating__gte=filters['min_rating'])
-            
-            if 'sector' in filters and filters['sector']:
-                students = students.filter(
-                    recommendations_received__recommended_domains__contains=[filters['sector']]
-                )
-            
-            if 'min_recommendations' in filters and filters['min_recommendations']:
-                students = students.filter(
-                    recommendation_count__gte=filters['min_recommendations']
-                )
-        
-        return students.order_by('-recommendation_count', '-avg_rating')
+        student_ids = RecommendationService.get_recommended_student_ids(filters or {})
+        return StudentProfile.objects.filter(pk__in=student_ids).annotate(
+            recommendation_count=F('total_recommendations'),
+            avg_rating=F('average_recommendation_rating')
+        ).order_by('-recommendation_count', '-avg_rating')
+    
+    @staticmethod
+    @cached_service_call(timeout='RECOMMENDATION_CACHE_TIMEOUT', tags=(RECOMMENDED_STUDENTS_TAG,))
+    def get_recommended_student_ids(filters):
+        """
+        Get the IDs of the students matching get_recommended_students() filters.
+        
+        Args:
+            filters: dict, see get_recommended_students()
+        
+        Returns:
+            list of StudentProfile IDs
+        """
+        from apps.users.profile_models import StudentProfile
+        
+        students = StudentProfile.objects.filter(total_recommendations__gt=0)
+        
+        if filters.get('min_rating'):
+            students = students.filter(average_recommendation_rating__gte=filters['min_rating'])
+        
+        if filters.get('sector'):
+            # One RecommendedDomain row per (student, domain): no duplicates
+            students = students.filter(recommendation_summary__domains__domain=filters['sector'])
+        
+        if filters.get('min_recommendations'):
+            students = students.filter(total_recommendations__gte=filters['min_recommendations'])
+        
+        return list(students.values_list('pk', flat=True))
+    
+    @staticmethod
+    def invalidate_cache():
+        """Drop the cached recommended students lists."""
+        invalidate_tags(RECOMMENDED_STUDENTS_TAG)
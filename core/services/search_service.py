@@ -0,0 +1,262 @@
+"""
+Internship Search Service
+
+Maintains the internship search index and answers ranked search queries.
+
+PostgreSQL stores a weighted tsvector on InternshipSearchDocument (GIN
+indexed), SQLite (development and tests) mirrors the documents into an
+FTS5 virtual table. Any other backend falls back to icontains filtering.
+"""
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+from apps.internships.models import Internship, InternshipSearchDocument
+from apps.internships.utils import parse_duration_months
+
+
+# Name of the SQLite FTS5 table (created by internships migration 0002)
+FTS_TABLE = 'internships_search_fts'
+
+# Text search configuration used on PostgreSQL
+SEARCH_CONFIG = 'french'
+
+# Column weights: title > company/location > duration > description
+FTS_COLUMN_WEIGHTS = (10.0, 1.0, 5.0, 5.0, 2.0)
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+# Buckets match the duration filter offered on the internship list
+DURATION_BUCKETS = [
+    (2, '1-2 mois'),
+    (4, '3-4 mois'),
+    (6, '5-6 mois'),
+]
+LONG_DURATION_BUCKET = '6+ mois'
+
+
+def duration_bucket(duration):
+    """
+    Map a free-text duration ("3 mois", "3-4", ...) to a bucket label.
+
+    Returns:
+        str bucket label, or '' when no number can be found
+    """
+    _, months = parse_duration_months(duration)
+    if months is None:
+        return ''
+    for upper, label in DURATION_BUCKETS:
+        if months <= upper:
+            return label
+    return LONG_DURATION_BUCKET
+
+
+def _tokenize(query):
+    return TOKEN_RE.findall(query.lower())
+
+
+def _search_vector():
+    return (
+        SearchVector('title', weight='A', config=SEARCH_CONFIG)
+        + SearchVector('company_name', weight='B', config=SEARCH_CONFIG)
+        + SearchVector('location', weight='B', config=SEARCH_CONFIG)
+        + SearchVector('duration_bucket', weight='C', config=SEARCH_CONFIG)
+        + SearchVector('description', weight='D', config=SEARCH_CONFIG)
+    )
+
+
+class InternshipSearchService:
+    """Service for indexing and searching internships"""
+
+    @staticmethod
+    def build_document_values(internship):
+        """
+        Compute the denormalized search document fields for an internship.
+
+        Args:
+            internship: Internship instance
+
+        Returns:
+            dict of InternshipSearchDocument field values
+        """
+        company = internship.company
+        return {
+            'title': internship.title,
+            'description': internship.description or '',
+            'company_name': f"{company.get_display_name()} {company.username}".strip(),
+            'location': internship.location or '',
+            'duration_bucket': duration_bucket(internship.duration),
+        }
+
+    @staticmethod
+    def index_internship(internship):
+        """
+        Create or refresh the search document of a single internship.
+
+        Args:
+            internship: Internship instance
+
+        Returns:
+            InternshipSearchDocument instance
+        """
+        return InternshipSearchService._index_many([internship])[0]
+
+    @staticmethod
+    def index_company(company):
+        """
+        Refresh the search documents of every internship of a company.
+
+        Args:
+            company: CustomUser instance (company)
+
+        Returns:
+            int, number of documents refreshed
+        """
+        internships = Internship.objects.filter(company=company).select_related('company')
+        return len(InternshipSearchService._index_many(internships))
+
+    @staticmethod
+    def remove_internship(internship_id):
+        """
+        Drop an internship from the backend index.
+
+        The InternshipSearchDocument row itself is removed by the
+        cascade on Internship deletion.
+
+        Args:
+            internship_id: int, Internship primary key
+        """
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [internship_id])
+
+    @staticmethod
+    def rebuild(batch_size=500):
+        """
+        Rebuild the search index for all internships, in batches.
+
+        Args:
+            batch_size: int, number of internships processed per batch
+
+        Returns:
+            int, number of documents indexed
+        """
+        internships = Internship.objects.select_related('company').order_by('pk')
+        total = 0
+        last_pk = 0
+        while True:
+            batch = list(internships.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            total += len(InternshipSearchService._index_many(batch))
+            last_pk = batch[-1].pk
+        return total
+
+    @staticmethod
+    def search(queryset, query):
+        """
+        Restrict an Internship queryset to a search query, ranked by relevance.
+
+        Every term is matched as a prefix so results follow the user
+        while typing. The returned queryset is annotated with
+        `search_rank` and ordered by it (best match first).
+
+        Args:
+            queryset: Internship QuerySet to filter
+            query: str, raw user input
+
+        Returns:
+            Internship QuerySet
+        """
+        tokens = _tokenize(query or '')
+        if not tokens:
+            return queryset
+
+        if connection.vendor == 'postgresql':
+            search_query = SearchQuery(
+                ' & '.join(f'{token}:*' for token in tokens),
+                config=SEARCH_CONFIG,
+                search_type='raw'
+            )
+            return queryset.filter(
+                search_document__search_vector=search_query
+            ).annotate(
+                search_rank=SearchRank(F('search_document__search_vector'), search_query)
+            ).order_by('-search_rank')
+
+        if connection.vendor == 'sqlite':
+            match = ' '.join(f'"{token}"*' for token in tokens)
+            weights = ', '.join(str(w) for w in FTS_COLUMN_WEIGHTS)
+            pk_column = f'"{queryset.model._meta.db_table}"."{queryset.model._meta.pk.column}"'
+            # Matches are joined in SQL, so the queryset filters apply to all of them.
+            # bm25() is lower-is-better, flip it so higher ranks come first
+            return queryset.filter(
+                pk__in=RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [match])
+            ).annotate(
+                search_rank=RawSQL(
+                    f'SELECT -bm25({FTS_TABLE}, {weights}) FROM {FTS_TABLE} '
+                    f'WHERE {FTS_TABLE} MATCH %s AND rowid = {pk_column}',
+                    [match],
+                    output_field=FloatField()
+                )
+            ).order_by('-search_rank')
+
+        condition = Q()
+        for token in tokens:
+            condition &= (
+                Q(title__icontains=token) |
+                Q(description__icontains=token) |
+                Q(company__username__icontains=token) |
+                Q(location__icontains=token)
+            )
+        return queryset.filter(condition).annotate(search_rank=Value(0.0)).order_by('-created_at')
+
+    @staticmethod
+    def _index_many(internships):
+        documents = [
+            InternshipSearchDocument(
+                internship=internship,
+                **InternshipSearchService.build_document_values(internship)
+            )
+            for internship in internships
+        ]
+        if documents:
+            InternshipSearchDocument.objects.bulk_create(
+                documents,
+                update_conflicts=True,
+                unique_fields=['internship'],
+                update_fields=['title', 'description', 'company_name', 'location', 'duration_bucket', 'updated_at']
+            )
+        InternshipSearchService._refresh_backend(documents)
+        return documents
+
+    @staticmethod
+    def _refresh_backend(documents):
+        """Push documents into the vendor-specific index."""
+        if not documents:
+            return
+
+        if connection.vendor == 'postgresql':
+            InternshipSearchDocument.objects.filter(
+                pk__in=[document.pk for document in documents]
+            ).update(search_vector=_search_vector())
+
+        elif connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.executemany(
+                    f'DELETE FROM {FTS_TABLE} WHERE rowid = %s',
+                    [[document.pk] for document in documents]
+                )
+                cursor.executemany(
+                    f'INSERT INTO {FTS_TABLE}'
+                    '(rowid, title, description, company_name, location, duration_bucket) '
+                    'VALUES (%s, %s, %s, %s, %s, %s)',
+                    [
+                        [document.pk, document.title, document.description,
+                         document.company_name, document.location, document.duration_bucket]
+                        for document in documents
+                    ]
+                )
@@ -3,7 +3,9 @@ Verification Automator Service
 
 Automatically verifies user profiles when all required documents are approved.
 """
+from collections import Counter
 from django.utils import timezone
+from apps.dashboard.models import StatusCount
 from apps.users.models import CustomUser
 from core.services.document_checklist_service import DocumentChecklistService
 from core.services.notification_dispatcher import on_profile_verified
@@ -43,3 +45,47 @@ class VerificationAutomator:
         on_profile_verified(user)
         
         return True
+    
+    def check_and_verify_many(self, users, admin: CustomUser) -> list:
+        """
+        Verify every user whose required documents are all approved.
+        
+        Checklists are computed with one query and the profiles are updated
+        with one UPDATE. Users already verified are left alone. Unlike
+        check_and_verify(), no notification is sent: the caller notifies the
+        returned users in its own batch.
+        
+        Args:
+            users: Users to potentially verify
+            admin: The admin performing the verification
+            
+        Returns:
+            List of the users that were verified
+        """
+        users = [user for user in users if user.verification_status != CustomUser.VERIFICATION_VERIFIED]
+        checklists = self.checklist_service.get_checklists(users)
+        verified = [user for user in users if self.checklist_service.all_approved(checklists[user.pk])]
+        if not verified:
+            return []
+        
+        now = timezone.now()
+        CustomUser.objects.filter(pk__in=[user.pk for user in verified]).update(
+            verification_status=CustomUser.VERIFICATION_VERIFIED,
+            is_verified=True,
+            verified_at=now,
+            verified_by=admin,
+        )
+        
+        # update() sends no post_save: move the status counts here
+        moved = Counter((user.verification_status, user.user_type) for user in verified)
+        for (status, user_type), count in moved.items():
+            StatusCount.adjust(StatusCount.USER, status, user_type, -count)
+            StatusCount.adjust(StatusCount.USER, CustomUser.VERIFICATION_VERIFIED, user_type, count)
+        
+        for user in verified:
+            user.verification_status = CustomUser.VERIFICATION_VERIFIED
+            user.is_verified = True
+            user.verified_at = now
+            user.verified_by = admin
+            user.snapshot_tracked_fields()
+        return verified
@@ -1,16 +1,28 @@
 """
 Celery email tasks for document verification workflow.
-Each task loads the relevant object, renders the HTML template, and sends via Django's send_mail.
+Each task loads the relevant object, renders the HTML and text templates, and
+queues the message in the mail outbox; flush_mail_outbox delivers the queue in
+batches over one SMTP connection.
 """
 from celery import shared_task
-from django.core.mail import send_mail
 from django.conf import settings
-from django.template.loader import render_to_string
 import logging
 
+from core.tasks.metrics import record_queue_lag, record_retry
+
 logger = logging.getLogger(__name__)
 
 
+def _task_dedup_key(task):
+    """
+    Outbox dedup key of the current task run: a redelivered or retried task
+    keeps its id, so it cannot queue the same email twice.
+    """
+    if not task.request.id:
+        return None
+    return f'{task.name}:{task.request.id}'
+
+
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
 def send_document_approved_email(self, document_id: int) -> None:
     """
@@ -21,37 +33,40 @@ def send_document_approved_email(self, document_id: int) -> None:
     """
     try:
         from apps.users.models_documents import UserDocument
+        from apps.notifications.emails import render_email
+        from core.services.mail_outbox import MailOutboxService
         
         # Load the document
         document = UserDocument.objects.select_related('user').get(id=document_id)
         
-        # Render HTML email template
-        html_message = render_to_string('emails/document_approved.html', {
+        # Render HTML + text email templates
+        text_message, html_message = render_email('document_approved', {
             'user': document.user,
+            'user_name': document.user.get_full_name() or document.user.username,
             'document': document,
             'document_title': document.title,
             'document_type': document.get_document_type_display(),
         })
         
-        # Send email
-        send_mail(
+        # Queue email
+        MailOutboxService.enqueue(
             subject='Document approuvé - Pratik',
-            message=f'Votre document "{document.title}" a été approuvé.',
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[document.user.email],
-            html_message=html_message,
-            fail_silently=False,
+            body=text_message,
+            recipients=[document.user.email],
+            html_body=html_message,
+            dedup_key=_task_dedup_key(self),
         )
         
-        logger.info(f"Document approval email sent to {document.user.email} for document {document_id}")
+        logger.info(f"Document approval email queued for {document.user.email} for document {document_id}")
         
     except Exception as exc:
         # Retry on failure
         if self.request.retries < self.max_retries:
+            record_retry(self.name, self.request.retries, exc)
             raise self.retry(exc=exc)
         else:
             # Log error on final failure, do not re-raise
-            logger.error(f"Failed to send document approval email for document {document_id}: {exc}")
+            logger.error(f"Failed to queue document approval email for document {document_id}: {exc}")
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
@@ -65,38 +80,118 @@ def send_document_rejected_email(self, document_id: int, reason: str) -> None:
     """
     try:
         from apps.users.models_documents import UserDocument
+        from apps.notifications.emails import render_email
+        from core.services.mail_outbox import MailOutboxService
         
         # Load the document
         document = UserDocument.objects.select_related('user').get(id=document_id)
         
-        # Render HTML email template
-        html_message = render_to_string('emails/document_rejected.html', {
+        # Render HTML + text email templates
+        text_message, html_message = render_email('document_rejected', {
             'user': document.user,
+            'user_name': document.user.get_full_name() or document.user.username,
             'document': document,
             'document_title': document.title,
             'document_type': document.get_document_type_display(),
             'rejection_reason': reason,
         })
         
-        # Send email
-        send_mail(
+        # Queue email
+        MailOutboxService.enqueue(
             subject='Document rejeté - Pratik',
-            message=f'Votre document "{document.title}" a été rejeté. Raison : {reason}',
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[document.user.email],
-            html_message=html_message,
-            fail_silently=False,
+            body=text_message,
+            recipients=[document.user.email],
+            html_body=html_message,
+            dedup_key=_task_dedup_key(self),
         )
         
-        logger.info(f"Document rejection email sent to {document.user.email} for document {document_id}")
+        logger.info(f"Document rejection email queued for {document.user.email} for document {document_id}")
         
     except Exception as exc:
         # Retry on failure
         if self.request.retries < self.max_retries:
+            record_retry(self.name, self.request.retries, exc)
             raise self.retry(exc=exc)
         else:
             # Log error on final failure, do not re-raise
-            logger.error(f"Failed to send document rejection email for document {document_id}: {exc}")
+            logger.error(f"Failed to queue document rejection email for document {document_id}: {exc}")
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def send_document_review_emails(self, document_ids: list, reason: str = '', verified_user_ids: list = ()) -> None:
+    """
+    Send the emails of a bulk document review in one outbox batch.
+    
+    Each reviewed document gets its approval or rejection email, and each
+    user verified by the review gets the profile verification email.
+    
+    Args:
+        document_ids: IDs of the reviewed UserDocuments
+        reason: Rejection reason message (rejected documents only)
+        verified_user_ids: IDs of the users verified by the review
+    """
+    try:
+        from apps.users.models import CustomUser
+        from apps.users.models_documents import UserDocument
+        from apps.notifications.emails import render_emails
+        from core.services.mail_outbox import MailOutboxService
+        
+        dedup_key = _task_dedup_key(self)
+        documents = list(UserDocument.objects.select_related('user').filter(id__in=document_ids))
+        users = list(CustomUser.objects.filter(id__in=verified_user_ids))
+        messages = []
+        
+        for status, template, subject in (
+            ('approved', 'document_approved', 'Document approuvé - Pratik'),
+            ('rejected', 'document_rejected', 'Document rejeté - Pratik'),
+        ):
+            batch = [document for document in documents if document.status == status]
+            bodies = render_emails(template, (
+                {
+                    'user': document.user,
+                    'user_name': document.user.get_full_name() or document.user.username,
+                    'document': document,
+                    'document_title': document.title,
+                    'document_type': document.get_document_type_display(),
+                    'rejection_reason': reason,
+                }
+                for document in batch
+            ))
+            for document, (text_message, html_message) in zip(batch, bodies):
+                messages.append({
+                    'subject': subject,
+                    'body': text_message,
+                    'recipients': [document.user.email],
+                    'html_body': html_message,
+                    'dedup_key': dedup_key and f'{dedup_key}:document-{document.id}',
+                })
+        
+        bodies = render_emails('profile_verified', (
+            {'user': user, 'user_name': user.get_full_name() or user.username}
+            for user in users
+        ))
+        for user, (text_message, html_message) in zip(users, bodies):
+            messages.append({
+                'subject': 'Profil vérifié - Pratik',
+                'body': text_message,
+                'recipients': [user.email],
+                'html_body': html_message,
+                'dedup_key': dedup_key and f'{dedup_key}:profile-{user.id}',
+            })
+        
+        # Queue every email with one insert
+        queued = MailOutboxService.enqueue_many(messages)
+        
+        logger.info(f"Queued {queued} review emails for {len(documents)} documents and {len(users)} verified profiles")
+        
+    except Exception as exc:
+        # Retry on failure
+        if self.request.retries < self.max_retries:
+            record_retry(self.name, self.request.retries, exc)
+            raise self.retry(exc=exc)
+        else:
+            # Log error on final failure, do not re-raise
+            logger.error(f"Failed to queue review emails for documents {document_ids}: {exc}")
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
@@ -109,34 +204,37 @@ def send_profile_verified_email(self, user_id: int) -> None:
     """
     try:
         from apps.users.models import CustomUser
+        from apps.notifications.emails import render_email
+        from core.services.mail_outbox import MailOutboxService
         
         # Load the user
         user = CustomUser.objects.get(id=user_id)
         
-        # Render HTML email template
-        html_message = render_to_string('emails/profile_verified.html', {
+        # Render HTML + text email templates
+        text_message, html_message = render_email('profile_verified', {
             'user': user,
+            'user_name': user.get_full_name() or user.username,
         })
         
-        # Send email
-        send_mail(
+        # Queue email
+        MailOutboxService.enqueue(
             subject='Profil vérifié - Pratik',
-            message='Félicitations ! Votre profil a été vérifié.',
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            html_message=html_message,
-            fail_silently=False,
+            body=text_message,
+            recipients=[user.email],
+            html_body=html_message,
+            dedup_key=_task_dedup_key(self),
         )
         
-        logger.info(f"Profile verification email sent to {user.email} for user {user_id}")
+        logger.info(f"Profile verification email queued for {user.email} for user {user_id}")
         
     except Exception as exc:
         # Retry on failure
         if self.request.retries < self.max_retries:
+            record_retry(self.name, self.request.retries, exc)
             raise self.retry(exc=exc)
         else:
             # Log error on final failure, do not re-raise
-            logger.error(f"Failed to send profile verification email for user {user_id}: {exc}")
+            logger.error(f"Failed to queue profile verification email for user {user_id}: {exc}")
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
@@ -151,37 +249,40 @@ def send_profile_status_email(self, user_id: int, new_status: str, note: str = '
     """
     try:
         from apps.users.models import CustomUser
+        from apps.notifications.emails import render_email
+        from core.services.mail_outbox import MailOutboxService
         
         # Load the user
         user = CustomUser.objects.get(id=user_id)
         
-        # Render HTML email template
-        html_message = render_to_string('emails/profile_status_changed.html', {
+        # Render HTML + text email templates
+        text_message, html_message = render_email('profile_status_changed', {
             'user': user,
+            'user_name': user.get_full_name() or user.username,
             'new_status': new_status,
             'status_display': user.get_verification_status_display(),
             'note': note,
         })
         
-        # Send email
-        send_mail(
+        # Queue email
+        MailOutboxService.enqueue(
             subject=f'Changement de statut - Pratik',
-            message=f'Le statut de votre profil a changé : {user.get_verification_status_display()}. {note}',
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            html_message=html_message,
-            fail_silently=False,
+            body=text_message,
+            recipients=[user.email],
+            html_body=html_message,
+            dedup_key=_task_dedup_key(self),
         )
         
-        logger.info(f"Profile status change email sent to {user.email} for user {user_id}")
+        logger.info(f"Profile status change email queued for {user.email} for user {user_id}")
         
     except Exception as exc:
         # Retry on failure
         if self.request.retries < self.max_retries:
+            record_retry(self.name, self.request.retries, exc)
             raise self.retry(exc=exc)
         else:
             # Log error on final failure, do not re-raise
-            logger.error(f"Failed to send profile status change email for user {user_id}: {exc}")
+            logger.error(f"Failed to queue profile status change email for user {user_id}: {exc}")
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
@@ -195,6 +296,8 @@ def send_document_submitted_admin_email(self, document_id: int) -> None:
     try:
         from apps.users.models_documents import UserDocument
         from apps.users.models import CustomUser
+        from apps.notifications.emails import render_email
+        from core.services.mail_outbox import MailOutboxService
         
         # Load the document
         document = UserDocument.objects.select_related('user').get(id=document_id)
@@ -207,8 +310,8 @@ def send_document_submitted_admin_email(self, document_id: int) -> None:
             logger.warning(f"No admin emails found for document submission notification {document_id}")
             return
         
-        # Render HTML email template
-        html_message = render_to_string('emails/document_submitted_admin.html', {
+        # Render HTML + text email templates
+        text_message, html_message = render_email('document_submitted_admin', {
             'document': document,
             'user': document.user,
             'user_name': document.user.get_full_name() or document.user.username,
@@ -217,22 +320,138 @@ def send_document_submitted_admin_email(self, document_id: int) -> None:
             'review_link': f"{settings.SITE_URL}/dashboard/admin/documents/{document.id}/",
         })
         
-        # Send email to all admins
-        send_mail(
+        # Queue email to all admins
+        MailOutboxService.enqueue(
             subject=f'Nouveau document soumis - {document.user.get_full_name() or document.user.username}',
-            message=f'{document.user.get_full_name() or document.user.username} a soumis un document : {document.get_document_type_display()}',
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=admin_emails,
-            html_message=html_message,
-            fail_silently=False,
+            body=text_message,
+            recipients=admin_emails,
+            html_body=html_message,
+            dedup_key=_task_dedup_key(self),
+        )
+        
+        logger.info(f"Document submission email queued for {len(admin_emails)} admins for document {document_id}")
+        
+    except Exception as exc:
+        # Retry on failure
+        if self.request.retries < self.max_retries:
+            record_retry(self.name, self.request.retries, exc)
+            raise self.retry(exc=exc)
+        else:
+            # Log error on final failure, do not re-raise
+            logger.error(f"Failed to queue document submission admin email for document {document_id}: {exc}")
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def send_application_received_email(self, application_id: int, enqueued_at: float = None) -> None:
+    """
+    Send new application email to the company that posted the internship.
+    
+    Args:
+        application_id: ID of the new Application
+        enqueued_at: Epoch seconds at which the task was queued (queue lag metric)
+    """
+    if self.request.retries == 0:
+        record_queue_lag(self.name, enqueued_at)
+    try:
+        from apps.applications.models import Application
+        from apps.notifications.emails import render_email
+        from core.services.mail_outbox import MailOutboxService
+        
+        # Load the application
+        application = Application.objects.select_related('student', 'internship__company').get(id=application_id)
+        company = application.internship.company
+        
+        # Render HTML + text email templates
+        text_message, html_message = render_email('application_received', {
+            'company': company,
+            'student': application.student,
+            'internship': application.internship,
+            'application': application,
+        })
+        
+        # Queue email
+        MailOutboxService.enqueue(
+            subject=f"Nouvelle candidature pour {application.internship.title}",
+            body=text_message,
+            recipients=[company.email],
+            html_body=html_message,
+            dedup_key=_task_dedup_key(self),
         )
         
-        logger.info(f"Document submission email sent to {len(admin_emails)} admins for document {document_id}")
+        logger.info(f"Application received email queued for {company.email} for application {application_id}")
         
     except Exception as exc:
         # Retry on failure
         if self.request.retries < self.max_retries:
+            record_retry(self.name, self.request.retries, exc)
             raise self.retry(exc=exc)
         else:
             # Log error on final failure, do not re-raise
-            logger.error(f"Failed to send document submission admin email for document {document_id}: {exc}")
+            logger.error(f"Failed to queue application received email for application {application_id}: {exc}")
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def send_application_response_email(self, application_id: int, accepted: bool, enqueued_at: float = None) -> None:
+    """
+    Send acceptance or rejection email to the student.
+    
+    Args:
+        application_id: ID of the answered Application
+        accepted: True if the application was accepted
+        enqueued_at: Epoch seconds at which the task was queued (queue lag metric)
+    """
+    if self.request.retries == 0:
+        record_queue_lag(self.name, enqueued_at)
+    try:
+        from apps.applications.models import Application
+        from apps.notifications.emails import render_email
+        from core.services.mail_outbox import MailOutboxService
+        
+        # Load the application
+        application = Application.objects.select_related('student', 'internship__company').get(id=application_id)
+        student = application.student
+        
+        # Render HTML + text email templates
+        text_message, html_message = render_email(
+            'application_accepted' if accepted else 'application_rejected',
+            {
+                'student': student,
+                'company': application.internship.company,
+                'internship': application.internship,
+                'application': application,
+                'accepted': accepted,
+            }
+        )
+        
+        # Queue email
+        MailOutboxService.enqueue(
+            subject=f"Réponse à votre candidature - {application.internship.title}",
+            body=text_message,
+            recipients=[student.email],
+            html_body=html_message,
+            dedup_key=_task_dedup_key(self),
+        )
+        
+        logger.info(f"Application response email queued for {student.email} for application {application_id}")
+        
+    except Exception as exc:
+        # Retry on failure
+        if self.request.retries < self.max_retries:
+            record_retry(self.name, self.request.retries, exc)
+            raise self.retry(exc=exc)
+        else:
+            # Log error on final failure, do not re-raise
+            logger.error(f"Failed to queue application response email for application {application_id}: {exc}")
+
+
+@shared_task
+def flush_mail_outbox(batch_size=None):
+    """
+    Deliver pending outbox emails in batches over one SMTP connection.
+    Scheduled after each enqueue and every minute by beat (for retries).
+    """
+    from core.services.mail_outbox import MailOutboxService
+    
+    result = MailOutboxService.flush(batch_size=batch_size)
+    
+    return f"Sent {result['sent']} emails, {result['failed']} failed"
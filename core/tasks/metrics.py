@@ -0,0 +1,100 @@
+"""
+Lightweight Celery task metrics kept in the cache (Redis in production).
+
+Request handlers pass the time a task was queued (``enqueued_at``, epoch
+seconds) so the worker can record the queue lag: the delay between the
+transaction commit that scheduled the task and the task actually starting.
+Retries are counted per task name.
+"""
+import logging
+import time
+
+from django.core.cache import cache
+
+
+logger = logging.getLogger(__name__)
+
+METRICS_KEY = 'task-metrics:{task}:{metric}'
+
+# Tasks queued from request handlers with an enqueued_at timestamp
+MONITORED_TASKS = (
+    'core.tasks.email_tasks.send_application_received_email',
+    'core.tasks.email_tasks.send_application_response_email',
+)
+
+# Counters kept per task name
+COUNTERS = ('runs', 'retries', 'lag_total_ms', 'lag_max_ms', 'lag_last_ms')
+
+
+def _key(task_name, metric):
+    return METRICS_KEY.format(task=task_name, metric=metric)
+
+
+def _incr(key, delta=1):
+    cache.add(key, 0, timeout=None)
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        # Evicted between add() and incr()
+        cache.set(key, delta, timeout=None)
+        return delta
+
+
+def record_queue_lag(task_name, enqueued_at):
+    """
+    Record how long a task waited in the queue.
+
+    Args:
+        task_name: Celery task name
+        enqueued_at: Epoch seconds at which the task was queued (None is ignored)
+
+    Returns:
+        float lag in seconds, or None
+    """
+    if enqueued_at is None:
+        return None
+    lag = max(0.0, time.time() - float(enqueued_at))
+    lag_ms = int(lag * 1000)
+    _incr(_key(task_name, 'runs'))
+    _incr(_key(task_name, 'lag_total_ms'), lag_ms)
+    cache.set(_key(task_name, 'lag_last_ms'), lag_ms, timeout=None)
+    if lag_ms > (cache.get(_key(task_name, 'lag_max_ms')) or 0):
+        cache.set(_key(task_name, 'lag_max_ms'), lag_ms, timeout=None)
+    logger.info(f"Task {task_name} started after {lag:.3f}s in queue")
+    return lag
+
+
+def record_retry(task_name, retries, exc):
+    """
+    Count a retry of a task.
+
+    Args:
+        task_name: Celery task name
+        retries: Number of retries already made (task.request.retries)
+        exc: Exception that triggered the retry
+    """
+    _incr(_key(task_name, 'retries'))
+    logger.warning(f"Retrying {task_name} (attempt {retries + 1}): {exc}")
+
+
+def get_task_metrics(task_name):
+    """
+    Read the metrics of a task.
+
+    Returns:
+        dict with runs, retries, and average/max/last queue lag in seconds
+    """
+    values = cache.get_many([_key(task_name, metric) for metric in COUNTERS])
+    counts = {metric: values.get(_key(task_name, metric), 0) for metric in COUNTERS}
+    runs = counts['runs']
+    return {
+        'runs': runs,
+        'retries': counts['retries'],
+        'lag_avg': counts['lag_total_ms'] / runs / 1000 if runs else 0.0,
+        'lag_max': counts['lag_max_ms'] / 1000,
+        'lag_last': counts['lag_last_ms'] / 1000,
+    }
+
+
+def reset_task_metrics(task_name):
+    cache.delete_many([_key(task_name, metric) for metric in COUNTERS])
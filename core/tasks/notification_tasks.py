@@ -1,13 +1,39 @@
 """
 Celery Tasks for Notifications and Automated Checks
 """
+import uuid
+from itertools import islice
+
 from celery import shared_task
+from celery.exceptions import SoftTimeLimitExceeded
 from django.utils import timezone
-from datetime import timedelta
+from datetime import date, timedelta
 from django.core.mail import send_mail
+from django.db import transaction
 from django.conf import settings
 
 
+# Documents handled per chunk (one transaction each)
+DOCUMENT_EXPIRY_CHUNK_SIZE = 200
+# Delay before an interrupted run is resumed by a new task (seconds)
+DOCUMENT_EXPIRY_RESUME_DELAY = 60
+
+
+@shared_task
+def fan_out_notification(notification_type, title, message, link=None, audience=None, recipient_ids=None):
+    """
+    Create the same in-app notification for an audience or a list of users.
+    Lets request handlers defer fan-outs whose size they do not control.
+    """
+    from apps.notifications.models import Notification
+    from core.services.notification_dispatcher import get_audience
+    
+    recipients = get_audience(audience) if audience else (recipient_ids or [])
+    created = Notification.fan_out(recipients, notification_type, title, message, link=link)
+    
+    return f"Created {created} notifications"
+
+
 @shared_task
 def send_evolution_notifications():
     """
@@ -40,46 +66,107 @@ def send_evolution_notifications():
 
 
 @shared_task
-def check_document_expiry():
+def check_document_expiry(chunk_size=DOCUMENT_EXPIRY_CHUNK_SIZE, run_key=None, run_date=None):
     """
     Check for expiring verification documents and send reminders.
     Runs daily to check documents expiring in the next 30 days.
+    
+    Documents are streamed by primary key in chunks. Each chunk commits in
+    one transaction its notifications (one bulk insert), their emails
+    (queued in the mail outbox, delivered after commit) and the checkpoint
+    of the run, so a chunk is either fully reminded or not at all. A run
+    stopped by the soft time limit re-enqueues itself with its checkpoint
+    key and date, and the new task resumes after the last committed chunk.
+    
+    Reminders are deduplicated per document and day, so replaying a chunk
+    or re-running the task the same day never notifies anyone twice.
+    
+    Args:
+        chunk_size: Documents per chunk
+        run_key: Checkpoint key of the run being resumed (new run when None)
+        run_date: ISO date the run started on (today when None)
     """
     from apps.verification.models import VerificationDocument
-    from apps.notifications.models import Notification
+    from apps.notifications.emails import render_emails
+    from apps.notifications.models import Notification, TaskCheckpoint
+    from core.services.mail_outbox import MailOutboxService
+    
+    today = timezone.now().date() if run_date is None else date.fromisoformat(run_date)
+    if run_key is None:
+        run_key = f'check_document_expiry:{today.isoformat()}:{uuid.uuid4().hex}'
+    checkpoint = TaskCheckpoint.load(run_key)
+    if checkpoint.completed:
+        return "Sent 0 expiry notifications"
     
     # Get documents expiring in the next 30 days
-    expiry_threshold = timezone.now().date() + timedelta(days=30)
+    expiry_threshold = today + timedelta(days=30)
     expiring_docs = VerificationDocument.objects.filter(
         status='APPROVED',
         expiry_date__lte=expiry_threshold,
-        expiry_date__gte=timezone.now().date()
-    ).select_related('user')
+        expiry_date__gte=today,
+        pk__gt=checkpoint.position
+    ).select_related('user').order_by('pk').iterator(chunk_size=chunk_size)
     
     notifications_sent = 0
-    
-    for doc in expiring_docs:
-        days_until_expiry = (doc.expiry_date - timezone.now().date()).days
+    try:
+        while True:
+            chunk = list(islice(expiring_docs, chunk_size))
+            if not chunk:
+                break
+            
+            notifications = {}
+            for doc in chunk:
+                days_until_expiry = (doc.expiry_date - today).days
+                notifications[doc] = Notification(
+                    recipient=doc.user,
+                    notification_type=Notification.DOCUMENT_EXPIRING,
+                    title="Document Expiring Soon",
+                    message=f"Your {doc.get_document_type_display()} will expire in {days_until_expiry} days. Please renew it.",
+                    dedup_key=f'document-expiry:{doc.pk}:{today.isoformat()}'
+                )
+            
+            with transaction.atomic():
+                # Documents reminded by an earlier run of the day get no second email
+                inserted = Notification.bulk_notify_new(list(notifications.values()))
+                inserted_keys = {notification.dedup_key for notification in inserted}
+                recipients = [
+                    (doc, notification.dedup_key, (doc.expiry_date - today).days)
+                    for doc, notification in notifications.items()
+                    if notification.dedup_key in inserted_keys and doc.user.email
+                ]
+                
+                # One template lookup for the whole chunk
+                rendered = render_emails('document_expiring', [
+                    {
+                        'user': doc.user,
+                        'user_name': doc.user.get_full_name() or doc.user.username,
+                        'document_type': doc.get_document_type_display(),
+                        'expiry_date': doc.expiry_date,
+                        'days_until_expiry': days_until_expiry,
+                    }
+                    for doc, _, days_until_expiry in recipients
+                ])
+                MailOutboxService.enqueue_many([
+                    {
+                        'subject': "Document bientôt expiré - PRATIK",
+                        'body': text_body,
+                        'html_body': html_body,
+                        'recipients': [doc.user.email],
+                        'dedup_key': dedup_key,
+                    }
+                    for (doc, dedup_key, _), (text_body, html_body) in zip(recipients, rendered)
+                ])
+                checkpoint.advance(chunk[-1].pk)
+            notifications_sent += len(inserted)
         
-        # Create notification for user
-        Notification.objects.create(
-            user=doc.user,
-            title="Document Expiring Soon",
-            message=f"Your {doc.get_document_type_display()} will expire in {days_until_expiry} days. Please renew it.",
-            notification_type='DOCUMENT_EXPIRY'
+        checkpoint.finish()
+    except SoftTimeLimitExceeded:
+        # The checkpoint holds the last committed chunk: a new task resumes this run from it
+        check_document_expiry.apply_async(
+            kwargs={'chunk_size': chunk_size, 'run_key': run_key, 'run_date': today.isoformat()},
+            countdown=DOCUMENT_EXPIRY_RESUME_DELAY,
         )
-        
-        # Send email notification
-        if doc.user.email:
-            send_mail(
-                subject="Document Expiring Soon - PRATIK",
-                message=f"Your {doc.get_document_type_display()} will expire in {days_until_expiry} days. Please renew it to maintain your verification status.",
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[doc.user.email],
-                fail_silently=True,
-            )
-        
-        notifications_sent += 1
+        return f"Sent {notifications_sent} expiry notifications (interrupted at pk {checkpoint.position})"
     
     return f"Sent {notifications_sent} expiry notifications"
 
@@ -88,41 +175,52 @@ def check_document_expiry():
 def send_upcoming_calendar_reminders():
     """
     Send reminders for upcoming internship calendars.
-    Notifies companies about internship periods starting soon.
+    Notifies partner companies about internship periods starting soon.
+    
+    Partner company ids are loaded once and each calendar is fanned out
+    with chunked bulk inserts. Every reminder carries a dedup key per
+    (calendar, company, ISO week), so retries and overlapping beat runs
+    within the same week do not notify anyone twice.
     """
     from apps.calendars.models import InternshipCalendar
     from apps.notifications.models import Notification
-    from apps.users.models import CustomUser
+    from apps.users.profile_models import CompanyProfile
+    
+    today = timezone.now().date()
+    iso_year, iso_week, _ = today.isocalendar()
     
     # Get calendars starting in the next 30 days
-    start_threshold = timezone.now().date() + timedelta(days=30)
+    start_threshold = today + timedelta(days=30)
     upcoming_calendars = InternshipCalendar.objects.filter(
         is_published=True,
         is_visible_to_companies=True,
         start_date__lte=start_threshold,
-        start_date__gte=timezone.now().date()
-    ).select_related('school', 'program_manager')
+        start_date__gte=today
+    ).select_related('school').only(
+        'pk', 'program_name', 'start_date', 'number_of_students', 'school__institution_name'
+    )
     
-    # Get all partner companies
-    companies = CustomUser.objects.filter(
-        user_type='COMPANY',
-        companyprofile__is_partner=True
+    # Get all partner companies, once
+    company_ids = list(
+        CompanyProfile.objects.filter(
+            is_partner=True,
+            user__is_active=True
+        ).order_by('user_id').values_list('user_id', flat=True)
     )
     
     notifications_sent = 0
+    if not company_ids:
+        return f"Sent {notifications_sent} calendar reminders"
     
-    for calendar in upcoming_calendars:
-        days_until_start = (calendar.start_date - timezone.now().date()).days
-        
-        for company in companies:
-            # Create notification for each company
-            Notification.objects.create(
-                user=company,
-                title=f"Upcoming Internship Period: {calendar.program_name}",
-                message=f"{calendar.school.school_name} has an internship period starting in {days_until_start} days ({calendar.number_of_students} students).",
-                notification_type='CALENDAR_REMINDER'
-            )
-            notifications_sent += 1
+    for calendar in upcoming_calendars.iterator():
+        days_until_start = (calendar.start_date - today).days
+        notifications_sent += Notification.fan_out(
+            company_ids,
+            notification_type=Notification.CALENDAR_REMINDER,
+            title=f"Upcoming Internship Period: {calendar.program_name}",
+            message=f"{calendar.school.institution_name} has an internship period starting in {days_until_start} days ({calendar.number_of_students} students).",
+            dedup_key=f"calendar-reminder:{calendar.pk}:{iso_year}-W{iso_week:02d}",
+        )
     
     return f"Sent {notifications_sent} calendar reminders"
 
@@ -130,17 +228,19 @@ def send_upcoming_calendar_reminders():
 @shared_task
 def cleanup_old_notifications():
     """
-    Clean up old read notifications (older than 90 days).
+    Clean up old read notifications (older than 90 days) and the
+    checkpoints of finished task runs.
     """
-    from apps.notifications.models import Notification
+    from apps.notifications.models import Notification, TaskCheckpoint
     
     threshold_date = timezone.now() - timedelta(days=90)
     deleted_count = Notification.objects.filter(
         is_read=True,
         created_at__lt=threshold_date
     ).delete()[0]
+    checkpoints_count = TaskCheckpoint.objects.filter(completed=True).delete()[0]
     
-    return f"Deleted {deleted_count} old notifications"
+    return f"Deleted {deleted_count} old notifications and {checkpoints_count} finished checkpoints"
 
 
 @shared_task
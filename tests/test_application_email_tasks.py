@@ -0,0 +1,104 @@
+"""
+Tests for the application emails sent from Celery after commit.
+"""
+import time
+
+import pytest
+from celery.exceptions import Retry
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+
+from apps.applications.models import Application
+from apps.internships.models import Internship
+from apps.notifications.models import OutboxEmail
+from core.tasks import email_tasks
+from core.tasks.email_tasks import send_application_received_email
+from core.tasks.metrics import get_task_metrics
+
+
+@pytest.fixture
+def internship(make_user):
+    return Internship.objects.create(
+        company=make_user('company', 'company'),
+        title='Développeur Django',
+        slug='developpeur-django',
+        description='Description',
+        location='Cayenne',
+        duration='3 mois',
+    )
+
+
+def cv():
+    return SimpleUploadedFile('cv.pdf', b'%PDF-1.4 cv', content_type='application/pdf')
+
+
+@pytest.mark.django_db
+class TestApplicationEmails:
+    """Application emails are queued on commit, outside the request"""
+
+    def test_received_email_waits_for_commit(self, make_user, client, internship, django_capture_on_commit_callbacks):
+        client.force_login(make_user('student', 'student'))
+
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            client.post('/applications/apply/developpeur-django/', {'cv': cv(), 'cover_letter': 'Motivé'})
+
+        assert Application.objects.count() == 1
+        assert not OutboxEmail.objects.exists()
+
+        for callback in callbacks:
+            callback()
+
+        email = OutboxEmail.objects.get()
+        assert email.to_email == 'company@test.com'
+        assert email.subject == 'Nouvelle candidature pour Développeur Django'
+        assert get_task_metrics('core.tasks.email_tasks.send_application_received_email')['runs'] == 1
+
+    def test_response_email_queued_after_accept(self, make_user, client, internship, django_capture_on_commit_callbacks):
+        student = make_user('student', 'student')
+        application = Application.objects.create(student=student, internship=internship, cv=cv())
+        client.force_login(internship.company)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(
+                f'/applications/{application.pk}/update-status/',
+                {'action': 'accept', 'message': 'Bienvenue'}
+            )
+
+        assert response.json()['success']
+        email = OutboxEmail.objects.get()
+        assert email.to_email == 'student@test.com'
+        assert 'acceptée' in email.body and 'Bienvenue' in email.body
+
+
+@pytest.mark.django_db
+def test_queue_lag_and_retries_are_recorded(capsys):
+    kwargs = {'enqueued_at': time.time() - 2}
+    with pytest.raises(Retry):
+        send_application_received_email.apply(args=(987654,), kwargs=kwargs)
+    # Last attempt: logged, not retried
+    send_application_received_email.apply(args=(987654,), kwargs=kwargs, retries=3)
+
+    metrics = get_task_metrics('core.tasks.email_tasks.send_application_received_email')
+    assert metrics['runs'] == 1
+    assert metrics['lag_max'] >= 2
+    assert metrics['retries'] == 1
+
+    call_command('task_metrics', 'core.tasks.email_tasks.send_application_received_email')
+    assert '1 relance(s)' in capsys.readouterr().out
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('task_name, args', [
+    ('send_document_approved_email', (987654,)),
+    ('send_document_rejected_email', (987654, 'Illisible')),
+    ('send_profile_verified_email', (987654,)),
+    ('send_profile_status_email', (987654, 'REJECTED')),
+    ('send_document_submitted_admin_email', (987654,)),
+    ('send_application_response_email', (987654, True)),
+])
+def test_every_email_task_records_its_retries(task_name, args):
+    task = getattr(email_tasks, task_name)
+    with pytest.raises(Retry):
+        task.apply(args=args)
+
+    assert get_task_metrics(task.name)['retries'] == 1
@@ -0,0 +1,103 @@
+"""
+Tests for the batched, idempotent send_upcoming_calendar_reminders task.
+"""
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.calendars.models import InternshipCalendar
+from apps.notifications.models import Notification
+from apps.users.profile_models import CompanyProfile, SchoolProfile
+from core.tasks.notification_tasks import send_upcoming_calendar_reminders
+
+
+@pytest.fixture
+def make_company(make_user):
+    def _make_company(index, is_partner=True):
+        user = make_user(f'company{index}', 'company')
+        CompanyProfile.objects.create(
+            user=user,
+            company_name=f'Company {index}',
+            siret=f'{index:014d}',
+            sector='Informatique',
+            description='Description',
+            address='1 rue du Port',
+            city='Cayenne',
+            postal_code='97300',
+            is_partner=is_partner,
+        )
+        return user
+    return _make_company
+
+
+@pytest.fixture
+def school(make_user):
+    user = make_user('school', 'school')
+    return SchoolProfile.objects.create(
+        user=user,
+        institution_name='Université de Guyane',
+        institution_type='UNIVERSITY',
+        address='Campus de Troubiran',
+        city='Cayenne',
+        postal_code='97300',
+        phone='0594000000',
+        email='contact@univ-guyane.fr',
+    )
+
+
+def make_calendar(school, days_ahead, **kwargs):
+    start = timezone.now().date() + timedelta(days=days_ahead)
+    data = {
+        'school': school,
+        'program_name': f'L3 AES +{days_ahead}',
+        'program_level': 'Licence 3',
+        'start_date': start,
+        'end_date': start + timedelta(days=60),
+        'number_of_students': 25,
+        'is_published': True,
+        'is_visible_to_companies': True,
+    }
+    data.update(kwargs)
+    return InternshipCalendar.objects.create(**data)
+
+
+@pytest.mark.django_db
+class TestCalendarReminders:
+    """send_upcoming_calendar_reminders"""
+
+    def test_one_reminder_per_calendar_and_partner(self, make_company, school):
+        partners = [make_company(i) for i in range(3)]
+        make_company(99, is_partner=False)
+        make_calendar(school, 10)
+        make_calendar(school, 20)
+        make_calendar(school, 90)
+        make_calendar(school, 5, is_published=False)
+
+        result = send_upcoming_calendar_reminders()
+
+        assert result == 'Sent 6 calendar reminders'
+        reminders = Notification.objects.filter(notification_type=Notification.CALENDAR_REMINDER)
+        assert set(reminders.values_list('recipient', flat=True)) == {p.pk for p in partners}
+        assert 'Université de Guyane' in reminders.first().message
+
+    def test_rerun_in_same_week_is_idempotent(self, make_company, school):
+        make_company(1)
+        make_company(2)
+        make_calendar(school, 10)
+
+        send_upcoming_calendar_reminders()
+        assert send_upcoming_calendar_reminders() == 'Sent 0 calendar reminders'
+        assert Notification.objects.count() == 2
+
+    def test_new_partner_gets_missing_reminder_on_retry(self, make_company, school):
+        make_company(1)
+        make_calendar(school, 10)
+        send_upcoming_calendar_reminders()
+
+        make_company(2)
+        assert send_upcoming_calendar_reminders() == 'Sent 1 calendar reminders'
+
+    def test_no_partners(self, school):
+        make_calendar(school, 10)
+        assert send_upcoming_calendar_reminders() == 'Sent 0 calendar reminders'
@@ -0,0 +1,137 @@
+"""
+Tests for the list pagination without COUNT(*) (core.pagination).
+"""
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.paginator import EmptyPage
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.applications.models import Application
+from apps.internships.models import Internship
+from apps.notifications.models import Notification
+from apps.users.models_documents import UserDocument
+from core.pagination import ESTIMATE, EXACT, KNOWN, NO_COUNT, CheapCountPaginator
+
+
+def counted_tables(queries):
+    """Tables a COUNT ran on"""
+    return [query['sql'] for query in queries if 'COUNT(' in query['sql'].upper()]
+
+
+@pytest.fixture
+def recipient(make_user):
+    user = make_user('lecteur', 'student')
+    Notification.objects.bulk_create(
+        Notification(recipient=user, title=f'Notification {index}', message='...') for index in range(5)
+    )
+    return user
+
+
+@pytest.mark.django_db
+class TestCheapCountPaginator:
+
+    def queryset(self, recipient):
+        return Notification.objects.filter(recipient=recipient).order_by('pk')
+
+    def test_known_count_runs_no_count(self, recipient, django_assert_num_queries):
+        paginator = CheapCountPaginator(self.queryset(recipient), 2, count=5)
+
+        with django_assert_num_queries(1):
+            page = paginator.page(2)
+            assert len(page) == 2
+        assert (paginator.count, paginator.num_pages, paginator.count_source) == (5, 3, KNOWN)
+        assert page.has_next() and page.next_page_number() == 3
+
+    def test_stale_known_count_does_not_hide_rows(self, recipient):
+        # A materialized count lagging behind: the last page is still reachable
+        paginator = CheapCountPaginator(self.queryset(recipient), 2, count=3)
+
+        page = paginator.page(3)
+
+        assert len(page) == 1
+        assert not page.has_next()
+        assert page.end_index() == 5
+
+    def test_no_count_mode(self, recipient, django_assert_num_queries):
+        paginator = CheapCountPaginator(self.queryset(recipient), 2, count_mode=NO_COUNT)
+
+        with django_assert_num_queries(1):
+            first = paginator.page(1)
+        assert first.has_next() and not first.has_previous()
+        assert paginator.count is None and paginator.num_pages is None
+        assert not paginator.page(3).has_next()
+        with pytest.raises(EmptyPage):
+            paginator.page(4)
+
+    def test_estimate_above_threshold(self, recipient, monkeypatch):
+        monkeypatch.setattr('core.pagination.estimate_count', lambda queryset: 50000)
+        paginator = CheapCountPaginator(self.queryset(recipient), 2, estimate_threshold=10000)
+
+        assert (paginator.count, paginator.count_source) == (50000, ESTIMATE)
+        # Navigation still follows the rows
+        assert not paginator.page(3).has_next()
+
+    def test_exact_count_below_threshold(self, recipient, monkeypatch):
+        monkeypatch.setattr('core.pagination.estimate_count', lambda queryset: 40)
+        paginator = CheapCountPaginator(self.queryset(recipient), 2, estimate_threshold=10000)
+
+        assert (paginator.count, paginator.count_source) == (5, EXACT)
+        with pytest.raises(EmptyPage):
+            paginator.page(4)
+
+
+@pytest.mark.django_db
+class TestListViews:
+
+    def test_notifications_paged_without_count(self, client, recipient):
+        client.force_login(recipient)
+
+        with CaptureQueriesContext(connection) as context:
+            response = client.get('/notifications/')
+
+        assert response.status_code == 200
+        assert len(response.context['notifications']) == 5
+        assert not [sql for sql in counted_tables(context.captured_queries) if 'notifications_notification' in sql]
+
+    def test_admin_documents_total_from_status_counts(self, make_user, client):
+        admin = make_user('admin', 'admin', is_staff=True)
+        driver = make_user('driver', 'driver')
+        landlord = make_user('landlord', 'landlord')
+        for user in (driver, driver, landlord):
+            UserDocument.objects.create(
+                user=user, document_type='id_card', title='CNI',
+                file=SimpleUploadedFile('id.pdf', b'content', content_type='application/pdf'),
+            )
+        client.force_login(admin)
+
+        with CaptureQueriesContext(connection) as context:
+            response = client.get('/dashboard/admin/documents/', {'user_type': 'driver'})
+
+        assert response.context['paginator'].count == 2
+        assert len(response.context['documents']) == 2
+        assert response.context['pending_count'] == 3
+        assert not [sql for sql in counted_tables(context.captured_queries) if 'users_userdocument' in sql]
+
+    def test_company_lists_reuse_their_badges(self, make_user, client):
+        company = make_user('acme', 'company')
+        internship = Internship.objects.create(
+            company=company, title='Développeur', description='Stage', location='Cayenne', duration='6 mois'
+        )
+        for index, status in enumerate(['pending', 'pending', 'accepted']):
+            Application.objects.create(
+                student=make_user(f'etudiant{index}', 'student'), internship=internship, status=status
+            )
+        client.force_login(company)
+
+        response = client.get('/dashboard/company/applications/', {'status': 'pending'})
+        assert response.context['paginator'].count_source == KNOWN
+        assert response.context['paginator'].count == response.context['pending_count'] == 2
+        assert len(response.context['applications']) == 2
+
+        response = client.get('/dashboard/company/applications/', {'internship': internship.pk})
+        assert response.context['paginator'].count == 3
+
+        response = client.get('/dashboard/company/internships/', {'status': 'inactive'})
+        assert response.context['paginator'].count == response.context['inactive_count'] == 0
+        assert response.context['total_count'] == 1
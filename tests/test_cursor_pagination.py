@@ -0,0 +1,139 @@
+"""
+Tests for the opt-in keyset pagination of the API lists (api.pagination).
+"""
+import base64
+import json
+from datetime import date, timedelta
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from apps.calendars.models import InternshipCalendar
+from apps.users.profile_models import CompanyProfile, SchoolProfile
+
+PARTNERS_URL = '/api/partners/companies/'
+CALENDARS_URL = '/api/calendars/public/'
+
+
+@pytest.fixture
+def make_partner(make_user):
+    def _make_partner(index, partner_since):
+        return CompanyProfile.objects.create(
+            user=make_user(f'partner{index}', 'company'), company_name=f'Partenaire {index}',
+            siret=f'{index:014d}', sector='Informatique', description='Partenaire', address='1 rue du Port',
+            city='Cayenne', postal_code='97300', is_partner=True, partner_since=partner_since,
+        )
+    return _make_partner
+
+
+@pytest.fixture(autouse=True)
+def page_size(settings):
+    settings.REST_FRAMEWORK = {**settings.REST_FRAMEWORK, 'PAGE_SIZE': 2}
+
+
+def walk(client, url, params=None):
+    """Follow the next links from the first page, returning the pages."""
+    pages = []
+    response = client.get(url, params or {}, HTTP_ACCEPT='application/json')
+    while True:
+        assert response.status_code == 200
+        pages.append(response.json())
+        if not pages[-1]['next']:
+            return pages
+        response = client.get(pages[-1]['next'], HTTP_ACCEPT='application/json')
+
+
+@pytest.mark.django_db
+class TestPartnerCompanies:
+
+    @pytest.fixture
+    def partners(self, make_partner):
+        # Ties on partner_since and NULLs: the primary key breaks the ties
+        dates = [date(2024, 1, 1), date(2025, 6, 1), None, date(2025, 6, 1), None, date(2023, 3, 1)]
+        return [make_partner(index, since) for index, since in enumerate(dates, start=1)]
+
+    def expected_order(self, partners):
+        dated = sorted((p for p in partners if p.partner_since), key=lambda p: (p.partner_since, p.pk), reverse=True)
+        undated = sorted((p for p in partners if not p.partner_since), key=lambda p: p.pk, reverse=True)
+        # Descending order: NULLs first on PostgreSQL, last on SQLite
+        return undated + dated if connection.features.nulls_order_largest else dated + undated
+
+    def test_page_numbers_by_default(self, client, partners):
+        data = client.get(PARTNERS_URL, HTTP_ACCEPT='application/json').json()
+
+        assert data['count'] == 6
+        assert 'cursor' not in (data['next'] or '')
+
+    def test_walks_every_row_once(self, client, partners):
+        pages = walk(client, PARTNERS_URL, {'pagination': 'cursor'})
+
+        assert len(pages) == 3
+        assert 'count' not in pages[0]
+        assert pages[0]['previous'] is None
+        names = [company['company_name'] for page in pages for company in page['results']]
+        assert names == [p.company_name for p in self.expected_order(partners)]
+
+    def test_previous_link(self, client, partners):
+        pages = walk(client, PARTNERS_URL, {'pagination': 'cursor'})
+
+        back = client.get(pages[2]['previous'], HTTP_ACCEPT='application/json').json()
+
+        assert back['results'] == pages[1]['results']
+        assert back['next'] and back['previous']
+
+    def test_ordering_parameter_and_filters_kept(self, client, partners):
+        pages = walk(client, PARTNERS_URL, {'pagination': 'cursor', 'ordering': 'total_interns_hosted', 'city': 'Cayenne'})
+
+        assert 'city=Cayenne' in pages[0]['next']
+        assert sum(len(page['results']) for page in pages) == 6
+
+    def test_invalid_cursor(self, client, partners):
+        response = client.get(PARTNERS_URL, {'cursor': 'pas-un-curseur'}, HTTP_ACCEPT='application/json')
+
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize('values', [['garbage', 1], [{}, 1], ['2026-01-01', 'x'], [[2026], None]])
+    def test_tampered_cursor(self, client, partners, values):
+        token = base64.urlsafe_b64encode(json.dumps({'v': values, 'r': False}).encode()).decode()
+
+        response = client.get(PARTNERS_URL, {'cursor': token}, HTTP_ACCEPT='application/json')
+
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestPublicCalendars:
+
+    @pytest.fixture
+    def calendars(self, make_user):
+        school = SchoolProfile.objects.create(
+            user=make_user('school', 'school'), institution_name='Université de Guyane',
+            institution_type='UNIVERSITY', address='Campus de Troubiran', city='Cayenne',
+            postal_code='97300', phone='0594000000', email='contact@univ-guyane.fr',
+        )
+        today = timezone.now().date()
+        return [
+            InternshipCalendar.objects.create(
+                school=school, program_name=f'Filière {index}', program_level='Licence 3',
+                start_date=today + timedelta(days=days), end_date=today + timedelta(days=days + 60),
+                number_of_students=20, is_published=True, is_visible_to_companies=True,
+            )
+            for index, days in enumerate([30, 10, 30, 20, 10])
+        ]
+
+    def test_walks_in_start_date_order(self, client, calendars, django_assert_max_num_queries):
+        pages = walk(client, CALENDARS_URL, {'pagination': 'cursor'})
+
+        ids = [calendar['id'] for page in pages for calendar in page['results']]
+        assert ids == [c.pk for c in sorted(calendars, key=lambda c: (c.start_date, c.pk))]
+
+        # Deep pages: one query, no COUNT(*)
+        with django_assert_max_num_queries(1) as context:
+            client.get(pages[1]['next'], HTTP_ACCEPT='application/json')
+        assert not any('COUNT' in query['sql'] for query in context.captured_queries)
+
+    def test_page_size_parameter(self, client, calendars):
+        data = client.get(CALENDARS_URL, {'pagination': 'cursor', 'page_size': 4}).json()
+
+        assert len(data['results']) == 4
@@ -0,0 +1,102 @@
+"""
+Tests for DashboardMetricsService (aggregated, cached dashboard counters).
+"""
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from apps.applications.models import Application
+from apps.internships.models import Internship
+from apps.users.models_documents import UserDocument
+from core.services.dashboard_metrics import DashboardMetricsService
+
+
+def make_internship(company, title):
+    return Internship.objects.create(
+        company=company,
+        title=title,
+        slug=title.lower().replace(' ', '-'),
+        description='Description',
+        location='Cayenne',
+        duration='3 mois',
+    )
+
+
+def apply(student, internship, **kwargs):
+    return Application.objects.create(
+        student=student,
+        internship=internship,
+        cv=SimpleUploadedFile('cv.pdf', b'%PDF-1.4', content_type='application/pdf'),
+        **kwargs
+    )
+
+
+@pytest.fixture
+def platform(make_user):
+    company = make_user('company', 'company')
+    students = [make_user(f'student{i}', 'student') for i in range(2)]
+    driver = make_user('driver', 'driver')
+    internships = [make_internship(company, f'Stage {i}') for i in range(2)]
+    apply(students[0], internships[0])
+    apply(students[0], internships[1], status=Application.ACCEPTED)
+    apply(students[1], internships[0])
+    for status in ('pending', 'pending', 'approved', 'rejected'):
+        UserDocument.objects.create(
+            user=driver,
+            document_type='id_card',
+            title='CNI',
+            file=SimpleUploadedFile('id.pdf', b'content', content_type='application/pdf'),
+            status=status,
+        )
+    return company, students
+
+
+@pytest.mark.django_db
+class TestDashboardMetrics:
+    """DashboardMetricsService"""
+
+    def test_admin_counters_in_one_query_per_table(self, platform, django_assert_num_queries):
+        with django_assert_num_queries(4):
+            counters = DashboardMetricsService.compute_admin()
+
+        assert counters == {
+            'total_users': 4,
+            'total_students': 2,
+            'total_companies': 1,
+            'pending_verifications': 2,
+            'total_internships': 2,
+            'total_applications': 3,
+            'pending_documents_count': 2,
+            'approved_documents_count': 1,
+            'rejected_documents_count': 1,
+        }
+
+    def test_role_counters(self, platform):
+        company, students = platform
+
+        assert DashboardMetricsService.get_counters('student', students[0]) == {
+            'applications_count': 2, 'pending_count': 1
+        }
+        assert DashboardMetricsService.get_counters('company', company) == {
+            'internships_count': 2, 'applications_count': 3, 'pending_count': 2
+        }
+        assert DashboardMetricsService.get_counters('school', company) == {}
+
+    def test_cached_until_a_relevant_change(self, platform, django_assert_num_queries):
+        company, students = platform
+        DashboardMetricsService.get_counters('student', students[1])
+
+        with django_assert_num_queries(0):
+            DashboardMetricsService.get_counters('student', students[1])
+
+        apply(students[1], Internship.objects.get(title='Stage 1'))
+        assert DashboardMetricsService.get_counters('student', students[1])['applications_count'] == 2
+        assert DashboardMetricsService.get_counters('company', company)['applications_count'] == 4
+
+    def test_admin_dashboard_uses_counters(self, make_user, client, platform):
+        admin = make_user('admin', 'admin', is_staff=True)
+        client.force_login(admin)
+
+        response = client.get('/dashboard/')
+
+        assert response.context['total_users'] == 5
+        assert response.context['pending_documents_count'] == 2
@@ -0,0 +1,161 @@
+"""
+Tests for bulk document review (DocumentReviewService and its admin view).
+"""
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.dashboard.models import StatusCount
+from apps.notifications.models import Notification, OutboxEmail
+from apps.users.models import CustomUser
+from apps.users.models_documents import UserDocument
+from core.services.document_review_service import DocumentReviewService
+
+
+@pytest.fixture
+def admin_user():
+    return CustomUser.objects.create_user(
+        username='admin', email='admin@test.com', password='testpass123',
+        user_type='admin', is_staff=True
+    )
+
+
+def upload(user, document_type):
+    return UserDocument.objects.create(
+        user=user,
+        document_type=document_type,
+        title=document_type,
+        file=SimpleUploadedFile('doc.pdf', b'content', content_type='application/pdf'),
+    )
+
+
+@pytest.fixture
+def make_companies(make_user):
+    def _make_companies(count, prefix='company'):
+        documents = []
+        for index in range(count):
+            company = make_user(f'{prefix}{index}', 'company')
+            documents += [upload(company, 'kbis_siret'), upload(company, 'representative_id')]
+        return documents
+    return _make_companies
+
+
+@pytest.mark.django_db
+class TestBulkApprove:
+    """DocumentReviewService.review with APPROVE"""
+
+    def test_approves_and_verifies_complete_profiles(self, make_user, make_companies, admin_user, django_capture_on_commit_callbacks):
+        documents = make_companies(2)
+        landlord = make_user('landlord', 'landlord')
+        documents.append(upload(landlord, 'id_card'))
+        Notification.objects.all().delete()
+        OutboxEmail.objects.all().delete()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            result = DocumentReviewService.review(
+                [document.pk for document in documents], admin_user, DocumentReviewService.APPROVE
+            )
+
+        assert len(result['documents']) == 5
+        assert sorted(user.username for user in result['verified']) == ['company0', 'company1']
+        assert not UserDocument.objects.exclude(status='approved').exists()
+        assert set(CustomUser.objects.filter(is_verified=True).values_list('username', flat=True)) == {
+            'company0', 'company1'
+        }
+        assert CustomUser.objects.get(username='company0').verified_by == admin_user
+        assert not CustomUser.objects.get(pk=landlord.pk).is_verified
+
+        assert Notification.objects.filter(notification_type='document_approved').count() == 5
+        assert Notification.objects.filter(notification_type='profile_verified').count() == 2
+        assert OutboxEmail.objects.filter(subject='Document approuvé - Pratik').count() == 5
+        assert OutboxEmail.objects.filter(subject='Profil vérifié - Pratik').count() == 2
+
+        # The materialized counts followed the bulk updates
+        assert StatusCount.reconcile() == 0
+
+    def test_query_count_does_not_grow_with_the_batch(self, make_companies, admin_user):
+        # First review creates the status count buckets
+        warmup = make_companies(1, prefix='warmup')
+        DocumentReviewService.review([document.pk for document in warmup], admin_user, 'approve')
+
+        small = make_companies(1, prefix='small')
+        with CaptureQueriesContext(connection) as few:
+            DocumentReviewService.review([document.pk for document in small], admin_user, 'approve')
+
+        large = make_companies(10, prefix='large')
+        with CaptureQueriesContext(connection) as many:
+            DocumentReviewService.review([document.pk for document in large], admin_user, 'approve')
+
+        assert len(many) == len(few)
+
+    def test_skips_documents_already_in_target_status(self, make_companies, admin_user):
+        [document, other] = make_companies(1)
+        UserDocument.objects.filter(pk=document.pk).update(status='approved')
+
+        result = DocumentReviewService.review([document.pk, other.pk], admin_user, 'approve')
+
+        assert [reviewed.pk for reviewed in result['documents']] == [other.pk]
+
+
+@pytest.mark.django_db
+class TestBulkReject:
+    """DocumentReviewService.review with REJECT"""
+
+    def test_rejects_and_marks_owners_incomplete(self, make_companies, admin_user, django_capture_on_commit_callbacks):
+        documents = make_companies(1)
+        OutboxEmail.objects.all().delete()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            DocumentReviewService.review(
+                [document.pk for document in documents], admin_user, DocumentReviewService.REJECT, reason='expired'
+            )
+
+        assert set(UserDocument.objects.values_list('status', 'rejection_reason')) == {('rejected', 'expired')}
+        company = CustomUser.objects.get(username='company0')
+        assert company.verification_status == 'incomplete'
+        assert company.verification_note == 'Documents « kbis_siret », « representative_id » rejetés : expired'
+        rejected = Notification.objects.filter(notification_type='document_rejected')
+        assert rejected.count() == 2
+        assert all('Raison: Document expiré' in notification.message for notification in rejected)
+        assert OutboxEmail.objects.filter(subject='Document rejeté - Pratik').count() == 2
+        assert StatusCount.reconcile() == 0
+
+
+@pytest.mark.django_db
+class TestBulkReviewView:
+    """AdminDocumentBulkReviewView"""
+
+    def test_post_approves_selection(self, make_companies, client, admin_user):
+        documents = make_companies(1)
+        client.force_login(admin_user)
+
+        response = client.post('/dashboard/admin/documents/bulk-review/', {
+            'action': 'approve',
+            'document_ids': [document.pk for document in documents],
+        })
+
+        assert response.status_code == 302
+        assert not UserDocument.objects.filter(status='pending').exists()
+        assert CustomUser.objects.get(username='company0').is_verified
+
+    def test_post_without_selection_changes_nothing(self, make_companies, client, admin_user):
+        make_companies(1)
+        client.force_login(admin_user)
+
+        response = client.post('/dashboard/admin/documents/bulk-review/', {'action': 'approve'})
+
+        assert response.status_code == 302
+        assert UserDocument.objects.filter(status='pending').count() == 2
+
+    def test_requires_admin(self, make_companies, client):
+        documents = make_companies(1)
+        client.force_login(CustomUser.objects.get(username='company0'))
+
+        response = client.post('/dashboard/admin/documents/bulk-review/', {
+            'action': 'approve',
+            'document_ids': [document.pk for document in documents],
+        })
+
+        assert response.status_code == 403
+        assert UserDocument.objects.filter(status='pending').count() == 2
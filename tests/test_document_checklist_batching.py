@@ -0,0 +1,88 @@
+"""
+Tests for the single-query and bulk checklist computation of DocumentChecklistService.
+"""
+from datetime import timedelta
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
+
+from apps.users.models import CustomUser
+from apps.users.models_documents import UserDocument
+from core.services.document_checklist_service import DocumentChecklistService
+
+
+def upload(user, document_type, status='pending', days_ago=0):
+    document = UserDocument.objects.create(
+        user=user,
+        document_type=document_type,
+        title=document_type,
+        file=SimpleUploadedFile('doc.pdf', b'content', content_type='application/pdf'),
+        status=status,
+    )
+    UserDocument.objects.filter(pk=document.pk).update(uploaded_at=timezone.now() - timedelta(days=days_ago))
+    return document
+
+
+@pytest.mark.django_db
+class TestChecklistQueries:
+    """DocumentChecklistService query batching"""
+
+    def test_single_query_and_latest_document_wins(self, make_user, django_assert_num_queries):
+        driver = make_user('driver', 'driver')
+        upload(driver, 'id_card', 'rejected', days_ago=3)
+        latest = upload(driver, 'id_card', 'approved', days_ago=1)
+        upload(driver, 'driver_license', 'pending')
+        upload(driver, 'other', 'approved')
+        driver = CustomUser.objects.get(pk=driver.pk)
+
+        with django_assert_num_queries(1):
+            checklist = DocumentChecklistService.get_checklist(driver)
+            assert DocumentChecklistService.get_completion_percentage(driver) == 20
+            assert not DocumentChecklistService.are_all_required_approved(driver)
+            missing = DocumentChecklistService.get_missing_document_types(driver)
+
+        assert [item.status for item in checklist] == ['approved', 'missing', 'pending', 'missing', 'missing']
+        assert checklist[0].document_id == latest.pk
+        assert missing == ['address_proof', 'vehicle_insurance', 'vehicle_registration']
+
+    def test_memo_is_cleared_when_the_user_uploads(self, make_user):
+        company = make_user('company', 'company')
+        assert DocumentChecklistService.get_completion_percentage(company) == 0
+
+        UserDocument.objects.create(
+            user=company,
+            document_type='kbis_siret',
+            title='Kbis',
+            file=SimpleUploadedFile('kbis.pdf', b'content', content_type='application/pdf'),
+            status='approved',
+        )
+
+        assert DocumentChecklistService.get_completion_percentage(company) == 50
+
+    def test_bulk_checklists_in_one_query(self, make_user, django_assert_num_queries):
+        landlord = make_user('landlord', 'landlord')
+        company = make_user('company', 'company')
+        student = make_user('student', 'student')
+        upload(landlord, 'id_card', 'approved')
+        upload(company, 'kbis_siret', 'approved')
+        upload(company, 'representative_id', 'approved')
+
+        with django_assert_num_queries(1):
+            percentages = DocumentChecklistService.get_completion_percentages([landlord, company, student])
+
+        assert percentages == {landlord.pk: 25, company.pk: 100, student.pk: 100}
+
+
+@pytest.mark.django_db
+def test_admin_verification_list_shows_completion(make_user, client):
+    admin = make_user('admin', 'admin', is_staff=True)
+    company = make_user('company', 'company')
+    upload(company, 'kbis_siret', 'approved')
+    client.force_login(admin)
+
+    response = client.get('/dashboard/admin/verifications/')
+
+    [listed] = response.context['users_list']
+    assert listed.completion_percentage == 50
+    assert '📄 50%' in response.content.decode()
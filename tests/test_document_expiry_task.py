@@ -0,0 +1,119 @@
+"""
+Tests for the chunked, resumable check_document_expiry task.
+"""
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
+
+from apps.notifications.models import Notification, OutboxEmail, TaskCheckpoint
+from apps.users.models import CustomUser
+from apps.verification.models import VerificationDocument
+from core.tasks.notification_tasks import check_document_expiry, cleanup_old_notifications
+
+
+@pytest.fixture(autouse=True)
+def locmem_email(settings):
+    settings.EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+
+
+def queued_emails():
+    return sorted(OutboxEmail.objects.values_list('to_email', flat=True))
+
+
+def make_document(index, days_left=10, status='APPROVED'):
+    user = CustomUser.objects.create_user(
+        username=f'driver{index}',
+        email=f'driver{index}@test.com',
+        password='testpass123',
+        user_type='driver'
+    )
+    return VerificationDocument.objects.create(
+        user=user,
+        document_type='DRIVER_LICENSE',
+        file=SimpleUploadedFile('permis.pdf', b'content', content_type='application/pdf'),
+        status=status,
+        expiry_date=timezone.now().date() + timedelta(days=days_left),
+    )
+
+
+@pytest.mark.django_db
+class TestCheckDocumentExpiry:
+    """check_document_expiry"""
+
+    def test_notifies_and_queues_emails_for_expiring_documents_only(self):
+        expiring = [make_document(i) for i in range(3)]
+        make_document(10, days_left=60)
+        make_document(11, days_left=-1)
+        make_document(12, status='PENDING')
+
+        result = check_document_expiry(chunk_size=2)
+
+        assert result == 'Sent 3 expiry notifications'
+        assert set(
+            Notification.objects.filter(notification_type=Notification.DOCUMENT_EXPIRING)
+            .values_list('recipient', flat=True)
+        ) == {doc.user_id for doc in expiring}
+        assert queued_emails() == [doc.user.email for doc in expiring]
+        assert OutboxEmail.objects.first().subject == 'Document bientôt expiré - PRATIK'
+
+    def test_rerun_same_day_is_a_no_op(self):
+        make_document(1)
+        check_document_expiry()
+
+        assert check_document_expiry() == 'Sent 0 expiry notifications'
+        assert Notification.objects.count() == 1
+        assert OutboxEmail.objects.count() == 1
+
+    def test_resumes_from_checkpoint(self):
+        docs = [make_document(i) for i in range(4)]
+        key = 'check_document_expiry:run'
+        TaskCheckpoint.objects.create(key=key, position=docs[1].pk)
+
+        assert check_document_expiry(chunk_size=2, run_key=key) == 'Sent 2 expiry notifications'
+        assert queued_emails() == [docs[2].user.email, docs[3].user.email]
+        checkpoint = TaskCheckpoint.objects.get(key=key)
+        assert checkpoint.completed and checkpoint.position == docs[3].pk
+
+    def test_soft_timeout_reenqueues_the_run(self):
+        from apps.notifications import emails
+
+        docs = [make_document(i) for i in range(5)]
+        render = emails.render_emails
+        calls = []
+
+        def interrupted_render(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 2:
+                raise SoftTimeLimitExceeded()
+            return render(*args, **kwargs)
+
+        with mock.patch('apps.notifications.emails.render_emails', interrupted_render), \
+                mock.patch.object(check_document_expiry, 'apply_async') as apply_async:
+            check_document_expiry(chunk_size=2)
+
+        kwargs = apply_async.call_args.kwargs['kwargs']
+        assert kwargs['run_date'] == timezone.now().date().isoformat()
+        assert TaskCheckpoint.objects.get(key=kwargs['run_key']).position == docs[1].pk
+
+        # The interrupted chunk was rolled back: neither notified nor emailed
+        assert Notification.objects.count() == 2
+        assert queued_emails() == [docs[0].user.email, docs[1].user.email]
+
+        # The resumed task replays it, notifications and emails together
+        assert check_document_expiry(**kwargs) == 'Sent 3 expiry notifications'
+        assert queued_emails() == [doc.user.email for doc in docs]
+        assert Notification.objects.count() == 5
+        assert TaskCheckpoint.objects.get(key=kwargs['run_key']).completed
+
+
+@pytest.mark.django_db
+def test_cleanup_purges_finished_checkpoints():
+    TaskCheckpoint.objects.create(key='check_document_expiry:done', position=10, completed=True)
+    TaskCheckpoint.objects.create(key='check_document_expiry:running', position=5)
+
+    assert cleanup_old_notifications() == 'Deleted 0 old notifications and 1 finished checkpoints'
+    assert list(TaskCheckpoint.objects.values_list('key', flat=True)) == ['check_document_expiry:running']
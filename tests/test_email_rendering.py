@@ -0,0 +1,58 @@
+"""
+Tests for the email rendering helpers (apps.notifications.emails).
+"""
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from django.conf import settings
+from django.template.loader import get_template
+
+from apps.notifications.emails import build_email, render_email, render_emails
+
+
+EMAIL_TEMPLATE_DIR = Path(settings.BASE_DIR) / 'templates' / 'emails'
+
+
+def notification(title='Stage & alternance'):
+    return SimpleNamespace(title=title, message="L'offre X est publiée", link='/internships/1/')
+
+
+def user():
+    return SimpleNamespace(username='alice', get_full_name=lambda: 'Alice Martin')
+
+
+@pytest.mark.parametrize('html_path', sorted(EMAIL_TEMPLATE_DIR.glob('*.html')), ids=lambda path: path.stem)
+def test_every_email_has_a_text_template(html_path):
+    get_template(f'emails/{html_path.stem}.txt')
+
+
+def test_text_body_comes_from_text_template():
+    text, html = render_email('notification', {'user': user(), 'notification': notification()})
+
+    assert '<' not in text
+    assert 'Bonjour Alice Martin,' in text
+    # Text bodies are not HTML-escaped
+    assert 'Stage & alternance' in text and "L'offre" in text
+    assert f"{settings.SITE_URL}/internships/1/" in text
+    assert "L'équipe Pratik" in text and 'Tous droits réservés' in text
+    assert '&amp;' in html
+
+
+def test_render_many_resolves_templates_once():
+    contexts = [{'user': user(), 'notification': notification(f'Offre {i}')} for i in range(3)]
+
+    with mock.patch('apps.notifications.emails.get_template', wraps=get_template) as lookup:
+        rendered = list(render_emails('notification', contexts))
+
+    assert lookup.call_count == 2
+    assert [text.splitlines()[0] for text, _ in rendered] == ['Offre 0', 'Offre 1', 'Offre 2']
+
+
+def test_build_email_has_text_and_html_parts():
+    email = build_email('notification', 'Sujet', {'user': user(), 'notification': notification()}, to=['a@test.com'])
+
+    assert email.body.startswith('Stage & alternance')
+    assert email.alternatives[0][1] == 'text/html'
+    assert email.from_email == settings.DEFAULT_FROM_EMAIL
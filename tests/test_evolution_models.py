@@ -2,7 +2,7 @@
 Unit Tests for StudentEvolutionTracking Model
 """
 import pytest
-from apps.tracking.models import StudentEvolutionTracking
+from apps.tracking.models import EvolutionEvent, StudentEvolutionTracking
 from apps.users.models import CustomUser
 
 
@@ -79,20 +79,22 @@ class TestStudentEvolutionTrackingModel:
         assert tracking.notify_on_status_change is False
         assert tracking.notify_on_availability is True
     
-    def test_evolution_history_json(self, company_user, student_user):
-        """Test evolution history JSON field."""
+    def test_evolution_history_events(self, company_user, student_user):
+        """Test evolution history built from EvolutionEvent rows."""
         tracking = StudentEvolutionTracking.objects.create(
             company=company_user,
             student=student_user,
-            current_level='BEGINNER',
-            evolution_history=[
-                {"date": "2026-01-01", "level": "BEGINNER", "domain": "Web Dev"}
-            ]
+            current_level='BEGINNER'
+        )
+        EvolutionEvent.objects.create(
+            tracking=tracking,
+            student=student_user,
+            changes=["Niveau: BEGINNER → INTERMEDIATE"]
         )
         
         assert isinstance(tracking.evolution_history, list)
         assert len(tracking.evolution_history) == 1
-        assert tracking.evolution_history[0]["level"] == "BEGINNER"
+        assert tracking.evolution_history[0]["changes"] == ["Niveau: BEGINNER → INTERMEDIATE"]
     
     def test_str_representation(self, company_user, student_user):
         """Test string representation."""
@@ -0,0 +1,76 @@
+"""
+Tests for FieldTrackingMixin and the verification status change signal.
+"""
+import pytest
+
+from apps.notifications.models import Notification
+from apps.users.models import CustomUser
+
+
+@pytest.fixture
+def user():
+    user = CustomUser.objects.create_user(
+        username='landlord', email='landlord@test.com', password='testpass123', user_type='landlord'
+    )
+    return CustomUser.objects.get(pk=user.pk)
+
+
+@pytest.mark.django_db
+class TestFieldTracking:
+    """FieldTrackingMixin on CustomUser"""
+
+    def test_loaded_value_is_snapshotted(self, user):
+        assert user.get_loaded_value('verification_status') == 'pending'
+        assert not user.has_changed('verification_status')
+        assert user.get_dirty_fields() == {}
+
+        user.verification_status = 'under_review'
+
+        assert user.has_changed('verification_status')
+        assert user.get_dirty_fields() == {'verification_status': 'pending'}
+
+    def test_snapshot_follows_saves(self, user):
+        user.verification_status = 'under_review'
+        user.save()
+
+        assert user.get_dirty_fields() == {}
+        assert user.get_loaded_value('verification_status') == 'under_review'
+
+    def test_deferred_field_is_unknown(self, user):
+        deferred = CustomUser.objects.only('pk', 'username').get(pk=user.pk)
+
+        assert not deferred.is_loaded('verification_status')
+        assert deferred.has_changed('verification_status')
+        assert deferred.get_dirty_fields() == {}
+
+
+@pytest.mark.django_db
+class TestVerificationStatusSignal:
+    """detect_verification_status_change without the extra SELECT"""
+
+    def test_unrelated_update_fields_save_is_a_single_query(self, user, django_assert_num_queries):
+        user.is_verified = True
+
+        with django_assert_num_queries(1):
+            user.save(update_fields=['is_verified'])
+
+    def test_status_change_still_notifies(self, user):
+        user.verification_status = 'suspended'
+        user.verification_note = 'Fraude'
+        user.save()
+
+        notification = Notification.objects.get(recipient=user, notification_type='profile_suspended')
+        assert 'Note: Fraude' in notification.message
+
+    def test_unchanged_status_does_not_notify(self, user):
+        user.bio = 'Nouvelle bio'
+        user.save()
+
+        assert not Notification.objects.filter(recipient=user).exists()
+
+    def test_hand_built_instance_falls_back_to_the_database(self, user):
+        detached = CustomUser(pk=user.pk, username=user.username, email=user.email,
+                              password=user.password, user_type='landlord', verification_status='suspended')
+        detached.save()
+
+        assert Notification.objects.filter(recipient=user, notification_type='profile_suspended').exists()
@@ -0,0 +1,87 @@
+"""
+Tests for the index advisor (core.services.index_advisor and its command).
+"""
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from apps.applications.models import Application
+from apps.notifications.models import Notification
+from apps.users.models_documents import UserDocument
+from core.services.index_advisor import IndexAdvisorService
+
+
+POSTGRES_PLAN = {
+    'Plan': {
+        'Node Type': 'Limit',
+        'Plans': [{
+            'Node Type': 'Nested Loop',
+            'Plans': [
+                {'Node Type': 'Index Scan', 'Relation Name': 'internships_internship'},
+                {'Node Type': 'Seq Scan', 'Relation Name': 'applications_application'},
+            ],
+        }],
+    },
+}
+
+
+class TestScannedTables:
+
+    def test_postgresql_plan(self):
+        assert IndexAdvisorService.scanned_tables(POSTGRES_PLAN) == ['applications_application']
+
+    def test_sqlite_plan(self):
+        plan = (
+            '4 0 0 SCAN users_userdocument\n'
+            '6 0 0 SCAN recommendations_internrecommendation USING INDEX rec_rating_idx\n'
+            '9 0 0 SEARCH users_customuser USING INTEGER PRIMARY KEY (rowid=?)'
+        )
+        assert IndexAdvisorService.scanned_tables(plan) == ['users_userdocument']
+
+
+@pytest.mark.django_db
+class TestSuggestIndex:
+
+    def test_equalities_then_ordering_then_ranges(self):
+        queryset = Notification.objects.filter(
+            created_at__year__gte=2026, recipient_id=1, is_read=False
+        ).exclude(title='').order_by('-created_at')
+
+        suggestion = IndexAdvisorService.suggest_index(queryset, 'notifications_notification')
+
+        assert suggestion == ['recipient', 'is_read', '-created_at']
+
+    def test_joined_table(self):
+        queryset = Application.objects.filter(internship__company_id=1, status='pending').order_by('-created_at')
+
+        assert IndexAdvisorService.suggest_index(queryset, 'internships_internship') == ['company']
+        assert IndexAdvisorService.suggest_index(queryset, 'applications_application') == ['status', '-created_at']
+
+
+@pytest.mark.django_db
+class TestCommand:
+
+    def test_reports_every_query(self):
+        out = StringIO()
+
+        call_command('index_advisor', 'documents.review', 'verification.pending', stdout=out)
+
+        assert 'documents.review: OK' in out.getvalue()
+        assert 'verification.pending: OK' in out.getvalue()
+        assert '2 requête(s) analysée(s), 0 sans index adapté' in out.getvalue()
+
+    def test_flags_a_scan_and_fails_in_ci(self, monkeypatch):
+        corpus = [('documents.by_title', UserDocument.objects.filter(title='CNI').order_by('-uploaded_at'))]
+        monkeypatch.setattr('apps.dashboard.management.commands.index_advisor.get_query_corpus', lambda: corpus)
+        out = StringIO()
+
+        call_command('index_advisor', stdout=out)
+        assert "models.Index(fields=['title', '-uploaded_at']) sur users_userdocument" in out.getvalue()
+
+        with pytest.raises(CommandError):
+            call_command('index_advisor', '--fail-on-scan', stdout=StringIO())
+
+    def test_unknown_query(self):
+        with pytest.raises(CommandError):
+            call_command('index_advisor', 'inconnue')
@@ -0,0 +1,133 @@
+"""
+Tests for InternshipSearchService
+
+Covers incremental index maintenance (save/delete) and ranked queries
+against the SQLite FTS5 backend used in development and tests.
+"""
+import pytest
+
+from apps.internships.models import Internship, InternshipSearchDocument
+from apps.users.models import CustomUser
+from core.services.search_service import InternshipSearchService, duration_bucket
+
+
+@pytest.fixture
+def company(db):
+    return CustomUser.objects.create_user(
+        username='searchco',
+        email='searchco@test.com',
+        password='testpass123',
+        user_type='company',
+        company_name='Amazonie Digital'
+    )
+
+
+def make_internship(company, **kwargs):
+    data = {
+        'title': 'Stage',
+        'description': 'Description',
+        'location': 'Cayenne',
+        'duration': '3 mois',
+    }
+    data.update(kwargs)
+    data.setdefault('slug', data['title'].lower().replace(' ', '-'))
+    return Internship.objects.create(company=company, **data)
+
+
+def search(query):
+    return list(InternshipSearchService.search(Internship.objects.all(), query))
+
+
+@pytest.mark.django_db
+class TestInternshipSearchIndex:
+    """Search documents follow the internship lifecycle."""
+
+    def test_document_created_on_save(self, company):
+        internship = make_internship(company, title='Développeur Python', duration='5-6 mois')
+        document = InternshipSearchDocument.objects.get(internship=internship)
+        assert document.title == 'Développeur Python'
+        assert 'Amazonie Digital' in document.company_name
+        assert document.duration_bucket == '5-6 mois'
+
+    def test_document_refreshed_on_update(self, company):
+        internship = make_internship(company, title='Comptable')
+        internship.title = 'Analyste financier'
+        internship.save()
+        assert search('analyste') == [internship]
+        assert search('comptable') == []
+
+    def test_document_removed_on_delete(self, company):
+        internship = make_internship(company, title='Graphiste')
+        internship.delete()
+        assert search('graphiste') == []
+        assert not InternshipSearchDocument.objects.exists()
+
+    def test_company_rename_reindexes(self, company):
+        internship = make_internship(company, title='Technicien')
+        company.company_name = 'Guyane Solaire'
+        company.save()
+        assert search('solaire') == [internship]
+
+    def test_rebuild(self, company):
+        make_internship(company, title='Stage A')
+        make_internship(company, title='Stage B')
+        InternshipSearchDocument.objects.all().delete()
+        assert InternshipSearchService.rebuild(batch_size=1) == 2
+        assert len(search('stage')) == 2
+
+    def test_company_reindex_is_one_upsert(self, company, django_assert_num_queries):
+        for index in range(5):
+            make_internship(company, title=f'Stage {index}', slug=f'stage-{index}')
+
+        # SELECT internships, upsert documents, FTS delete and insert
+        with django_assert_num_queries(4):
+            assert InternshipSearchService.index_company(company) == 5
+
+
+@pytest.mark.django_db
+class TestInternshipSearchQuery:
+    """Ranked search queries."""
+
+    def test_prefix_match(self, company):
+        internship = make_internship(company, title='Développeur web')
+        assert search('dével') == [internship]
+
+    def test_accent_insensitive(self, company):
+        internship = make_internship(company, title='Développeur web')
+        assert search('developpeur') == [internship]
+
+    def test_all_terms_required(self, company):
+        internship = make_internship(company, title='Full Stack Developer')
+        make_internship(company, title='Stack Manager')
+        assert search('full stack') == [internship]
+
+    def test_title_ranks_above_description(self, company):
+        in_description = make_internship(company, title='Assistant', description='Travail avec Django')
+        in_title = make_internship(company, title='Django developer', description='Backend')
+        assert search('django') == [in_title, in_description]
+
+    def test_matches_location_and_company(self, company):
+        internship = make_internship(company, title='Stage', location='Kourou')
+        assert search('kourou') == [internship]
+        assert search('amazonie') == [internship]
+
+    def test_filters_apply_to_every_match(self, company):
+        in_title = [make_internship(company, title=f'Django {index}', slug=f'django-{index}') for index in range(3)]
+        in_description = make_internship(company, title='Assistant', description='Django', location='Kourou')
+
+        results = InternshipSearchService.search(Internship.objects.filter(location='Kourou'), 'django')
+
+        assert list(results) == [in_description]
+        assert len(search('django')) == len(in_title) + 1
+
+    def test_blank_query_returns_queryset(self, company):
+        make_internship(company)
+        assert len(search('  !! ')) == 1
+
+
+def test_duration_bucket():
+    assert duration_bucket('1 mois') == '1-2 mois'
+    assert duration_bucket('3-4') == '3-4 mois'
+    assert duration_bucket('6 mois') == '5-6 mois'
+    assert duration_bucket('12 mois') == '6+ mois'
+    assert duration_bucket('à définir') == ''
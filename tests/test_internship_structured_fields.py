@@ -0,0 +1,123 @@
+"""
+Tests for the structured duration/salary columns of Internship.
+"""
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+
+from apps.internships.models import Internship
+from apps.internships.utils import parse_duration_months, parse_salary_amount
+from apps.users.models import CustomUser
+
+
+@pytest.fixture
+def company(db):
+    return CustomUser.objects.create_user(
+        username='structco',
+        email='structco@test.com',
+        password='testpass123',
+        user_type='company'
+    )
+
+
+def make_internship(company, title, **kwargs):
+    return Internship.objects.create(
+        company=company,
+        title=title,
+        description='Description',
+        location='Cayenne',
+        **kwargs
+    )
+
+
+@pytest.mark.parametrize('duration, expected', [
+    ('6 mois', (6, 6)),
+    ('3-4', (3, 4)),
+    ('3 à 4 mois', (3, 4)),
+    ('8 semaines', (2, 2)),
+    ('1 an', (12, 12)),
+    ('1 semestre', (6, 6)),
+    ('3 mois à 1 an', (3, 12)),
+    ('2 postes de 6 mois', (6, 6)),
+    ('6 mois renouvelable 1 an', (None, None)),
+    ('du 01/03 au 30/06', (None, None)),
+    ('à définir', (None, None)),
+    ('', (None, None)),
+])
+def test_parse_duration_months(duration, expected):
+    assert parse_duration_months(duration) == expected
+
+
+@pytest.mark.parametrize('salary, expected', [
+    ('500€/mois', Decimal('500')),
+    ('1 200 €', Decimal('1200')),
+    ('600,50 €', Decimal('600.50')),
+    ('4,35 €/h', Decimal('659.76')),
+    ('150 € par semaine', Decimal('650')),
+    ('80 €/jour', None),
+    ('Non rémunéré', Decimal('0')),
+    ('3 mois, 600€/mois', Decimal('600')),
+    ('35h/semaine, 600€', Decimal('600')),
+    ('Gratification 15 % du plafond', None),
+    ('Non rémunéré mais 600€ de frais', None),
+    ('500 à 600 €', None),
+    ('Gratification légale', None),
+    (None, None),
+])
+def test_parse_salary_amount(salary, expected):
+    assert parse_salary_amount(salary) == expected
+
+
+@pytest.mark.django_db
+class TestStructuredFields:
+    """Structured columns are filled at save time and used by the list filters."""
+
+    def test_fields_parsed_on_save(self, company):
+        internship = make_internship(company, 'Stage', duration='3-4 mois', salary='600€')
+        internship.refresh_from_db()
+        assert (internship.duration_months_min, internship.duration_months_max) == (3, 4)
+        assert internship.salary_amount == Decimal('600')
+
+    def test_update_fields_include_parsed_columns(self, company):
+        internship = make_internship(company, 'Stage', duration='2 mois')
+        internship.duration = '6 mois'
+        internship.save(update_fields=['duration'])
+        internship.refresh_from_db()
+        assert internship.duration_months_max == 6
+
+    def test_duration_filter(self, client, company):
+        short = make_internship(company, 'Court', duration='2 mois')
+        medium = make_internship(company, 'Moyen', duration='3-4')
+        long = make_internship(company, 'Long', duration='6 mois')
+
+        response = client.get('/internships/?duration=3')
+        internships = list(response.context['internships'])
+        assert medium in internships
+        assert short not in internships
+        assert long not in internships
+
+    def test_paid_filter(self, client, company):
+        paid = make_internship(company, 'Payé', duration='3 mois', salary='500€/mois')
+        legal = make_internship(company, 'Gratifié', duration='3 mois', salary='Gratification légale')
+        unpaid = make_internship(company, 'Bénévole', duration='3 mois')
+        volunteer = make_internship(company, 'Associatif', duration='3 mois', salary='Non rémunéré')
+
+        response = client.get('/internships/?paid=1')
+        internships = list(response.context['internships'])
+        assert paid in internships
+        assert legal in internships
+        assert unpaid not in internships
+        assert volunteer not in internships
+
+    def test_backfill_command(self, company):
+        internship = make_internship(company, 'Ancien', duration='5-6 mois', salary='700 €')
+        Internship.objects.filter(pk=internship.pk).update(
+            duration_months_min=None, duration_months_max=None, salary_amount=None
+        )
+
+        call_command('backfill_internship_structured_fields', batch_size=1, only_missing=True)
+
+        internship.refresh_from_db()
+        assert internship.duration_months_max == 6
+        assert internship.salary_amount == Decimal('700')
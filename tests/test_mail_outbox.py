@@ -0,0 +1,166 @@
+"""
+Tests for the DB-backed mail outbox (MailOutboxService and flush_mail_outbox).
+"""
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.core import mail
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.notifications.models import OutboxEmail
+from apps.users.models import CustomUser
+from apps.users.models_documents import UserDocument
+from core.services.mail_outbox import MailOutboxService
+from core.tasks.email_tasks import flush_mail_outbox, send_document_approved_email
+
+
+@pytest.fixture(autouse=True)
+def locmem_email(settings):
+    settings.EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+    settings.MAIL_OUTBOX_MAX_ATTEMPTS = 3
+    settings.MAIL_OUTBOX_RETRY_DELAY = 60
+
+
+class FlakyBackend(EmailBackend):
+    """locmem backend refusing every message sent to a 'bad' address"""
+
+    def send_messages(self, messages):
+        if any(address.startswith('bad') for message in messages for address in message.to):
+            raise OSError('550 mailbox unavailable')
+        return super().send_messages(messages)
+
+
+def enqueue(recipients, dedup_key=None):
+    return MailOutboxService.enqueue(
+        subject='Sujet',
+        body='Corps',
+        recipients=recipients,
+        html_body='<p>Corps</p>',
+        dedup_key=dedup_key,
+    )
+
+
+@pytest.mark.django_db
+class TestEnqueue:
+    """MailOutboxService.enqueue"""
+
+    def test_one_row_per_recipient(self):
+        assert enqueue(['a@test.com', 'A@test.com ', '', 'b@test.com']) == 2
+        assert set(OutboxEmail.objects.values_list('to_email', flat=True)) == {'a@test.com', 'b@test.com'}
+        assert not mail.outbox
+
+    def test_dedup_is_per_recipient(self):
+        enqueue(['a@test.com'], dedup_key='event:1')
+
+        assert enqueue(['a@test.com', 'b@test.com'], dedup_key='event:1') == 1
+        assert OutboxEmail.objects.count() == 2
+
+    def test_flush_is_scheduled_after_commit(self, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            enqueue(['a@test.com'])
+
+        assert len(mail.outbox) == 1
+        assert OutboxEmail.objects.get().status == OutboxEmail.SENT
+
+
+@pytest.mark.django_db
+class TestFlush:
+    """MailOutboxService.flush"""
+
+    def test_batches_share_one_connection(self):
+        enqueue([f'user{i}@test.com' for i in range(5)])
+
+        with mock.patch('core.services.mail_outbox.get_connection', wraps=mail.get_connection) as get_connection:
+            result = MailOutboxService.flush(batch_size=2)
+
+        get_connection.assert_called_once()
+        assert result == {'sent': 5, 'failed': 0}
+        assert len(mail.outbox) == 5
+        assert mail.outbox[0].alternatives[0][1] == 'text/html'
+        assert not OutboxEmail.objects.exclude(status=OutboxEmail.SENT).exists()
+
+    def test_failure_backs_off_exponentially(self):
+        enqueue(['good@test.com', 'bad@test.com'])
+
+        assert MailOutboxService.flush(connection=FlakyBackend()) == {'sent': 1, 'failed': 1}
+        failed = OutboxEmail.objects.get(to_email='bad@test.com')
+        assert failed.status == OutboxEmail.PENDING and failed.attempts == 1
+        assert failed.next_attempt_at > timezone.now() + timedelta(seconds=50)
+
+        # Not due yet: nothing to send
+        assert MailOutboxService.flush(connection=FlakyBackend()) == {'sent': 0, 'failed': 0}
+        assert MailOutboxService.retry_delay(3) == timedelta(seconds=240)
+
+    def test_gives_up_after_max_attempts(self):
+        enqueue(['bad@test.com'])
+
+        for _ in range(3):
+            OutboxEmail.objects.update(next_attempt_at=timezone.now())
+            MailOutboxService.flush(connection=FlakyBackend())
+
+        email = OutboxEmail.objects.get()
+        assert email.status == OutboxEmail.FAILED
+        assert email.attempts == 3
+        assert '550' in email.last_error
+
+    def test_failed_reconnect_keeps_delivered_emails(self):
+        enqueue(['good@test.com', 'bad@test.com', 'later@test.com'])
+        connection = FlakyBackend()
+        connection.open = mock.Mock(side_effect=[None, OSError('connection refused')])
+
+        assert MailOutboxService.flush(connection=connection) == {'sent': 1, 'failed': 1}
+
+        statuses = dict(OutboxEmail.objects.values_list('to_email', 'status'))
+        assert statuses == {
+            'good@test.com': OutboxEmail.SENT,
+            'bad@test.com': OutboxEmail.PENDING,
+            'later@test.com': OutboxEmail.PENDING,
+        }
+        # Handed back to the next flush, not left leased
+        assert OutboxEmail.objects.get(to_email='later@test.com').next_attempt_at <= timezone.now()
+        assert len(mail.outbox) == 1
+
+    def test_claimed_rows_are_skipped_by_other_flushers(self, settings):
+        settings.MAIL_OUTBOX_CLAIM_TIMEOUT = 300
+        enqueue(['a@test.com', 'b@test.com'])
+
+        batch = MailOutboxService.claim(OutboxEmail.objects.all(), 10)
+
+        assert len(batch) == 2
+        assert MailOutboxService.flush() == {'sent': 0, 'failed': 0}
+        assert not mail.outbox
+
+
+@pytest.mark.django_db
+def test_email_task_goes_through_outbox():
+    user = CustomUser.objects.create_user(
+        username='driver', email='driver@test.com', password='testpass123', user_type='driver'
+    )
+    document = UserDocument.objects.create(
+        user=user,
+        document_type='id_card',
+        title='CNI',
+        file=SimpleUploadedFile('id.pdf', b'content', content_type='application/pdf'),
+    )
+    mail.outbox.clear()
+    OutboxEmail.objects.all().delete()
+
+    send_document_approved_email.delay(document.pk)
+    assert OutboxEmail.objects.filter(to_email='driver@test.com', subject='Document approuvé - Pratik').count() == 1
+
+    assert flush_mail_outbox() == 'Sent 1 emails, 0 failed'
+    assert mail.outbox[-1].to == ['driver@test.com']
+
+
+@pytest.mark.django_db
+def test_benchmark_command_cleans_up(capsys):
+    enqueue(['real@test.com'])
+
+    call_command('benchmark_mail_outbox', count=20, batch_size=5)
+
+    assert 'envoyé(s)' in capsys.readouterr().out
+    assert list(OutboxEmail.objects.values_list('to_email', 'status')) == [('real@test.com', OutboxEmail.PENDING)]
@@ -0,0 +1,74 @@
+"""
+Tests for the conversation summary queryset used by the inbox.
+"""
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.messaging.models import Conversation, Message
+
+
+def make_conversation(user, other, messages=()):
+    conversation = Conversation.objects.create()
+    conversation.participants.add(user, other)
+    for sender, content in messages:
+        Message.objects.create(conversation=conversation, sender=sender, content=content)
+    return conversation
+
+
+@pytest.mark.django_db
+class TestConversationSummary:
+    """Conversation.objects.with_summary()"""
+
+    def test_summary_fields(self, make_user):
+        user = make_user('alice')
+        other = make_user('acme', 'company')
+        conversation = make_conversation(user, other, [
+            (user, 'Bonjour'),
+            (other, 'Bonjour, merci pour votre candidature'),
+            (other, 'Êtes-vous disponible lundi ?'),
+        ])
+
+        summary = Conversation.objects.with_summary(user).get(pk=conversation.pk)
+
+        assert summary.other_participant_id == other.pk
+        assert summary.last_message_snippet == 'Êtes-vous disponible lundi ?'
+        assert summary.last_message_sender_id == other.pk
+        assert summary.unread == 2
+
+    def test_unread_excludes_own_and_read_messages(self, make_user):
+        user = make_user('alice')
+        other = make_user('acme', 'company')
+        conversation = make_conversation(user, other, [(user, 'Bonjour'), (other, 'Salut')])
+        conversation.messages.filter(sender=other).update(is_read=True)
+
+        summary = Conversation.objects.with_summary(user).get(pk=conversation.pk)
+        assert summary.unread == 0
+
+    def test_empty_conversation(self, make_user):
+        user = make_user('alice')
+        other = make_user('acme', 'company')
+        conversation = make_conversation(user, other)
+
+        summary = Conversation.objects.with_summary(user).get(pk=conversation.pk)
+        assert summary.last_message_at is None
+        assert summary.unread == 0
+
+
+@pytest.mark.django_db
+def test_inbox_query_count_is_constant(make_user, client):
+    user = make_user('alice')
+    client.force_login(user)
+
+    make_conversation(user, make_user('co0', 'company'), [(user, 'Bonjour')])
+    with CaptureQueriesContext(connection) as single:
+        client.get('/messaging/')
+
+    for i in range(1, 6):
+        other = make_user(f'co{i}', 'company')
+        make_conversation(user, other, [(user, 'Bonjour'), (other, 'Bonjour !')])
+    with CaptureQueriesContext(connection) as many:
+        response = client.get('/messaging/')
+
+    assert len(response.context['conversations']) == 6
+    assert len(many) == len(single)
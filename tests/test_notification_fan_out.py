@@ -0,0 +1,121 @@
+"""
+Tests for the bulk notification fan-out (Notification.fan_out and the dispatcher).
+"""
+from unittest import mock
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from apps.notifications.models import Notification, UnreadCounter
+from apps.users.models import CustomUser
+from apps.users.models_documents import UserDocument
+from core.services.notification_dispatcher import AUDIENCE_STAFF, dispatch_notification
+
+
+@pytest.fixture
+def make_admins(make_user):
+    def _make_admins(count):
+        return [make_user(f'admin{i}', is_staff=True, user_type='admin') for i in range(count)]
+    return _make_admins
+
+
+@pytest.mark.django_db
+class TestFanOut:
+    """Notification.fan_out"""
+
+    def test_creates_one_notification_per_recipient(self, make_user):
+        users = [make_user(f'user{i}') for i in range(5)]
+
+        created = Notification.fan_out(users, Notification.SYSTEM, 'Info', 'Message', batch_size=2)
+
+        assert created == 5
+        assert Notification.objects.filter(title='Info').count() == 5
+
+    def test_accepts_queryset_and_ids_and_deduplicates(self, make_user):
+        users = [make_user(f'user{i}') for i in range(3)]
+
+        assert Notification.fan_out(CustomUser.objects.all(), Notification.SYSTEM, 'A', 'M') == 3
+        assert Notification.fan_out([users[0].pk, users[0].pk, users[1]], Notification.SYSTEM, 'B', 'M') == 2
+
+    def test_inserts_in_chunks(self, make_user, django_assert_max_num_queries):
+        users = [make_user(f'user{i}') for i in range(6)]
+
+        # one INSERT + one counter UPDATE per chunk of 3
+        with django_assert_max_num_queries(4):
+            Notification.fan_out(users, Notification.SYSTEM, 'Info', 'Message', batch_size=3)
+
+    def test_updates_unread_counters(self, make_user):
+        user = make_user('alice')
+        UnreadCounter.get_counts(user)
+
+        Notification.fan_out([user], Notification.SYSTEM, 'Info', 'Message')
+
+        assert UnreadCounter.get_counts(user)['notifications'] == 1
+
+    def test_keys_inserted_concurrently_are_not_counted(self, make_user):
+        alice, bob = make_user('alice'), make_user('bob')
+        UnreadCounter.get_counts(alice)
+        UnreadCounter.get_counts(bob)
+        Notification.objects.create(recipient=alice, title='Info', message='Message', dedup_key='event:1:%s' % alice.pk)
+        UnreadCounter.objects.update(notifications=0)
+
+        # The other run inserts its row between the dedup check and the insert
+        with mock.patch.object(Notification, 'existing_dedup_keys', return_value=set()):
+            created = Notification.fan_out([alice, bob], Notification.SYSTEM, 'Info', 'Message', dedup_key='event:1')
+
+        assert created == 1
+        assert Notification.objects.filter(dedup_key__startswith='event:1:').count() == 2
+        assert UnreadCounter.objects.get(user=alice).notifications == 0
+        assert UnreadCounter.objects.get(user=bob).notifications == 1
+
+
+@pytest.mark.django_db
+class TestDispatcher:
+    """dispatch_notification and on_document_submitted"""
+
+    def test_staff_audience(self, make_user, make_admins):
+        make_admins(3)
+        make_user('student')
+
+        created = dispatch_notification(
+            notification_type='document_submitted',
+            title='Nouveau document soumis',
+            message='Message',
+            audience=AUDIENCE_STAFF,
+        )
+
+        assert created == 3
+        assert not Notification.objects.filter(recipient__is_staff=False).exists()
+
+    def test_document_submission_is_deferred(self, make_user, make_admins):
+        make_admins(2)
+        owner = make_user('driver', user_type='driver')
+
+        with mock.patch('core.services.notification_dispatcher.fan_out_notification.delay') as delay, \
+                mock.patch('core.services.notification_dispatcher.send_document_submitted_admin_email.delay'):
+            UserDocument.objects.create(
+                user=owner,
+                document_type='id_card',
+                title='CNI',
+                file=SimpleUploadedFile('id.pdf', b'content', content_type='application/pdf'),
+            )
+
+        delay.assert_called_once()
+        assert delay.call_args.kwargs['audience'] == AUDIENCE_STAFF
+        assert not Notification.objects.exists()
+
+    def test_document_submission_notifies_every_admin(self, make_user, make_admins):
+        admins = make_admins(3)
+        owner = make_user('driver', user_type='driver')
+
+        with mock.patch('core.services.notification_dispatcher.send_document_submitted_admin_email.delay'):
+            UserDocument.objects.create(
+                user=owner,
+                document_type='id_card',
+                title='CNI',
+                file=SimpleUploadedFile('id.pdf', b'content', content_type='application/pdf'),
+            )
+
+        assert set(
+            Notification.objects.filter(notification_type='document_submitted').values_list('recipient', flat=True)
+        ) == {admin.pk for admin in admins}
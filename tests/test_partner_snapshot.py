@@ -0,0 +1,136 @@
+"""
+Tests for the cached partner directory snapshot and its conditional GET.
+"""
+from decimal import Decimal
+
+import pytest
+from rest_framework.test import APIClient
+
+from apps.users.models import CustomUser
+from apps.users.profile_models import CompanyProfile
+from core.services.partner_service import PartnerPageService
+
+
+def make_company(index, sector='Informatique', city='Cayenne', is_partner=True, **fields):
+    user = CustomUser.objects.create_user(
+        username=f'company{index}', email=f'company{index}@test.com', password='testpass123', user_type='company'
+    )
+    return CompanyProfile.objects.create(
+        user=user, company_name=f'Company {index}', siret=f'{index:014d}', sector=sector,
+        description='Description', address='1 rue du Port', city=city, postal_code='97300',
+        is_partner=is_partner, **fields
+    )
+
+
+@pytest.fixture
+def partners():
+    return [
+        make_company(1, total_interns_hosted=3, average_rating=Decimal('4.00')),
+        make_company(2, sector='BTP', city='Kourou', total_interns_hosted=2, average_rating=Decimal('3.00')),
+        make_company(3, sector='', total_interns_hosted=1, average_rating=Decimal('5.00')),
+        make_company(4, sector='Tourisme', city='Saint-Laurent', is_partner=False, total_interns_hosted=9),
+    ]
+
+
+@pytest.mark.django_db
+class TestDirectorySnapshot:
+    """PartnerPageService.get_directory_snapshot"""
+
+    def test_computed_in_one_query(self, partners, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            snapshot = PartnerPageService.get_directory_snapshot()
+        with django_assert_num_queries(0):
+            PartnerPageService.get_partner_stats()
+            PartnerPageService.get_sectors_list()
+            PartnerPageService.get_cities_list()
+
+        assert snapshot['stats'] == {
+            'total_partners': 3,
+            'total_interns_hosted': 6,
+            'sectors_count': 2,
+            'average_rating': 4.0,
+            'cities_count': 2,
+            'top_sectors': [{'sector': 'BTP', 'count': 1}, {'sector': 'Informatique', 'count': 1}],
+        }
+        assert snapshot['sectors'] == ['BTP', 'Informatique']
+        assert snapshot['cities'] == ['Cayenne', 'Kourou']
+
+    def test_partner_field_change_invalidates(self, partners, django_capture_on_commit_callbacks):
+        etag = PartnerPageService.get_directory_etag()
+
+        company = CompanyProfile.objects.get(pk=partners[0].pk)
+        with django_capture_on_commit_callbacks(execute=True):
+            company.city = 'Matoury'
+            company.save()
+
+        assert PartnerPageService.get_directory_etag() != etag
+        assert PartnerPageService.get_cities_list() == ['Cayenne', 'Kourou', 'Matoury']
+
+    def test_becoming_partner_invalidates(self, partners, django_capture_on_commit_callbacks):
+        PartnerPageService.get_directory_snapshot()
+
+        company = CompanyProfile.objects.get(pk=partners[3].pk)
+        with django_capture_on_commit_callbacks(execute=True):
+            PartnerPageService.toggle_partner_status(company)
+
+        assert PartnerPageService.get_partner_stats()['total_partners'] == 4
+
+    def test_other_saves_keep_the_snapshot(self, partners, django_assert_num_queries):
+        PartnerPageService.get_directory_snapshot()
+
+        partner = CompanyProfile.objects.get(pk=partners[0].pk)
+        other = CompanyProfile.objects.get(pk=partners[3].pk)
+        partner.description = 'Nouvelle description'
+        partner.save()
+        other.city = 'Matoury'
+        other.save()
+        make_company(5, is_partner=False)
+
+        with django_assert_num_queries(0):
+            PartnerPageService.get_directory_snapshot()
+
+    def test_deleting_a_partner_invalidates(self, partners, django_capture_on_commit_callbacks):
+        PartnerPageService.get_directory_snapshot()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            partners[1].delete()
+
+        assert PartnerPageService.get_sectors_list() == ['Informatique']
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """ETag / Last-Modified on the public partner endpoints"""
+
+    def test_stats_revalidates_with_etag(self, partners):
+        client = APIClient()
+
+        response = client.get('/api/partners/stats/')
+        assert response.status_code == 200
+        assert response.data['total_partners'] == 3
+        assert 'must-revalidate' in response['Cache-Control']
+        etag = response['ETag']
+
+        response = client.get('/api/partners/stats/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+
+    def test_sectors_revalidates_with_last_modified(self, partners):
+        client = APIClient()
+
+        response = client.get('/api/partners/sectors/')
+        assert response.status_code == 200
+        assert response.data == {'sectors': ['BTP', 'Informatique'], 'cities': ['Cayenne', 'Kourou']}
+
+        response = client.get('/api/partners/sectors/', HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        assert response.status_code == 304
+
+    def test_change_breaks_the_etag(self, partners, django_capture_on_commit_callbacks):
+        client = APIClient()
+        etag = client.get('/api/partners/stats/')['ETag']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            make_company(6, sector='Santé')
+
+        response = client.get('/api/partners/stats/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.data['sectors_count'] == 3
@@ -0,0 +1,154 @@
+"""
+Tests for the incremental StudentProfile recommendation aggregates.
+"""
+from decimal import Decimal
+
+import pytest
+
+from apps.internships.models import Internship
+from apps.recommendations.models import InternRecommendation
+from apps.recommendations.tasks import reconcile_recommendation_stats
+from apps.users.models import CustomUser
+from apps.users.profile_models import CompanyProfile, StudentProfile
+from core.services.recommendation_service import RecommendationService
+
+
+@pytest.fixture
+def setup():
+    student_user = CustomUser.objects.create_user(
+        username='student', email='student@test.com', password='testpass123', user_type='student'
+    )
+    student = StudentProfile.objects.create(
+        user=student_user, school='Université', current_level='L3', field_of_study='Informatique', domain='Web'
+    )
+    company_user = CustomUser.objects.create_user(
+        username='company', email='company@test.com', password='testpass123', user_type='company'
+    )
+    company = CompanyProfile.objects.create(
+        user=company_user, company_name='Acme', siret='12345678901234', sector='Tech',
+        description='Acme', address='1 rue', city='Cayenne', postal_code='97300'
+    )
+    internships = [
+        Internship.objects.create(
+            title=f'Stage {index}', company=company_user, description='Stage', location='Cayenne', duration='6 mois'
+        )
+        for index in range(8)
+    ]
+    return student, company, internships
+
+
+def stats(student):
+    student = StudentProfile.objects.get(pk=student.pk)
+    return student.total_recommendations, student.recommendation_rating_sum, student.average_recommendation_rating
+
+
+@pytest.mark.django_db
+class TestIncrementalStats:
+    """StudentProfile.adjust_recommendation_stats through the signals"""
+
+    def test_create_recommendation_bumps_the_aggregates(self, setup):
+        student, company, internships = setup
+
+        for internship, rating in zip(internships, [5, 4, 4]):
+            RecommendationService.create_recommendation(
+                company, student, internship, {'rating': rating, 'comment': 'Très bien'}
+            )
+
+        assert stats(student) == (3, 13, Decimal('4.33'))
+
+    def test_rating_change_and_delete(self, setup):
+        student, company, internships = setup
+        first = InternRecommendation.objects.create(
+            company=company, student=student, internship=internships[0], rating=5, comment='Bien'
+        )
+        InternRecommendation.objects.create(
+            company=company, student=student, internship=internships[1], rating=3, comment='Bien'
+        )
+
+        first = InternRecommendation.objects.get(pk=first.pk)
+        first.rating = 1
+        first.save()
+        assert stats(student) == (2, 4, Decimal('2.00'))
+
+        first.delete()
+        assert stats(student) == (1, 3, Decimal('3.00'))
+
+    def test_partial_save_without_the_rating_keeps_the_aggregates(self, setup):
+        student, company, internships = setup
+        recommendation = InternRecommendation.objects.create(
+            company=company, student=student, internship=internships[0], rating=5, comment='Bien'
+        )
+
+        recommendation.rating = 1
+        recommendation.comment = 'Très bien'
+        recommendation.save(update_fields=['comment'])
+        assert stats(student) == (1, 5, Decimal('5.00'))
+
+        recommendation.save(update_fields=['rating'])
+        assert stats(student) == (1, 1, Decimal('1.00'))
+
+    def test_update_touches_only_the_aggregate_columns(self, setup, django_assert_num_queries):
+        student, _, _ = setup
+
+        with django_assert_num_queries(1) as captured:
+            StudentProfile.adjust_recommendation_stats(student.pk, 1, 5)
+
+        sql = captured.captured_queries[0]['sql']
+        assert sql.startswith('UPDATE')
+        assert 'total_recommendations' in sql
+        assert '"school"' not in sql
+
+    def test_stale_profile_save_of_edited_fields_keeps_the_aggregates(self, setup):
+        student, company, internships = setup
+        stale = StudentProfile.objects.get(pk=student.pk)
+        InternRecommendation.objects.create(
+            company=company, student=student, internship=internships[0], rating=5, comment='Bien'
+        )
+
+        stale.skills = 'Python'
+        stale.save(update_fields=['skills'])
+
+        assert stats(student) == (1, 5, Decimal('5.00'))
+        assert StudentProfile.objects.get(pk=student.pk).skills == 'Python'
+
+    def test_stale_full_save_is_repaired_by_reconciliation(self, setup):
+        student, company, internships = setup
+        stale = StudentProfile.objects.get(pk=student.pk)
+        InternRecommendation.objects.create(
+            company=company, student=student, internship=internships[0], rating=5, comment='Bien'
+        )
+
+        stale.save()
+        assert stats(student) == (0, 0, 0)
+
+        assert StudentProfile.reconcile_recommendation_stats() == 1
+        assert stats(student) == (1, 5, Decimal('5.00'))
+
+
+@pytest.mark.django_db
+class TestReconciliation:
+    """StudentProfile.reconcile_recommendation_stats"""
+
+    def test_drift_is_corrected(self, setup):
+        student, company, internships = setup
+        InternRecommendation.objects.create(
+            company=company, student=student, internship=internships[0], rating=4, comment='Bien'
+        )
+        # Bulk writes send no signals
+        InternRecommendation.objects.filter(student=student).update(rating=2)
+
+        assert reconcile_recommendation_stats() == 'Reconciled 1 student profiles'
+        assert stats(student) == (1, 2, Decimal('2.00'))
+        assert StudentProfile.reconcile_recommendation_stats() == 0
+
+    def test_average_is_rounded_like_the_incremental_updates(self, setup):
+        student, company, internships = setup
+        # 37 / 8 = 4.625: rounded half away from zero by both writers
+        for internship, rating in zip(internships, [5, 5, 5, 5, 5, 4, 4, 4]):
+            InternRecommendation.objects.create(
+                company=company, student=student, internship=internship, rating=rating, comment='Bien'
+            )
+
+        assert stats(student) == (8, 37, Decimal('4.63'))
+        assert StudentProfile.reconcile_recommendation_stats() == 0
+        assert stats(student) == (8, 37, Decimal('4.63'))
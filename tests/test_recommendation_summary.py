@@ -0,0 +1,121 @@
+"""
+Tests for the maintained RecommendationSummary and the recommended students leaderboard.
+"""
+from decimal import Decimal
+
+import pytest
+
+from apps.internships.models import Internship
+from apps.recommendations.models import InternRecommendation, RecommendationSummary
+from apps.users.models import CustomUser
+from apps.users.profile_models import CompanyProfile, StudentProfile
+from core.services.recommendation_service import RecommendationService
+
+
+def make_student(username):
+    user = CustomUser.objects.create_user(
+        username=username, email=f'{username}@test.com', password='testpass123', user_type='student'
+    )
+    return StudentProfile.objects.create(
+        user=user, school='Université', current_level='L3', field_of_study='Informatique', domain='Web'
+    )
+
+
+@pytest.fixture
+def company():
+    user = CustomUser.objects.create_user(
+        username='company', email='company@test.com', password='testpass123', user_type='company'
+    )
+    profile = CompanyProfile.objects.create(
+        user=user, company_name='Acme', siret='12345678901234', sector='Tech',
+        description='Acme', address='1 rue', city='Cayenne', postal_code='97300'
+    )
+    internships = [
+        Internship.objects.create(
+            title=f'Stage {index}', company=user, description='Stage', location='Cayenne', duration='6 mois'
+        )
+        for index in range(3)
+    ]
+    return profile, internships
+
+
+def recommend(company, student, internship, rating, domains=()):
+    return InternRecommendation.objects.create(
+        company=company, student=student, internship=internship,
+        rating=rating, comment='Très bien', recommended_domains=list(domains)
+    )
+
+
+@pytest.mark.django_db
+class TestRecommendationSummary:
+    """Recommended domains kept current by signals"""
+
+    def test_domains_follow_creates_updates_and_deletes(self, company):
+        profile, internships = company
+        student = make_student('alice')
+        first = recommend(profile, student, internships[0], 5, ['Web', 'Data'])
+        second = recommend(profile, student, internships[1], 4, ['Web'])
+
+        summary = RecommendationSummary.objects.get(student=student)
+        assert set(summary.domains.values_list('domain', flat=True)) == {'Web', 'Data'}
+
+        first.recommended_domains = ['Web']
+        first.save()
+        assert set(summary.domains.values_list('domain', flat=True)) == {'Web'}
+
+        first.delete()
+        second.delete()
+        assert not summary.domains.exists()
+
+    def test_deleting_the_student_cascades(self, company):
+        profile, internships = company
+        student = make_student('alice')
+        recommend(profile, student, internships[0], 5)
+
+        student.delete()
+
+        assert not RecommendationSummary.objects.exists()
+
+
+@pytest.mark.django_db
+class TestRecommendedStudents:
+    """RecommendationService.get_recommended_students reads the summaries"""
+
+    @pytest.fixture
+    def students(self, company):
+        profile, internships = company
+        alice, bob, carol = make_student('alice'), make_student('bob'), make_student('carol')
+        recommend(profile, alice, internships[0], 5, ['Web'])
+        recommend(profile, alice, internships[1], 3, ['Data'])
+        recommend(profile, bob, internships[0], 5, ['Web'])
+        make_student('dave')
+        return alice, bob, carol
+
+    def test_leaderboard_order_and_annotations(self, students):
+        alice, bob, _ = students
+
+        leaderboard = list(RecommendationService.get_recommended_students())
+
+        assert leaderboard == [alice, bob]
+        assert (leaderboard[0].recommendation_count, leaderboard[0].avg_rating) == (2, Decimal('4.00'))
+
+    def test_filters(self, students):
+        alice, bob, _ = students
+
+        assert list(RecommendationService.get_recommended_students({'min_rating': 4.5})) == [bob]
+        assert list(RecommendationService.get_recommended_students({'sector': 'Web'})) == [alice, bob]
+        assert list(RecommendationService.get_recommended_students({'sector': 'Data'})) == [alice]
+        assert list(RecommendationService.get_recommended_students({'min_recommendations': 2})) == [alice]
+
+    def test_no_aggregation_and_cached_ids(self, students, django_assert_num_queries):
+        filters = {'sector': 'Web', 'min_rating': 4}
+        with django_assert_num_queries(2) as captured:
+            list(RecommendationService.get_recommended_students(filters))
+
+        for query in captured.captured_queries:
+            assert 'GROUP BY' not in query['sql']
+            assert 'recommendations_internrecommendation' not in query['sql']
+
+        # The matching IDs come from the cache on the next call
+        with django_assert_num_queries(1):
+            list(RecommendationService.get_recommended_students(filters))
@@ -0,0 +1,140 @@
+"""
+Tests for the cached public catalog pages (core.response_cache).
+"""
+import pytest
+from django.urls import reverse
+
+from apps.services.models import ForumComment, ForumPost
+from apps.users.profile_models import CompanyProfile
+from core.response_cache import normalize_query
+
+
+@pytest.fixture
+def author(make_user):
+    return make_user('auteur')
+
+
+@pytest.fixture
+def post(author):
+    return ForumPost.objects.create(author=author, title='Logement à Kourou', content='Des pistes ?')
+
+
+def test_normalize_query():
+    from django.http import QueryDict
+
+    assert normalize_query(QueryDict('b=2&a=3&a=1&utm_source=mail&q=')) == 'a=1&a=3&b=2'
+
+
+@pytest.mark.django_db
+class TestAnonymousPages:
+
+    def test_second_visit_served_from_cache(self, client, post, django_assert_num_queries):
+        url = reverse('forum_list')
+        first = client.get(url, {'b': '2', 'a': '1'})
+        assert first.status_code == 200
+        assert 'Logement à Kourou' in first.content.decode()
+
+        # Same filters in another order, plus tracking params: same entry, no query
+        with django_assert_num_queries(0):
+            second = client.get(url, {'a': '1', 'b': '2', 'utm_source': 'newsletter'})
+        assert second.content == first.content
+        assert second['ETag'] == first['ETag']
+
+    def test_conditional_get(self, client, post):
+        url = reverse('forum_list')
+        response = client.get(url)
+        assert response['ETag']
+        assert 'Last-Modified' in response
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code == 304
+        assert client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']).status_code == 304
+
+    def test_write_purges_the_page(self, client, post, author):
+        url = reverse('forum_list')
+        etag = client.get(url)['ETag']
+
+        ForumPost.objects.create(author=author, title='Covoiturage Cayenne', content='Qui monte ?')
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert 'Covoiturage Cayenne' in response.content.decode()
+
+    def test_related_write_purges_the_page(self, client, post, author):
+        url = reverse('forum_list')
+        etag = client.get(url)['ETag']
+
+        ForumComment.objects.create(post=post, author=author, content='Voir le groupe Facebook')
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_varies_on_htmx(self, client, post):
+        response = client.get(reverse('forum_list'))
+
+        assert 'HX-Request' in response['Vary']
+
+
+@pytest.mark.django_db
+class TestLoggedInPages:
+
+    def test_page_rendered_per_user(self, make_user, client, post):
+        url = reverse('forum_list')
+        client.get(url)
+
+        client.force_login(make_user('lecteur'))
+        response = client.get(url)
+
+        assert response.status_code == 200
+        assert 'lecteur' in response.content.decode()
+        assert 'ETag' not in response
+
+    def test_catalog_fragment_shared_by_role(self, make_user, client, post):
+        url = reverse('forum_list')
+        client.force_login(make_user('premier'))
+        first = client.get(url)
+        assert first.context['fragment_cache_key'].startswith('student:')
+
+        # Another student gets the cached fragment (a change made without signals does not show)
+        client.force_login(make_user('second'))
+        ForumPost.objects.filter(pk=post.pk).update(title='Titre modifié sans signal')
+        response = client.get(url)
+        assert 'Logement à Kourou' in response.content.decode()
+
+        client.force_login(make_user('entreprise', user_type='company'))
+        response = client.get(url)
+        assert response.context['fragment_cache_key'].startswith('company:')
+        assert 'Titre modifié sans signal' in response.content.decode()
+
+
+@pytest.mark.django_db
+class TestPartnerCompaniesApi:
+
+    @pytest.fixture
+    def partner(self, make_user):
+        return CompanyProfile.objects.create(
+            user=make_user('acme', user_type='company'), company_name='Acme', siret='12345678901234',
+            sector='Informatique', description='Acme', address='1 rue du Port', city='Cayenne',
+            postal_code='97300', is_partner=True,
+        )
+
+    def test_cached_and_purged(self, client, partner, django_assert_num_queries):
+        url = '/api/partners/companies/'
+        first = client.get(url, HTTP_ACCEPT='application/json')
+        assert first.status_code == 200
+
+        with django_assert_num_queries(0):
+            second = client.get(url, HTTP_ACCEPT='application/json')
+        assert second.content == first.content
+        assert client.get(url, HTTP_ACCEPT='application/json', HTTP_IF_NONE_MATCH=first['ETag']).status_code == 304
+
+        partner.company_name = 'Acme Guyane'
+        partner.save()
+
+        assert b'Acme Guyane' in client.get(url, HTTP_ACCEPT='application/json').content
+
+    def test_authenticated_api_calls_bypass_the_cache(self, client, partner):
+        url = '/api/partners/companies/'
+        client.get(url, HTTP_ACCEPT='application/json')
+
+        response = client.get(url, HTTP_ACCEPT='application/json', HTTP_AUTHORIZATION='Bearer invalid')
+
+        assert 'ETag' not in response
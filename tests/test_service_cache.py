@@ -0,0 +1,252 @@
+"""
+Tests for core.cache.cached_service_call, on locmem and on fakeredis.
+"""
+from datetime import timedelta
+
+import pytest
+from django.core.cache import caches
+from django.db import transaction
+from django.test import override_settings
+from django.utils import timezone
+
+from apps.calendars.models import InternshipCalendar
+from apps.users.models import CustomUser
+from apps.users.profile_models import SchoolProfile
+from core.cache import LOCK_KEY, cached_service_call, invalidate_tags
+from core.services.calendar_service import InternshipCalendarService
+
+
+def redis_caches():
+    fakeredis = pytest.importorskip('fakeredis')
+    # One server per test: nothing leaks between tests
+    server = fakeredis.FakeServer()
+    return {
+        alias: {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': 'redis://localhost:6379/1',
+            'KEY_PREFIX': alias,
+            'OPTIONS': {'connection_class': fakeredis.FakeConnection, 'server': server},
+        }
+        for alias in ('default', 'aggregates')
+    }
+
+
+def locmem_caches():
+    return {
+        alias: {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': f'test-{alias}'}
+        for alias in ('default', 'aggregates')
+    }
+
+
+@pytest.fixture(params=['locmem', 'fakeredis'], autouse=True)
+def backend(request):
+    config = locmem_caches() if request.param == 'locmem' else redis_caches()
+    with override_settings(CACHES=config):
+        caches['aggregates'].clear()
+        yield request.param
+
+
+class Counter:
+    """A service function counting its calls"""
+
+    def __init__(self, **options):
+        self.calls = []
+        self.function = cached_service_call(**options)(self.compute)
+
+    def compute(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return {'args': list(args), 'calls': len(self.calls)}
+
+
+class TestCachedServiceCall:
+
+    def test_caches_per_arguments(self):
+        counter = Counter(timeout=60)
+
+        assert counter.function(1, sector='Web') == {'args': [1], 'calls': 1}
+        assert counter.function(1, sector='Web') == {'args': [1], 'calls': 1}
+        assert counter.function(2, sector='Web') == {'args': [2], 'calls': 2}
+        assert counter.function({'b': 1, 'a': 2}) == counter.function({'a': 2, 'b': 1})
+        assert len(counter.calls) == 3
+
+    def test_none_is_cached(self):
+        calls = []
+
+        @cached_service_call(timeout=60)
+        def lookup():
+            calls.append(1)
+
+        assert lookup() is None
+        assert lookup() is None
+        assert len(calls) == 1
+
+    def test_invalidate_tags(self):
+        tagged = Counter(timeout=60, tags=('partners',))
+        other = Counter(timeout=60, tags=('calendars',))
+        tagged.function()
+        other.function()
+
+        invalidate_tags('partners')
+
+        assert tagged.function()['calls'] == 2
+        assert other.function()['calls'] == 1
+
+    def test_tags_from_arguments(self):
+        counter = Counter(timeout=60, tags=lambda school_id: [f'school-{school_id}'])
+        counter.function(1)
+        counter.function(2)
+
+        invalidate_tags('school-1')
+
+        counter.function(1)
+        counter.function(2)
+        assert [args for args, kwargs in counter.calls] == [(1,), (2,), (1,)]
+
+    def test_evicted_tag_does_not_revive_old_entries(self):
+        counter = Counter(timeout=60, tags=('partners',))
+        counter.function()
+        invalidate_tags('partners')
+        counter.function()
+
+        caches['aggregates'].delete('svc-tag:partners')
+
+        assert counter.function()['calls'] == 3
+
+    def test_invalidate_single_entry(self):
+        counter = Counter(timeout=60)
+        counter.function(1)
+        counter.function(2)
+
+        counter.function.invalidate(1)
+
+        counter.function(1)
+        counter.function(2)
+        assert len(counter.calls) == 3
+
+    def test_version_separates_entries(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        first = cached_service_call(timeout=60, version=1)(compute)
+        second = cached_service_call(timeout=60, version=2)(compute)
+
+        assert first() == 1
+        assert second() == 2
+        assert first() == 1
+
+    @pytest.mark.django_db(transaction=True)
+    def test_invalidated_again_on_commit(self):
+        counter = Counter(timeout=60, tags=('partners',))
+        counter.function()
+
+        with transaction.atomic():
+            invalidate_tags('partners')
+            # Recomputed from data another process cannot see yet
+            counter.function()
+
+        assert counter.function()['calls'] == 3
+
+    def test_timeout_from_settings(self):
+        counter = Counter(timeout='SERVICE_TEST_TIMEOUT')
+
+        with override_settings(SERVICE_TEST_TIMEOUT=60):
+            counter.function()
+            entry = caches['aggregates'].get(counter.function.cache_key())
+
+        assert entry[2] == pytest.approx(timezone.now().timestamp() + 60, abs=5)
+
+
+class TestStampedeProtection:
+
+    def test_miss_waits_for_the_lock_holder(self, monkeypatch):
+        counter = Counter(timeout=60)
+        cache = caches['aggregates']
+        key = counter.function.cache_key()
+        cache.add(LOCK_KEY.format(key=key), True, 30)
+
+        def sleep(seconds):
+            # The other caller finishes while we wait
+            cache.set(key, ('from the lock holder', 0.1, None), 60)
+
+        monkeypatch.setattr('core.cache.time.sleep', sleep)
+
+        assert counter.function() == 'from the lock holder'
+        assert counter.calls == []
+
+    @override_settings(SERVICE_CACHE_LOCK_WAIT=0.1)
+    def test_miss_computes_after_waiting_too_long(self, monkeypatch):
+        counter = Counter(timeout=60)
+        cache = caches['aggregates']
+        cache.add(LOCK_KEY.format(key=counter.function.cache_key()), True, 30)
+        monkeypatch.setattr('core.cache.LOCK_POLL_INTERVAL', 0.02)
+
+        assert counter.function()['calls'] == 1
+
+    def test_early_refresh_near_expiry(self):
+        counter = Counter(timeout=60, beta=1.0)
+        cache = caches['aggregates']
+        key = counter.function.cache_key()
+        # Very slow to compute and expiring in 1 s: refreshed early for sure
+        cache.set(key, ('stale', 10 ** 6, timezone.now().timestamp() + 1), 60)
+
+        assert counter.function()['calls'] == 1
+        assert cache.get(LOCK_KEY.format(key=key)) is None
+
+    def test_early_refresh_left_to_the_lock_holder(self):
+        counter = Counter(timeout=60, beta=1.0)
+        cache = caches['aggregates']
+        key = counter.function.cache_key()
+        cache.set(key, ('stale', 10 ** 6, timezone.now().timestamp() + 1), 60)
+        cache.add(LOCK_KEY.format(key=key), True, 30)
+
+        assert counter.function() == 'stale'
+        assert counter.calls == []
+
+    def test_no_early_refresh_when_disabled(self):
+        counter = Counter(timeout=60, beta=0)
+        cache = caches['aggregates']
+        cache.set(counter.function.cache_key(), ('fresh', 10 ** 6, timezone.now().timestamp() + 1), 60)
+
+        assert counter.function() == 'fresh'
+
+
+@pytest.mark.django_db
+class TestUpcomingCalendarsCache:
+    """InternshipCalendarService.get_upcoming_calendars"""
+
+    @pytest.fixture
+    def school(self):
+        user = CustomUser.objects.create_user(
+            username='school', email='school@test.com', password='testpass123', user_type='school'
+        )
+        return SchoolProfile.objects.create(
+            user=user, institution_name='Université de Guyane', institution_type='UNIVERSITY',
+            address='Campus de Troubiran', city='Cayenne', postal_code='97300',
+            phone='0594000000', email='contact@univ-guyane.fr',
+        )
+
+    def make_calendar(self, school, days_ahead):
+        start = timezone.now().date() + timedelta(days=days_ahead)
+        return InternshipCalendar.objects.create(
+            school=school, program_name=f'L3 AES +{days_ahead}', program_level='Licence 3',
+            start_date=start, end_date=start + timedelta(days=60), number_of_students=25,
+            is_published=True, is_visible_to_companies=True,
+        )
+
+    def test_ids_cached_and_invalidated_on_save(self, school, django_assert_num_queries):
+        first = self.make_calendar(school, 40)
+        self.make_calendar(school, 400)
+
+        assert list(InternshipCalendarService.get_upcoming_calendars()) == [first]
+        with django_assert_num_queries(1):
+            list(InternshipCalendarService.get_upcoming_calendars())
+
+        second = self.make_calendar(school, 10)
+        assert list(InternshipCalendarService.get_upcoming_calendars()) == [second, first]
+
+        first.is_published = False
+        first.save()
+        assert list(InternshipCalendarService.get_upcoming_calendars()) == [second]
@@ -0,0 +1,109 @@
+"""
+Tests for the materialized status counts behind the admin review badges.
+"""
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from apps.dashboard.models import StatusCount
+from apps.dashboard.tasks import reconcile_status_counts
+from apps.users.models import CustomUser
+from apps.users.models_documents import UserDocument
+from core.services.document_review_service import DocumentReviewService
+
+
+def make_document(user, document_type='id_card', **kwargs):
+    return UserDocument.objects.create(
+        user=user,
+        document_type=document_type,
+        title='CNI',
+        file=SimpleUploadedFile('id.pdf', b'content', content_type='application/pdf'),
+        **kwargs
+    )
+
+
+def document_counts():
+    return StatusCount.counts(StatusCount.DOCUMENT)
+
+
+@pytest.mark.django_db
+class TestStatusCounts:
+    """StatusCount kept current by signals"""
+
+    def test_documents_follow_their_lifecycle(self, make_user):
+        driver = make_user('driver', 'driver')
+        admin = make_user('admin', 'admin', is_staff=True)
+        first = make_document(driver)
+        second = make_document(driver)
+        assert document_counts() == {'pending': 2}
+
+        first.approve(verified_by=admin)
+        second.reject(verified_by=admin, reason='Illisible')
+        assert document_counts() == {'pending': 0, 'approved': 1, 'rejected': 1}
+
+        UserDocument.objects.get(pk=second.pk).delete()
+        assert document_counts()['rejected'] == 0
+        assert StatusCount.objects.get(entity='document', status='approved').user_type == 'driver'
+
+    def test_users_follow_verification_status(self, make_user):
+        make_user('student', 'student')
+        company = make_user('company', 'company')
+
+        company.verification_status = 'verified'
+        company.save()
+        reloaded = CustomUser.objects.get(pk=company.pk)
+        reloaded.verification_status = 'suspended'
+        reloaded.save(update_fields=['verification_status'])
+
+        counts = StatusCount.counts(StatusCount.USER, exclude_user_types=['student', 'admin'])
+        assert counts == {'pending': 0, 'verified': 0, 'suspended': 1}
+        assert StatusCount.counts(StatusCount.USER)['pending'] == 1
+
+    def test_instances_of_bulk_review_save_without_moving_twice(self, make_user):
+        admin = make_user('admin', 'admin', is_staff=True)
+        company = make_user('company', 'company')
+        documents = [make_document(company, document_type=kind) for kind in ('kbis_siret', 'representative_id')]
+
+        result = DocumentReviewService.review([d.pk for d in documents], admin, DocumentReviewService.APPROVE)
+        for document in result['documents']:
+            document.save()
+        for user in result['verified']:
+            user.save()
+
+        assert document_counts() == {'pending': 0, 'approved': 2}
+        assert StatusCount.reconcile() == 0
+
+    def test_partial_save_without_the_status_keeps_the_counts(self, make_user):
+        driver = make_user('driver', 'driver')
+        document = make_document(driver)
+
+        document.status = 'approved'
+        document.save(update_fields=['title'])
+
+        assert document_counts() == {'pending': 1}
+        assert StatusCount.reconcile() == 0
+
+    def test_reconcile_absorbs_bulk_updates(self, make_user):
+        driver = make_user('driver', 'driver')
+        for _ in range(3):
+            make_document(driver)
+        UserDocument.objects.update(status='approved')
+        assert document_counts() == {'pending': 3}
+
+        assert reconcile_status_counts() == 'Reconciled 2 status counts'
+        assert document_counts() == {'pending': 0, 'approved': 3}
+        assert StatusCount.reconcile() == 0
+
+
+@pytest.mark.django_db
+def test_review_screens_read_badges_from_table(make_user, client):
+    admin = make_user('admin', 'admin', is_staff=True)
+    driver = make_user('driver', 'driver')
+    make_document(driver)
+    make_document(driver, status='approved')
+    client.force_login(admin)
+
+    response = client.get('/dashboard/admin/documents/')
+    assert (response.context['pending_count'], response.context['approved_count'], response.context['total_count']) == (1, 1, 2)
+
+    response = client.get('/dashboard/admin/verifications/')
+    assert response.context['pending_count'] == 1
@@ -0,0 +1,105 @@
+"""
+Tests for the StudentProfile dirty-field check dispatching evolution updates.
+"""
+import pytest
+
+from apps.tracking.models import EvolutionEvent, StudentEvolutionTracking
+from apps.users.profile_models import StudentProfile
+from core.services.evolution_service import StudentEvolutionService
+
+
+@pytest.fixture
+def profile(make_user):
+    student = make_user('student', 'student')
+    StudentProfile.objects.create(
+        user=student, school='Université', current_level='BEGINNER',
+        field_of_study='Informatique', domain='Web', status='AVAILABLE'
+    )
+    for index in range(3):
+        StudentEvolutionTracking.objects.create(
+            company=make_user(f'company{index}', 'company'),
+            student=student,
+            current_level='BEGINNER',
+            domain='Web',
+            status='AVAILABLE',
+        )
+    return StudentProfile.objects.get(user=student)
+
+
+@pytest.mark.django_db
+class TestProfileChangeDispatch:
+    """update_student_evolution_on_profile_change"""
+
+    def test_untracked_change_costs_only_the_update(self, profile, django_assert_num_queries,
+                                                    django_capture_on_commit_callbacks):
+        profile.skills = 'Python, Django'
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            with django_assert_num_queries(1):
+                profile.save()
+
+        assert callbacks == []
+
+    def test_internship_search_change_is_not_dispatched(self, profile, django_capture_on_commit_callbacks):
+        profile.looking_for_internship = False
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            profile.save()
+
+        assert callbacks == []
+
+    def test_update_fields_without_tracked_fields_is_skipped(self, profile, django_capture_on_commit_callbacks):
+        profile.status = 'EMPLOYED'
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            profile.save(update_fields=['skills'])
+
+        assert callbacks == []
+
+    def test_tracked_change_updates_every_tracking(self, profile, django_capture_on_commit_callbacks):
+        profile.status = 'EMPLOYED'
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            profile.save()
+
+        assert len(callbacks) == 1
+        trackings = StudentEvolutionTracking.objects.filter(student=profile.user)
+        assert {tracking.status for tracking in trackings} == {'EMPLOYED'}
+        assert all(len(tracking.evolution_history) == 1 for tracking in trackings)
+
+
+@pytest.mark.django_db
+class TestUpdateStudentEvolution:
+    """StudentEvolutionService.update_student_evolution bulk path"""
+
+    def test_one_insert_and_one_update(self, profile, django_assert_num_queries):
+        student = profile.user
+
+        # SELECT trackings, SAVEPOINT, INSERT events, UPDATE trackings, RELEASE
+        with django_assert_num_queries(5):
+            updated = StudentEvolutionService.update_student_evolution(student, new_level='ADVANCED')
+
+        assert len(updated) == 3
+        assert set(StudentEvolutionTracking.objects.values_list('current_level', flat=True)) == {'ADVANCED'}
+
+    def test_events_are_appended_and_linked(self, profile):
+        student = profile.user
+
+        StudentEvolutionService.update_student_evolution(student, new_level='ADVANCED')
+        StudentEvolutionService.update_student_evolution(student, new_status='EMPLOYED')
+
+        assert EvolutionEvent.objects.filter(student=student).count() == 6
+        tracking = StudentEvolutionTracking.objects.filter(student=student).first()
+        assert tracking.last_event.changes == ['Statut: Disponible → EMPLOYED']
+        assert [entry['changes'] for entry in tracking.evolution_history] == [
+            ['Niveau: BEGINNER → ADVANCED'],
+            ['Statut: Disponible → EMPLOYED'],
+        ]
+
+    def test_unchanged_values_write_nothing(self, profile, django_assert_num_queries):
+        student = profile.user
+
+        with django_assert_num_queries(1):
+            updated = StudentEvolutionService.update_student_evolution(student, new_level='BEGINNER')
+
+        assert updated == []
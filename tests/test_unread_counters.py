@@ -0,0 +1,119 @@
+"""
+Tests for the denormalized per-user unread counters.
+"""
+import pytest
+from django.core.cache import caches
+from django.core.management import call_command
+
+from apps.messaging.models import Conversation, Message
+from apps.notifications.models import Notification, UnreadCounter
+
+
+def notify(user, title='Info'):
+    return Notification.create_notification(
+        recipient=user,
+        notification_type=Notification.SYSTEM,
+        title=title,
+        message='Message'
+    )
+
+
+@pytest.fixture
+def conversation(make_user):
+    student = make_user('student')
+    company = make_user('company', 'company')
+    conversation = Conversation.objects.create()
+    conversation.participants.add(student, company)
+    return conversation, student, company
+
+
+@pytest.mark.django_db
+class TestNotificationCounter:
+    """Unread notification counter"""
+
+    def test_first_read_builds_counter_from_source(self, make_user):
+        user = make_user('alice')
+        notify(user)
+        notify(user)
+        assert not UnreadCounter.objects.filter(user=user).exists()
+
+        assert UnreadCounter.get_counts(user)['notifications'] == 2
+        assert UnreadCounter.objects.get(user=user).notifications == 2
+
+    def test_counts_are_mirrored_in_the_hot_cache(self, make_user):
+        user = make_user('alice')
+        counts = UnreadCounter.get_counts(user)
+
+        assert caches['hot'].get(UnreadCounter.cache_key(user.pk)) == counts
+        notify(user)
+        assert caches['hot'].get(UnreadCounter.cache_key(user.pk)) is None
+
+    def test_create_and_mark_read(self, make_user):
+        user = make_user('alice')
+        UnreadCounter.get_counts(user)
+
+        first = notify(user)
+        notify(user)
+        assert UnreadCounter.objects.get(user=user).notifications == 2
+
+        first.mark_as_read()
+        first.mark_as_read()
+        assert UnreadCounter.objects.get(user=user).notifications == 1
+
+    def test_badge_endpoint_uses_counter(self, make_user, client):
+        user = make_user('alice')
+        client.force_login(user)
+        notify(user)
+
+        assert client.get('/notifications/count/').json() == {'count': 1}
+        client.post('/notifications/mark-all-read/')
+        assert client.get('/notifications/count/').json() == {'count': 0}
+
+    def test_delete_unread(self, make_user, client):
+        user = make_user('alice')
+        client.force_login(user)
+        UnreadCounter.get_counts(user)
+        notification = notify(user)
+
+        client.post(f'/notifications/{notification.pk}/delete/')
+        assert UnreadCounter.objects.get(user=user).notifications == 0
+
+
+@pytest.mark.django_db
+class TestMessageCounter:
+    """Unread message counter"""
+
+    def test_new_message_counts_for_recipient_only(self, conversation):
+        conversation, student, company = conversation
+        UnreadCounter.get_counts(student)
+        UnreadCounter.get_counts(company)
+
+        Message.objects.create(conversation=conversation, sender=student, content='Bonjour')
+
+        assert UnreadCounter.objects.get(user=company).messages == 1
+        assert UnreadCounter.objects.get(user=student).messages == 0
+
+    def test_opening_conversation_clears_counter(self, client, conversation):
+        conversation, student, company = conversation
+        UnreadCounter.get_counts(company)
+        Message.objects.create(conversation=conversation, sender=student, content='Bonjour')
+        Message.objects.create(conversation=conversation, sender=student, content='Encore')
+
+        client.force_login(company)
+        assert client.get('/messaging/unread-count/').json() == {'count': 2}
+        client.get(f'/messaging/{conversation.pk}/')
+        assert client.get('/messaging/unread-count/').json() == {'count': 0}
+
+
+@pytest.mark.django_db
+def test_reconcile_command_fixes_drift(conversation):
+    conversation, student, company = conversation
+    notify(student)
+    Message.objects.create(conversation=conversation, sender=company, content='Bonjour')
+    UnreadCounter.objects.update_or_create(user=student, defaults={'notifications': 7, 'messages': 0})
+
+    call_command('reconcile_unread_counters', batch_size=1)
+
+    counter = UnreadCounter.objects.get(user=student)
+    assert (counter.notifications, counter.messages) == (1, 1)
+    assert UnreadCounter.objects.get(user=company).messages == 0